@@ -1,6 +1,9 @@
 __author__ = "Sam Ireland"
 __version__ = "0.4.1"
 
-from .vectors import Vector
-from .matrices import Matrix
+from .vectors import Vector, VectorArray
+from .matrices import Matrix, CondensedMatrix
 from .geometry import *
+from .quaternions import Quaternion
+from .spatial import KDTree, find_pairs_within, find_contacts
+from .spatial import distance_matrix, cdist
@@ -1,8 +1,28 @@
 """Contains functions for manipulating Euclidian vectors."""
 
-from math import cos, sin, radians
-from .vectors import Vector
-from .matrices import Matrix
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from math import cos, sin, sqrt, radians
+from operator import mul
+from .vectors import Vector, VectorArray
+from .matrices import Matrix, CondensedMatrix, _jacobi_eigen, _share, _unshare
+from .matrices import _POOL_INITIALIZERS
+
+__all__ = [
+ "round_vectors", "allow_degrees", "Transform", "rotation_cache_info",
+ "clear_rotation_cache", "set_rotation_cache_size", "translate_vectors",
+ "rotate_2d_vectors", "rotate_3d_vectors", "rotate_vectors_about_axis",
+ "align_vectors_to_plane", "superimpose", "rmsd_matrix"
+]
+
+ROTATION_CACHE_SIZE = 256
+"""The number of rotation matrices kept by the least-recently-used cache of
+rotation matrices. Change it with :py:func:`set_rotation_cache_size`."""
+
+_rotation_cache = OrderedDict()
+_rotation_cache_stats = {"hits": 0, "misses": 0}
+
+_worker_sets = None
 
 def round_vectors(func):
     """This decorator takes a function which handles vectors, and makes it round
@@ -10,15 +30,28 @@ def round_vectors(func):
 
     def new(*args, trim=None, **kwargs):
         result = func(*args, **kwargs)
-        if trim:
-            for arg in args:
-                if isinstance(arg, Vector):
-                    arg._values = [round(val, trim) for val in arg._values]
+        _trim(args, trim)
         return result
     new.__doc__, new.__name__ = func.__doc__, func.__name__
     return new
 
 
+def _trim(vectors, trim):
+    """Rounds the values of any Vectors or VectorArrays among some objects,
+    changing them in place. Anything else is ignored.
+
+    :param vectors: The objects to round.
+    :param int trim: The number of decimal places - if ``None`` or 0, nothing\
+    is rounded."""
+
+    if not trim: return
+    for vector in vectors:
+        if isinstance(vector, (Vector, VectorArray)):
+            values = vector._values
+            for n, val in enumerate(values):
+                values[n] = round(val, trim)
+
+
 def allow_degrees(func):
     """This decorator takes a function which takes an angle, and makes it able
     to take it in degrees as well as in radians. The angle argument should be
@@ -31,6 +64,375 @@ def allow_degrees(func):
     return new
 
 
+class Transform:
+    """A Transform is an affine transformation of space - any combination of
+    translations, rotations and scalings. It is stored as a single homogeneous
+    :py:class:`.Matrix` (3×3 for two dimensional space and 4×4 for three
+    dimensional space), so a chain of any number of operations can be applied
+    to vectors in one pass over them.
+
+    Transforms are built up by chaining methods, each of which returns a new
+    Transform that performs the original transformation and then the new
+    operation:
+
+        >>> transform = Transform(3).translate(1, 2, 3).rotate(0.5, 2).scale(2)
+        >>> transform.apply(vector1, vector2)
+
+    Two Transforms can be combined with ``@``, where ``t2 @ t1`` performs
+    ``t1`` and then ``t2``.
+
+    Rotations are only possible in two or three dimensional space, but the
+    other operations can be used in any number of dimensions.
+
+    :param int dimension: the dimension of the space being transformed.
+    :raises ValueError: if the dimension is not a positive integer."""
+
+    def __init__(self, dimension=3):
+        if not isinstance(dimension, int) or dimension < 1:
+            raise ValueError("{} is not a valid dimension".format(dimension))
+        self._dimension = dimension
+        self._matrix = Matrix.identity(dimension + 1)
+
+
+    def __repr__(self):
+        return "<{}D Transform>".format(self._dimension)
+
+
+    def __matmul__(self, other):
+        if not isinstance(other, Transform):
+            raise TypeError("{} is not a Transform".format(other))
+        if other._dimension != self._dimension:
+            raise ValueError("{} is a different dimension".format(other))
+        return self._with_matrix(self._matrix @ other._matrix)
+
+
+    def _with_matrix(self, matrix):
+        """Creates a new Transform of the same dimension with a given
+        homogeneous matrix.
+
+        :param Matrix matrix: the new matrix.
+        :rtype: ``Transform``"""
+
+        transform = Transform.__new__(Transform)
+        transform._dimension, transform._matrix = self._dimension, matrix
+        return transform
+
+
+    def _then(self, linear, offset):
+        """Creates a new Transform which performs this one and then a further
+        operation, given as a linear part and a translation.
+
+        :param list linear: the rows of the operation's linear part.
+        :param list offset: the operation's translation.
+        :rtype: ``Transform``"""
+
+        return self._compose(_homogeneous(linear, offset))
+
+
+    def _compose(self, matrix):
+        """Creates a new Transform which performs this one and then a further
+        operation, given as a homogeneous matrix. If this Transform does
+        nothing, the matrix is used as it is rather than multiplied.
+
+        :param Matrix matrix: the operation's homogeneous matrix.
+        :rtype: ``Transform``"""
+
+        if self._matrix == Matrix.identity(self._dimension + 1):
+            return self._with_matrix(
+             Matrix._view(matrix._values, matrix._shape, matrix._strides)
+            )
+        return self._with_matrix(matrix @ self._matrix)
+
+
+    def dimension(self):
+        """Returns the dimension of the space the Transform acts on.
+
+        :rtype: ``int``"""
+
+        return self._dimension
+
+
+    def matrix(self):
+        """Returns the homogeneous Matrix of the Transform.
+
+        :rtype: ``Matrix``"""
+
+        return self._matrix
+
+
+    def translate(self, *translation):
+        """Returns a new Transform which performs this one and then a
+        translation.
+
+        :param \*translation: The translation values.
+        :raises ValueError: if the wrong number of values is given.
+        :rtype: ``Transform``"""
+
+        if len(translation) != self._dimension:
+            raise ValueError("{} is not {}D".format(translation, self._dimension))
+        return self._then(Matrix.identity(self._dimension).rows(), translation)
+
+
+    def rotate(self, angle, axis=None, degrees=False):
+        """Returns a new Transform which performs this one and then a rotation
+        about the origin. Three dimensional rotations are about the x, y or z
+        axis, or about any axis given as a vector.
+
+        :param float angle: The angle in radians.
+        :param axis: 0, 1, or 2, depending on which axis to rotate around, or\
+        a 3D vector pointing along the axis (three dimensional Transforms only).
+        :param bool degrees: if ``True``, the angle given will be interpreted\
+        as being in degrees, not radians.
+        :raises ValueError: if the Transform is not 2D or 3D.
+        :raises ValueError: if the axis is not valid.
+        :rtype: ``Transform``"""
+
+        if degrees: angle = radians(angle)
+        if self._dimension not in (2, 3):
+            raise ValueError("Cannot rotate in {}D".format(self._dimension))
+        return self._compose(_rotation_matrix(self._dimension, angle, axis))
+
+
+    def scale(self, *factors):
+        """Returns a new Transform which performs this one and then a scaling
+        about the origin. A single factor scales every axis equally, otherwise
+        one factor per axis is needed.
+
+        :param \*factors: The scale factors.
+        :raises ValueError: if the wrong number of factors is given.
+        :rtype: ``Transform``"""
+
+        if len(factors) == 1: factors *= self._dimension
+        if len(factors) != self._dimension:
+            raise ValueError("{} is not {}D".format(factors, self._dimension))
+        return self._then([[
+         factor if i == j else 0 for j in range(self._dimension)
+        ] for i, factor in enumerate(factors)], [0] * self._dimension)
+
+
+    def apply(self, *vectors):
+        """Applies the Transform to some vectors, changing them in place. Each
+        vector is read and updated once, however many operations make up the
+        Transform, and the new values are written straight into the vectors'
+        existing storage - no new lists or arrays are made.
+
+        :param \*vectors: The vectors to transform - either Vectors or\
+        VectorArrays.
+        :raises TypeError: if non-vectors are given.
+        :raises ValueError: if the vectors are the wrong dimension."""
+
+        dimension = self._dimension
+        for v in vectors:
+            if not isinstance(v, (Vector, VectorArray)):
+                raise TypeError("Cannot transform {} - not a vector".format(v))
+            if (v._dimension if isinstance(v, VectorArray)
+             else len(v._values)) != dimension:
+                raise ValueError("Cannot transform {} - not {}D".format(
+                 v, dimension
+                ))
+        rows = self._matrix._row_tuples()[:dimension]
+        linear = [row[:dimension] for row in rows]
+        offset = [row[dimension] for row in rows]
+        buffers = [vector._values for vector in vectors]
+        if linear == Matrix.identity(dimension)._row_tuples():
+            _translate_in_place(buffers, offset)
+        else:
+            _transform_in_place(buffers, linear, offset)
+
+
+def _translate_in_place(buffers, offset):
+    """Translates the vectors held in some flat buffers of values, overwriting
+    the values where they are rather than building new storage.
+
+    :param list buffers: the buffers, each holding one or more vectors.
+    :param list offset: the translation."""
+
+    dimension = len(offset)
+    if dimension == 3:
+        x0, y0, z0 = offset
+        for values in buffers:
+            for n in range(0, len(values), 3):
+                values[n] += x0
+                values[n + 1] += y0
+                values[n + 2] += z0
+    else:
+        for values in buffers:
+            for n in range(0, len(values), dimension):
+                for m, d in enumerate(offset):
+                    values[n + m] += d
+
+
+def _transform_in_place(buffers, linear, offset):
+    """Applies an affine transformation to the vectors held in some flat
+    buffers of values, overwriting the values where they are rather than
+    building new storage. Two and three dimensional vectors have their own
+    unrolled loops, which need no temporary objects at all.
+
+    :param list buffers: the buffers, each holding one or more vectors.
+    :param list linear: the rows of the linear part.
+    :param list offset: the translation part."""
+
+    dimension = len(offset)
+    if dimension == 3:
+        (a, b, c), (d, e, f), (g, h, i) = linear
+        x0, y0, z0 = offset
+        for values in buffers:
+            for n in range(0, len(values), 3):
+                x, y, z = values[n], values[n + 1], values[n + 2]
+                values[n] = a * x + b * y + c * z + x0
+                values[n + 1] = d * x + e * y + f * z + y0
+                values[n + 2] = g * x + h * y + i * z + z0
+    elif dimension == 2:
+        (a, b), (c, d) = linear
+        x0, y0 = offset
+        for values in buffers:
+            for n in range(0, len(values), 2):
+                x, y = values[n], values[n + 1]
+                values[n] = a * x + b * y + x0
+                values[n + 1] = c * x + d * y + y0
+    else:
+        for values in buffers:
+            for n in range(0, len(values), dimension):
+                old = tuple(values[n:n + dimension])
+                for m, (row, d) in enumerate(zip(linear, offset)):
+                    values[n + m] = sum(map(mul, row, old)) + d
+
+
+def _homogeneous(linear, offset):
+    """Builds the homogeneous matrix of an affine operation.
+
+    :param list linear: the rows of the operation's linear part.
+    :param list offset: the operation's translation.
+    :rtype: ``Matrix``"""
+
+    return Matrix(*[
+     list(row) + [d] for row, d in zip(linear, offset)
+    ], [0] * len(offset) + [1])
+
+
+def _rotation_matrix(dimension, angle, axis):
+    """Returns the homogeneous matrix of a rotation about the origin, taking it
+    from the rotation cache if it has been made recently. The cache holds up to
+    :py:data:`ROTATION_CACHE_SIZE` matrices, discarding the least recently used
+    when full. The returned Matrix is shared, so must not be changed.
+
+    :param int dimension: 2 or 3.
+    :param float angle: The angle in radians.
+    :param axis: the axis number or axis vector of a 3D rotation.
+    :raises ValueError: if the axis is not valid.
+    :rtype: ``Matrix``"""
+
+    try:
+        key = (dimension, angle, axis if axis is None or isinstance(axis, int)
+         else tuple(axis))
+        matrix = _rotation_cache.get(key)
+    except TypeError:
+        key, matrix = None, None
+    if matrix is not None:
+        _rotation_cache_stats["hits"] += 1
+        _rotation_cache.move_to_end(key)
+        return matrix
+    _rotation_cache_stats["misses"] += 1
+    c, s = cos(angle), sin(angle)
+    if dimension == 2:
+        linear = [[c, -s], [s, c]]
+    elif axis == 0:
+        linear = [[1, 0, 0], [0, c, -s], [0, s, c]]
+    elif axis == 1:
+        linear = [[c, 0, s], [0, 1, 0], [-s, 0, c]]
+    elif axis == 2:
+        linear = [[c, -s, 0], [s, c, 0], [0, 0, 1]]
+    else:
+        linear = _axis_rotation(c, s, axis)
+    matrix = _homogeneous(linear, [0] * dimension)
+    if key is not None and ROTATION_CACHE_SIZE > 0:
+        _rotation_cache[key] = matrix
+        while len(_rotation_cache) > ROTATION_CACHE_SIZE:
+            _rotation_cache.popitem(last=False)
+    return matrix
+
+
+def rotation_cache_info():
+    """Returns statistics about the cache of rotation matrices - the number of
+    ``hits`` (rotations whose matrix was already cached), the number of
+    ``misses``, the number of matrices currently cached (``size``) and the
+    most it will hold (``maxsize``).
+
+    :rtype: ``dict``"""
+
+    return {
+     "hits": _rotation_cache_stats["hits"],
+     "misses": _rotation_cache_stats["misses"],
+     "size": len(_rotation_cache), "maxsize": ROTATION_CACHE_SIZE
+    }
+
+
+def clear_rotation_cache():
+    """Empties the cache of rotation matrices and resets its statistics."""
+
+    _rotation_cache.clear()
+    _rotation_cache_stats["hits"] = _rotation_cache_stats["misses"] = 0
+
+
+def set_rotation_cache_size(size):
+    """Sets the number of rotation matrices the cache of rotation matrices will
+    hold, discarding the least recently used ones if it now holds too many. A
+    size of 0 turns the cache off.
+
+    :param int size: The new maximum size of the cache.
+    :raises ValueError: if the size is not a non-negative integer."""
+
+    global ROTATION_CACHE_SIZE
+    if not isinstance(size, int) or isinstance(size, bool) or size < 0:
+        raise ValueError("{} is not a valid cache size".format(size))
+    ROTATION_CACHE_SIZE = size
+    while len(_rotation_cache) > size:
+        _rotation_cache.popitem(last=False)
+
+
+def _axis_rotation(c, s, axis):
+    """Builds the matrix of a three dimensional rotation about an arbitrary
+    axis through the origin, using Rodrigues' rotation formula.
+
+    :param float c: the cosine of the angle.
+    :param float s: the sine of the angle.
+    :param axis: a 3D vector pointing along the axis.
+    :raises ValueError: if the axis is not a non-zero 3D vector.
+    :rtype: ``list``"""
+
+    try:
+        x, y, z = axis
+        length = sqrt(x * x + y * y + z * z)
+    except (TypeError, ValueError):
+        raise ValueError("{} is not a valid axis".format(axis))
+    if not length:
+        raise ValueError("Cannot rotate about zero vector {}".format(axis))
+    x, y, z, t = x / length, y / length, z / length, 1 - c
+    return [
+     [c + x * x * t, x * y * t - z * s, x * z * t + y * s],
+     [y * x * t + z * s, c + y * y * t, y * z * t - x * s],
+     [z * x * t - y * s, z * y * t + x * s, c + z * z * t]
+    ]
+
+
+def _quaternion_rotation(w, x, y, z):
+    """Builds the matrix of the three dimensional rotation represented by a
+    quaternion, which doesn't need to be a unit quaternion.
+
+    :param float w: the real part of the quaternion.
+    :param float x: the i component.
+    :param float y: the j component.
+    :param float z: the k component.
+    :rtype: ``list``"""
+
+    s = 2 / (w * w + x * x + y * y + z * z)
+    return [
+     [1 - s * (y * y + z * z), s * (x * y - w * z), s * (x * z + w * y)],
+     [s * (x * y + w * z), 1 - s * (x * x + z * z), s * (y * z - w * x)],
+     [s * (x * z - w * y), s * (y * z + w * x), 1 - s * (x * x + y * y)]
+    ]
+
+
 def translate_vectors(translation, *vectors):
     """Translates some vectors in space. The vectors will be changed in place.
 
@@ -40,13 +442,7 @@ def translate_vectors(translation, *vectors):
     :raises ValueError: if the vectors given don't match the dimension of the\
     translation."""
 
-    for v in vectors:
-        if not isinstance(v, Vector):
-            raise TypeError("Cannot translate {} - not a vector".format(v))
-        if len(v._values) != len(translation):
-            raise ValueError("Cannot translate {} - wrong dimension".format(v))
-    for vector in vectors:
-        vector._values = [val + d for val, d in zip(vector._values, translation)]
+    Transform(len(translation)).translate(*translation).apply(*vectors)
 
 
 @round_vectors
@@ -65,20 +461,7 @@ def rotate_2d_vectors(angle, *vectors, point=None):
     :raises ValueError: if the vectors given don't match the dimension of the\
     rotation."""
 
-    for v in vectors:
-        if not isinstance(v, Vector):
-            raise TypeError("Cannot rotate {} - not a vector".format(v))
-        if len(v._values) != 2:
-            raise ValueError("Cannot rotate {} - not 2D".format(v))
-    if point:
-        if len(point) != 2:
-            raise ValueError("point {} is not 2D".format(point))
-        dx, dy = point
-        translate_vectors((-dx, -dy), *vectors)
-    matrix = Matrix([cos(angle), -sin(angle)], [sin(angle), cos(angle)])
-    for vector in vectors:
-        vector._values = (matrix @ vector)._values
-    if point: translate_vectors((dx, dy), *vectors)
+    _about_point(Transform(2), point, lambda t: t.rotate(angle)).apply(*vectors)
 
 
 @round_vectors
@@ -97,33 +480,55 @@ def rotate_3d_vectors(angle, dimension, *vectors, point=None):
     :raises ValueError: if the vectors given don't match the dimension of the\
     rotation."""
 
-    for v in vectors:
-        if not isinstance(v, Vector):
-            raise TypeError("Cannot rotate {} - not a vector".format(v))
-        if len(v._values) != 3:
-            raise ValueError("Cannot rotate {} - not 3D".format(v))
-    if point:
-        if len(point) != 3:
-            raise ValueError("point {} is not 3D".format(point))
-        dx, dy, dz = point
-        translate_vectors((-dx, -dy, -dz), *vectors)
-    if dimension == 0:
-        matrix = Matrix(
-         [1, 0, 0], [0, cos(angle), -sin(angle)], [0, sin(angle), cos(angle)]
-        )
-    elif dimension == 1:
-        matrix = Matrix(
-         [cos(angle), 0, sin(angle)], [0, 1, 0], [-sin(angle), 0, cos(angle)]
-        )
-    elif dimension == 2:
-        matrix = Matrix(
-         [cos(angle), -sin(angle), 0], [sin(angle), cos(angle), 0], [0, 0, 1]
-        )
-    else:
+    if dimension not in (0, 1, 2):
         raise ValueError("{} is not a valid dimensions".format(dimension))
-    for vector in vectors:
-        vector._values = (matrix @ vector)._values
-    if point: translate_vectors((dx, dy, dz), *vectors)
+    _about_point(
+     Transform(3), point, lambda t: t.rotate(angle, dimension)
+    ).apply(*vectors)
+
+
+def _about_point(transform, point, operation):
+    """Adds an operation to a Transform, performed about some point rather than
+    the origin.
+
+    :param Transform transform: the Transform to add to.
+    :param point: the point, or ``None`` for the origin.
+    :param operation: a function which adds the operation to a Transform.
+    :raises ValueError: if the point is the wrong dimension.
+    :rtype: ``Transform``"""
+
+    if not point: return operation(transform)
+    if len(point) != transform.dimension():
+        raise ValueError("point {} is not {}D".format(
+         point, transform.dimension()
+        ))
+    return operation(
+     transform.translate(*[-val for val in point])
+    ).translate(*point)
+
+
+@allow_degrees
+def rotate_vectors_about_axis(angle, axis_vector, *vectors, point=None, trim=None):
+    """Rotates 3 dimensional vectors about an arbitrary axis. The rotation is
+    built as a single matrix and applied in one pass, and VectorArrays can be
+    given as well as individual vectors.
+
+    :param float angle: The angle in radians.
+    :param axis_vector: A 3D vector pointing along the axis of rotation.
+    :param iter point: A point on the axis. The origin is the default.
+    :param int trim: if given, the rotated vectors' values will be rounded to\
+    this number of decimal places at the end. The axis is never rounded.
+    :param bool degrees: if `True``, the angle given will be interpreted as\
+    being in degrees, not radians.
+    :param \*vectors: The vectors to rotate.
+    :raises TypeError: if non-vectors are given.
+    :raises ValueError: if the axis is not a non-zero 3D vector.
+    :raises ValueError: if the vectors given are not 3D."""
+
+    _about_point(
+     Transform(3), point, lambda t: t.rotate(angle, axis_vector)
+    ).apply(*vectors)
+    _trim(vectors, trim)
 
 
 @round_vectors
@@ -146,3 +551,237 @@ def align_vectors_to_plane(axis, coaxis, vector, *vectors):
     )
     angle = coaxis_vector.angle_with(flattened_vector)
     rotate_3d_vectors(angle, axis, vector, *vectors)
+
+
+def superimpose(mobile, target):
+    """Moves one set of 3D vectors onto another, using the rotation and
+    translation which minimises the root-mean-square deviation (RMSD) between
+    them, with each vector matched to the vector in the same position of the
+    other set. The mobile vectors are changed in place in a single pass.
+
+    The best rotation is found by the Kabsch method, using Horn's quaternion
+    formulation - the rotation is the eigenvector of a 4×4 matrix built from
+    the two sets' covariance, which avoids the reflections that a singular
+    value decomposition has to correct for.
+
+    :param mobile: The vectors to move - a VectorArray or sequence of Vectors.
+    :param target: The vectors to move them onto, in the same form.
+    :raises TypeError: if non-vectors are given.
+    :raises ValueError: if the vectors are not 3D.
+    :raises ValueError: if the sets are empty or of different sizes.
+    :returns: the :py:class:`.Transform` which was applied to the mobile\
+    vectors, and the RMSD after it was applied.
+    :rtype: ``tuple``"""
+
+    mobile_values, target_values = _coordinates(mobile), _coordinates(target)
+    if len(mobile_values) != len(target_values):
+        raise ValueError("Cannot superimpose sets of different sizes")
+    if not mobile_values:
+        raise ValueError("Cannot superimpose empty sets of vectors")
+    mobile_axes, mobile_centre = _centred(mobile_values)
+    target_axes, target_centre = _centred(target_values)
+    eigenvalue, quaternion = _horn_superposition(mobile_axes, target_axes)
+    squares = max(
+     _squares(mobile_axes) + _squares(target_axes) - 2 * eigenvalue, 0
+    )
+    rotation = _quaternion_rotation(*quaternion)
+    transform = Transform(3)._then(rotation, [
+     centre - sum(map(mul, row, mobile_centre))
+     for row, centre in zip(rotation, target_centre)
+    ])
+    if isinstance(mobile, VectorArray):
+        transform.apply(mobile)
+    else:
+        transform.apply(*mobile)
+    return transform, sqrt(squares / len(mobile_axes[0]))
+
+
+def _coordinates(vectors):
+    """Returns the values of a set of 3D vectors as one flat sequence.
+
+    :param vectors: a VectorArray or sequence of Vectors.
+    :raises TypeError: if non-vectors are given.
+    :raises ValueError: if the vectors are not 3D.
+    :rtype: ``list`` or ``array``"""
+
+    if isinstance(vectors, VectorArray):
+        if vectors._dimension != 3:
+            raise ValueError("{} is not 3D".format(vectors))
+        return vectors._values
+    values = []
+    for vector in vectors:
+        if not isinstance(vector, Vector):
+            raise TypeError("{} is not a vector".format(vector))
+        if len(vector._values) != 3:
+            raise ValueError("{} is not 3D".format(vector))
+        values.extend(vector._values)
+    return values
+
+
+def _centred(values):
+    """Splits a flat sequence of 3D vector values into their x, y and z values,
+    moved so that their centroid is at the origin.
+
+    :param values: the flat values.
+    :returns: the three lists of centred values, and the centroid.
+    :rtype: ``tuple``"""
+
+    count, axes, centre = len(values) // 3, [], []
+    for start in range(3):
+        axis = values[start::3]
+        mean = sum(axis) / count
+        axes.append([val - mean for val in axis])
+        centre.append(mean)
+    return axes, centre
+
+
+def _horn_superposition(mobile, target):
+    """Finds the rotation which best superimposes one centred set of 3D
+    vectors onto another, by Horn's quaternion method.
+
+    :param list mobile: the x, y and z values of the vectors to move.
+    :param list target: the x, y and z values of the vectors to move onto.
+    :returns: the largest eigenvalue of Horn's matrix, and the unit quaternion\
+    of the rotation as ``(w, x, y, z)``. The sum of squared deviations after\
+    the rotation is the two sets' :py:func:`_squares` less twice the\
+    eigenvalue.
+    :rtype: ``tuple``"""
+
+    (sxx, sxy, sxz), (syx, syy, syz), (szx, szy, szz) = [
+     [sum(map(mul, m, t)) for t in target] for m in mobile
+    ]
+    values, vectors = _jacobi_eigen([
+     [sxx + syy + szz, syz - szy, szx - sxz, sxy - syx],
+     [syz - szy, sxx - syy - szz, sxy + syx, szx + sxz],
+     [szx - sxz, sxy + syx, syy - sxx - szz, syz + szy],
+     [sxy - syx, szx + sxz, syz + szy, szz - sxx - syy]
+    ])
+    best = max(range(4), key=values.__getitem__)
+    return values[best], vectors[best]
+
+
+def _squares(axes):
+    """Returns the sum of the squares of the x, y and z values of a set of
+    vectors.
+
+    :param list axes: the x, y and z values.
+    :rtype: ``float``"""
+
+    return sum(sum(map(mul, axis, axis)) for axis in axes)
+
+
+def rmsd_matrix(coordinate_sets, workers=None):
+    """Calculates the root-mean-square deviation (RMSD) between every pair of
+    a number of sets of 3D vectors, after each pair has been optimally
+    superimposed as :py:func:`superimpose` would (though no vectors are
+    moved). All the sets must have the same number of vectors.
+
+    The result is symmetric with zeros on the diagonal, so it is returned as a
+    :py:class:`.CondensedMatrix` where ``result[i, j]`` is the RMSD between
+    sets ``i`` and ``j``.
+
+    When ``workers`` is more than one, the pairs are divided between that many
+    processes. The coordinates are sent to them once, through shared memory,
+    and the pairs are handed out in small chunks so that every process stays
+    busy until the end. Before Python 3.7, process pools cannot be given an
+    initializer, and the pairs are calculated serially.
+
+    :param coordinate_sets: The sets - each a VectorArray or sequence of\
+    Vectors.
+    :param int workers: The number of processes to use.
+    :raises TypeError: if non-vectors are given.
+    :raises ValueError: if the vectors are not 3D.
+    :raises ValueError: if the sets are empty or of different sizes.
+    :rtype: ``CondensedMatrix``"""
+
+    rows = []
+    for coordinates in coordinate_sets:
+        values = _coordinates(coordinates)
+        if not values or (rows and len(values) != len(rows[0])):
+            raise ValueError("Sets must be the same size and not empty")
+        rows.append([val for axis in _centred(values)[0] for val in axis])
+    count = len(rows)
+    pairs = count * (count - 1) // 2
+    if not workers or workers < 2 or pairs < 2 or not _POOL_INITIALIZERS:
+        return CondensedMatrix(count, _rmsd_pairs(_split_sets(rows), 0, pairs))
+    chunk = max(-(-pairs // (workers * 8)), 1)
+    block, shared = _share(rows)
+    try:
+        with ProcessPoolExecutor(
+         max_workers=workers, initializer=_start_rmsd_worker, initargs=(shared,)
+        ) as executor:
+            starts = range(0, pairs, chunk)
+            values = []
+            for values_chunk in executor.map(_rmsd_chunk, starts, [
+             min(start + chunk, pairs) for start in starts
+            ]):
+                values += values_chunk
+    finally:
+        if block:
+            block.close()
+            block.unlink()
+    return CondensedMatrix(count, values)
+
+
+def _split_sets(rows):
+    """Turns rows of centred coordinates - the x values of a set, then its y
+    values, then its z values - into the x, y and z values of each set, along
+    with their sum of squares.
+
+    :param list rows: the rows of coordinates.
+    :rtype: ``list``"""
+
+    sets = []
+    for row in rows:
+        size = len(row) // 3
+        axes = [row[:size], row[size:size * 2], row[size * 2:]]
+        sets.append((axes, _squares(axes)))
+    return sets
+
+
+def _rmsd_pairs(sets, start, stop):
+    """Calculates the RMSDs of a run of pairs of sets, numbered in the order
+    used by :py:class:`.CondensedMatrix`.
+
+    :param list sets: the sets, as returned by :py:func:`_split_sets`.
+    :param int start: the number of the first pair.
+    :param int stop: the number after the last pair.
+    :rtype: ``list``"""
+
+    if start >= stop: return []
+    count, i, j = len(sets), 0, start + 1
+    while j >= count:
+        i += 1
+        j -= count - i - 1
+    values = []
+    for _ in range(start, stop):
+        (axes1, squares1), (axes2, squares2) = sets[i], sets[j]
+        eigenvalue = _horn_superposition(axes1, axes2)[0]
+        values.append(sqrt(
+         max(squares1 + squares2 - 2 * eigenvalue, 0) / len(axes1[0])
+        ))
+        j += 1
+        if j == count:
+            i += 1
+            j = i + 1
+    return values
+
+
+def _start_rmsd_worker(shared):
+    """Loads the coordinate sets of a parallel RMSD calculation in a worker
+    process, once, before it starts receiving chunks of pairs.
+
+    :param shared: the shared rows of centred coordinates."""
+
+    global _worker_sets
+    _worker_sets = _split_sets(_unshare(shared))
+
+
+def _rmsd_chunk(start, stop):
+    """Calculates the RMSDs of a chunk of pairs of sets, in a worker process.
+
+    :param int start: the number of the first pair.
+    :param int stop: the number after the last pair.
+    :rtype: ``list``"""
+
+    return _rmsd_pairs(_worker_sets, start, stop)
@@ -1,7 +1,593 @@
 """Contains the Matrix class."""
 
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from fractions import Fraction
+from functools import reduce
+from inspect import signature
+from math import sqrt, gcd
+from operator import add, sub, mul, floordiv, truediv
 from .vectors import Vector, VectorSpan
+try:
+    from multiprocessing import shared_memory
+except ImportError: # pragma: no cover
+    shared_memory = None
+
+_POOL_INITIALIZERS = "initializer" in signature(ProcessPoolExecutor).parameters
+
+MATMUL_BLOCK_SIZE = 32
+"""The number of columns of the right-hand matrix processed together by the
+blocked matrix multiplication kernel."""
+
+MATMUL_BLOCK_THRESHOLD = 128
+"""The number of output columns at and above which matrix multiplication
+switches to the blocked kernel."""
+
+def _matmul(rows, columns):
+    """Multiplies two matrices, given as the rows of the left matrix and the
+    columns of the right matrix, and returns the product's values in row-major
+    order.
+
+    When there are many output columns, they are processed in blocks of
+    :py:data:`MATMUL_BLOCK_SIZE` - each block of columns is used against every
+    row before moving on to the next, so that the values being read stay in the
+    processor's cache.
+
+    :param list rows: the rows of the left matrix.
+    :param list columns: the columns of the right matrix.
+    :rtype: ``list``"""
+
+    width = len(columns)
+    if width < MATMUL_BLOCK_THRESHOLD:
+        return [sum(map(mul, row, column)) for row in rows for column in columns]
+    values = [0] * (len(rows) * width)
+    for start in range(0, width, MATMUL_BLOCK_SIZE):
+        block = columns[start:start + MATMUL_BLOCK_SIZE]
+        for offset in range(start, len(values), width):
+            row = rows[offset // width]
+            values[offset:offset + len(block)] = [
+             sum(map(mul, row, column)) for column in block
+            ]
+    return values
+
+
+def _share(rows):
+    """Prepares some rows of numbers for sending to worker processes. If the
+    values are floats and shared memory is available, they are copied into a
+    block of shared memory so that workers can read them without them being
+    pickled - otherwise the rows themselves are used.
+
+    :param list rows: the rows to share.
+    :returns: the shared memory block (or ``None``) and a description of the\
+    rows which can be passed to :py:func:`_unshare`."""
+
+    if shared_memory is None or _is_exact(rows):
+        return None, rows
+    values = array("d", [float(val) for row in rows for val in row])
+    block = shared_memory.SharedMemory(create=True, size=max(len(values), 1) * 8)
+    block.buf[:len(values) * 8] = values.tobytes()
+    return block, (block.name, len(rows), len(rows[0]) if rows else 0)
+
+
+def _unshare(shared):
+    """Recovers rows of numbers from the description produced by
+    :py:func:`_share`, in a worker process.
+
+    :param shared: the shared description.
+    :rtype: ``list``"""
+
+    if isinstance(shared, list): return shared
+    name, height, width = shared
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        values = array("d", bytes(block.buf[:height * width * 8]))
+    finally:
+        block.close()
+    return [values[i:i + width].tolist() for i in range(0, height * width, width)]
+
+
+_worker_operands = None
+
+def _start_matmul_worker(rows, columns):
+    """Loads the operands of a parallel matrix multiplication in a worker
+    process, once, before it starts receiving blocks of rows to multiply.
+
+    :param rows: the shared rows of the left matrix.
+    :param columns: the shared columns of the right matrix."""
+
+    global _worker_operands
+    _worker_operands = (_unshare(rows), _unshare(columns))
+
+
+def _matmul_rows(start, stop):
+    """Multiplies a block of rows of the left matrix by the right matrix, in a
+    worker process.
+
+    :param int start: the first row of the block.
+    :param int stop: the row after the last row of the block.
+    :rtype: ``list``"""
+
+    rows, columns = _worker_operands
+    return _matmul(rows[start:stop], columns)
+
+
+def _is_exact(rows):
+    """Checks whether every value in some rows is an integer or a Fraction, so
+    that calculations on them can be carried out without rounding errors.
+
+    :param rows: the rows to check.
+    :rtype: ``bool``"""
+
+    return all(isinstance(val, (int, Fraction)) for row in rows for val in row)
+
+
+def _lu_decompose(rows):
+    """Performs LU decomposition with partial pivoting on the rows of a square
+    matrix, using floating point arithmetic.
+
+    The L and U factors are returned combined in one set of rows - the values
+    below the diagonal are those of L (whose diagonal is all ones) and the rest
+    are those of U. The permutation is the original row index of each row, and
+    the sign is -1 if an odd number of row swaps were made.
+
+    :param rows: the rows of the matrix.
+    :returns: the LU rows, the permutation, and the permutation's sign."""
+
+    lu = [[float(val) for val in row] for row in rows]
+    size = len(lu)
+    permutation, sign = list(range(size)), 1
+    for k in range(size):
+        pivot_row = max(range(k, size), key=lambda i: abs(lu[i][k]))
+        if pivot_row != k:
+            lu[k], lu[pivot_row] = lu[pivot_row], lu[k]
+            permutation[k], permutation[pivot_row] = (
+             permutation[pivot_row], permutation[k]
+            )
+            sign = -sign
+        pivot = lu[k][k]
+        if pivot == 0: continue
+        tail = lu[k][k + 1:]
+        for row in lu[k + 1:]:
+            factor = row[k] / pivot
+            row[k] = factor
+            if factor:
+                row[k + 1:] = [a - factor * b for a, b in zip(row[k + 1:], tail)]
+    return lu, permutation, sign
+
+
+def _negligible(pivot, scale, size):
+    """Checks whether a pivot found during the elimination of a square matrix
+    should be treated as zero. It is judged against the largest magnitude in
+    the row of the original matrix it came from, rather than in the whole
+    matrix, so that matrices whose rows are of very different scales are not
+    wrongly treated as singular.
+
+    :param pivot: the pivot.
+    :param scale: the largest magnitude in the pivot's original row - 0 if\
+    only an exactly zero pivot is negligible.
+    :param int size: the size of the matrix.
+    :rtype: ``bool``"""
+
+    return abs(pivot) <= scale * size * 1e-15
+
+
+def _gauss_jordan_inverse(rows):
+    """Inverts a square matrix using Gauss-Jordan elimination with partial
+    pivoting. If every value is an integer or Fraction the elimination is
+    carried out exactly, otherwise floating point arithmetic is used.
+
+    The determinant is calculated along the way from the pivots. If the matrix
+    is singular, the inverse rows will be ``None``. With floats, a pivot is
+    treated as zero if it is negligible compared with the largest value in its
+    row of the original matrix (see :py:func:`_negligible`) - in that case the
+    determinant returned is only the product of the pivots so far, and is 0
+    only if the pivot was exactly zero.
+
+    :param rows: the rows of the matrix.
+    :returns: the rows of the inverse, and the determinant."""
+
+    if all(isinstance(val, int) for row in rows for val in row):
+        return _fraction_free_inverse(rows)
+    size, exact = len(rows), _is_exact(rows)
+    convert = Fraction if exact else float
+    augmented = [[convert(val) for val in row] + [
+     convert(1 if c == r else 0) for c in range(size)
+    ] for r, row in enumerate(rows)]
+    scales = [0 if exact else max(map(abs, row)) for row in rows]
+    determinant = 1
+    for k in range(size):
+        pivot_row = max(range(k, size), key=lambda i: abs(augmented[i][k]))
+        pivot = augmented[pivot_row][k]
+        if _negligible(pivot, scales[pivot_row], size):
+            return None, determinant * pivot
+        if pivot_row != k:
+            augmented[k], augmented[pivot_row] = augmented[pivot_row], augmented[k]
+            scales[k], scales[pivot_row] = scales[pivot_row], scales[k]
+            determinant = -determinant
+        determinant *= pivot
+        pivot_row = [val / pivot for val in augmented[k]]
+        augmented[k] = pivot_row
+        for i, row in enumerate(augmented):
+            factor = row[k]
+            if i != k and factor:
+                augmented[i] = [a - factor * b for a, b in zip(row, pivot_row)]
+    return [row[size:] for row in augmented], determinant
+
+
+def _fraction_free_inverse(rows):
+    """Inverts a square matrix of integers exactly, using the fraction-free
+    (Bareiss) variant of Gauss-Jordan elimination. Every intermediate value is
+    an integer, so this is much faster than eliminating with Fractions.
+
+    :param rows: the rows of the matrix.
+    :returns: the rows of the inverse as Fractions, and the determinant."""
+
+    size, sign, previous = len(rows), 1, 1
+    augmented = [list(row) + [
+     1 if c == r else 0 for c in range(size)
+    ] for r, row in enumerate(rows)]
+    for k in range(size):
+        for i in range(k, size):
+            if augmented[i][k]: break
+        else:
+            return None, 0
+        if i != k:
+            augmented[k], augmented[i] = augmented[i], augmented[k]
+            sign = -sign
+        pivot_row = augmented[k]
+        pivot = pivot_row[k]
+        for i, row in enumerate(augmented):
+            if i != k:
+                factor = row[k]
+                augmented[i] = [
+                 (pivot * a - factor * b) // previous
+                 for a, b in zip(row, pivot_row)
+                ]
+        previous = pivot
+    return [[
+     Fraction(val, row[r]) for val in row[size:]
+    ] for r, row in enumerate(augmented)], sign * previous
+
+
+def _row_echelon(rows, exact, tolerance):
+    """Puts some rows into row echelon form using Gaussian elimination with
+    partial pivoting. The rows given are not modified.
+
+    :param rows: the rows of the matrix.
+    :param bool exact: if ``True``, Fractions will be used rather than floats.
+    :param float tolerance: floats whose magnitude is no more than this times\
+    the largest magnitude in the matrix are treated as zero.
+    :returns: the new rows, and the indices of the pivot columns."""
+
+    convert = Fraction if exact else float
+    rows = [[convert(val) for val in row] for row in rows]
+    height, width, zero = len(rows), len(rows[0]), convert(0)
+    limit = 0 if exact else tolerance * max(
+     abs(val) for row in rows for val in row
+    )
+    pivots, r = [], 0
+    for c in range(width):
+        if r == height: break
+        pivot_row = max(range(r, height), key=lambda i: abs(rows[i][c]))
+        if abs(rows[pivot_row][c]) <= limit:
+            for row in rows[r:]: row[c] = zero
+            continue
+        rows[r], rows[pivot_row] = rows[pivot_row], rows[r]
+        pivot, tail = rows[r][c], rows[r][c + 1:]
+        for row in rows[r + 1:]:
+            factor = row[c] / pivot
+            row[c] = zero
+            if factor:
+                row[c + 1:] = [a - factor * b for a, b in zip(row[c + 1:], tail)]
+        pivots.append(c)
+        r += 1
+    if not exact:
+        rows = [[zero if abs(val) <= limit else val for val in row] for row in rows]
+    return rows, pivots
+
+
+def _reduced_row_echelon(rows, exact, tolerance):
+    """Puts some rows into reduced row echelon form - row echelon form found
+    using partial pivoting, after which each pivot row is scaled so that its
+    pivot is one and then eliminated from the rows above it. The rows given
+    are not modified.
+
+    :param rows: the rows of the matrix.
+    :param bool exact: if ``True``, Fractions will be used rather than floats.
+    :param float tolerance: floats whose magnitude is no more than this times\
+    the largest magnitude in the matrix are treated as zero.
+    :returns: the new rows, and the indices of the pivot columns."""
+
+    rows, pivots = _row_echelon(rows, exact, tolerance)
+    zero = rows[0][0] * 0
+    for r in reversed(range(len(pivots))):
+        c, row = pivots[r], rows[r]
+        pivot = row[c]
+        row[c:] = [zero + 1] + [val / pivot for val in row[c + 1:]]
+        tail = row[c + 1:]
+        for above in rows[:r]:
+            factor = above[c]
+            above[c] = zero
+            if factor:
+                above[c + 1:] = [
+                 a - factor * b for a, b in zip(above[c + 1:], tail)
+                ]
+    return rows, pivots
+
+
+def _pivot_columns(rows, exact, tolerance):
+    """Finds the pivot columns of a matrix from a single row reduction of a
+    working copy of its rows. Exact reduction is carried out fraction-free
+    on integers - rows containing Fractions are first scaled by the lowest
+    common multiple of their denominators, which doesn't change which columns
+    are pivots.
+
+    :param rows: the rows of the matrix.
+    :param bool exact: if ``True``, the reduction will be exact.
+    :param float tolerance: when not exact, floats whose magnitude is no more\
+    than this times the largest magnitude in the matrix are treated as zero.
+    :rtype: ``list``"""
+
+    if not exact: return _row_echelon(rows, False, tolerance)[1]
+    rows = [[int(val * scale) for val in row] for row, scale in zip(rows, [
+     reduce(lambda a, b: a * b // gcd(a, b), [
+      Fraction(val).denominator for val in row
+     ], 1) for row in rows
+    ])]
+    height, width, previous = len(rows), len(rows[0]), 1
+    pivots, r = [], 0
+    for c in range(width):
+        if r == height: break
+        for i in range(r, height):
+            if rows[i][c]: break
+        else:
+            continue
+        rows[r], rows[i] = rows[i], rows[r]
+        pivot, tail = rows[r][c], rows[r][c + 1:]
+        for row in rows[r + 1:]:
+            factor = row[c]
+            row[c + 1:] = [
+             (pivot * a - factor * b) // previous for a, b in zip(row[c + 1:], tail)
+            ]
+        previous = pivot
+        pivots.append(c)
+        r += 1
+    return pivots
+
+
+def _bareiss_determinant(rows):
+    """Calculates the determinant of a square matrix of integers or Fractions
+    using the fraction-free Bareiss algorithm, so that the result is exact.
+
+    :param rows: the rows of the matrix.
+    :rtype: ``int`` or ``Fraction``"""
+
+    rows = [list(row) for row in rows]
+    size, sign, previous = len(rows), 1, 1
+    divide = floordiv if all(
+     isinstance(val, int) for row in rows for val in row
+    ) else truediv
+    for k in range(size - 1):
+        if rows[k][k] == 0:
+            for i in range(k + 1, size):
+                if rows[i][k] != 0:
+                    rows[k], rows[i] = rows[i], rows[k]
+                    sign = -sign
+                    break
+            else:
+                return 0
+        pivot, pivot_row = rows[k][k], rows[k]
+        for row in rows[k + 1:]:
+            factor = row[k]
+            for j in range(k + 1, size):
+                row[j] = divide(row[j] * pivot - factor * pivot_row[j], previous)
+        previous = pivot
+    return sign * rows[-1][-1]
+
+
+def _reflect(rows, k, v, scale, start=0):
+    """Applies the Householder reflection ``I - scale * vvᵀ`` to some rows,
+    changing them in place. The reflection only involves rows ``k`` onwards,
+    and only columns ``start`` onwards are updated.
+
+    :param rows: the rows to reflect.
+    :param int k: the first row the reflection touches.
+    :param v: the Householder vector, one value for each row from ``k``.
+    :param float scale: ``2 / vᵀv``.
+    :param int start: the first column to update."""
+
+    sums = [0.0] * (len(rows[0]) - start)
+    for vi, row in zip(v, rows[k:]):
+        if vi: sums = [a + vi * b for a, b in zip(sums, row[start:])]
+    for vi, row in zip(v, rows[k:]):
+        if vi:
+            factor = scale * vi
+            row[start:] = [a - factor * b for a, b in zip(row[start:], sums)]
+
+
+def _householder_qr(rows, reduced=False):
+    """Performs QR decomposition of a matrix using Householder reflections,
+    which are much more numerically stable than Gram-Schmidt
+    orthogonalisation. Each reflection zeroes the values below the diagonal of
+    one column, and Q is then built by applying the reflections in reverse to
+    the identity.
+
+    :param rows: the rows of the matrix.
+    :param bool reduced: if ``True``, Q will only have as many columns as the\
+    smaller dimension of the matrix, and R that many rows.
+    :returns: the rows of Q, and the rows of R."""
+
+    r = [[float(val) for val in row] for row in rows]
+    height, width = len(r), len(r[0])
+    reflectors = []
+    for k in range(min(height - 1, width)):
+        v = [row[k] for row in r[k:]]
+        norm = sqrt(sum(val * val for val in v))
+        if not norm: continue
+        alpha = -norm if v[0] >= 0 else norm
+        v[0] -= alpha
+        scale = 2 / sum(val * val for val in v)
+        _reflect(r, k, v, scale, start=k)
+        r[k][k] = alpha
+        for row in r[k + 1:]: row[k] = 0.0
+        reflectors.append((k, v, scale))
+    size = min(height, width) if reduced else height
+    q = [[float(i == j) for j in range(size)] for i in range(height)]
+    for k, v, scale in reversed(reflectors):
+        _reflect(q, k, v, scale)
+    return q, r[:size]
+
+
+def _jacobi_eigen(rows, sweeps=50):
+    """Finds the eigenvalues and eigenvectors of a real symmetric matrix using
+    the cyclic Jacobi method - repeated plane rotations which each zero one
+    off-diagonal value, until the matrix is diagonal to within rounding error.
+    This is a good fit for the small matrices it is used on, and the
+    eigenvectors it produces are orthonormal.
+
+    :param rows: the rows of the symmetric matrix.
+    :param int sweeps: the most passes over the off-diagonal values to make.
+    :returns: the eigenvalues, and the eigenvectors in the same order.
+    :rtype: ``tuple``"""
+
+    a = [[float(val) for val in row] for row in rows]
+    size = len(a)
+    v = [[1.0 if i == j else 0.0 for j in range(size)] for i in range(size)]
+    scale = sum(val * val for row in a for val in row)
+    for _ in range(sweeps):
+        off = sum(a[p][q] ** 2 for p in range(size) for q in range(p + 1, size))
+        if off <= scale * 1e-32: break
+        for p in range(size - 1):
+            for q in range(p + 1, size):
+                if not a[p][q]: continue
+                theta = (a[q][q] - a[p][p]) / (2 * a[p][q])
+                t = 1 / (abs(theta) + sqrt(theta * theta + 1))
+                if theta < 0: t = -t
+                c = 1 / sqrt(t * t + 1)
+                s = t * c
+                for row in a + v:
+                    x, y = row[p], row[q]
+                    row[p], row[q] = c * x - s * y, s * x + c * y
+                a[p], a[q] = [c * x - s * y for x, y in zip(a[p], a[q])], [
+                 s * x + c * y for x, y in zip(a[p], a[q])
+                ]
+    return [a[i][i] for i in range(size)], [
+     [row[i] for row in v] for i in range(size)
+    ]
+
+
+class MatrixLine(Sequence):
+    """A MatrixLine is a single row or column of a :py:class:`.Matrix`. It
+    behaves like a tuple of the values in that row or column, but it is a view
+    onto the matrix's storage rather than a copy of it.
+
+    It can be indexed, sliced, iterated over, compared with and ordered against
+    tuples, and concatenated or repeated with ``+`` and ``*`` (which give
+    tuples), but it is not itself a ``tuple`` - use ``tuple(line)`` where a
+    real tuple is needed. Like a tuple, it is never equal to a list.
+
+    :param list values: The flat storage of the matrix.
+    :param int offset: The position of the line's first value in the storage.
+    :param int stride: The distance between consecutive values in the storage.
+    :param int length: The number of values in the line."""
+
+    __slots__ = ("_values", "_offset", "_stride", "_length")
+
+    def __init__(self, values, offset, stride, length):
+        self._values, self._offset = values, offset
+        self._stride, self._length = stride, length
+
+
+    def __repr__(self):
+        return repr(tuple(self))
+
+
+    def __len__(self):
+        return self._length
+
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self._list()[index])
+        if index < 0: index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("MatrixLine index out of range")
+        return self._values[self._offset + index * self._stride]
+
+
+    def __iter__(self):
+        return iter(self._list())
+
+
+    def __add__(self, other):
+        if isinstance(other, (tuple, MatrixLine)):
+            return tuple(self._list()) + tuple(other)
+        return NotImplemented
+
+
+    def __radd__(self, other):
+        if isinstance(other, tuple):
+            return other + tuple(self._list())
+        return NotImplemented
+
+
+    def __mul__(self, other):
+        if isinstance(other, int):
+            return tuple(self._list()) * other
+        return NotImplemented
+
+
+    def __rmul__(self, other):
+        return self * other
+
+
+    def __eq__(self, other):
+        if isinstance(other, (tuple, MatrixLine)):
+            return tuple(self._list()) == tuple(other)
+        return NotImplemented
+
+
+    def __lt__(self, other):
+        if isinstance(other, (tuple, MatrixLine)):
+            return tuple(self._list()) < tuple(other)
+        return NotImplemented
+
+
+    def __le__(self, other):
+        if isinstance(other, (tuple, MatrixLine)):
+            return tuple(self._list()) <= tuple(other)
+        return NotImplemented
+
+
+    def __gt__(self, other):
+        if isinstance(other, (tuple, MatrixLine)):
+            return tuple(self._list()) > tuple(other)
+        return NotImplemented
+
+
+    def __ge__(self, other):
+        if isinstance(other, (tuple, MatrixLine)):
+            return tuple(self._list()) >= tuple(other)
+        return NotImplemented
+
+
+    def __hash__(self):
+        return hash(tuple(self._list()))
+
+
+    def _list(self):
+        """Returns the values of the line as a new list.
+
+        :rtype: ``list``"""
+
+        if not self._length: return []
+        return self._values[
+         self._offset:self._offset + (self._length - 1) * self._stride + 1:
+         self._stride
+        ]
+
+
 
 class Matrix:
     """A Matrix is a rectangular array of numbers. They are created from
@@ -10,6 +596,14 @@ class Matrix:
     They can be added and subtracted from each other, and multiplied by a scalar
     using the `*` operator. To multiply a Matrix with another Matrix, use ``@``.
 
+    The values are stored in one flat list, along with the matrix's shape and
+    the strides needed to step between rows and columns. This means that
+    transposed matrices, rows, columns and submatrices (obtained by slicing,
+    such as ``matrix[1:3, 0:2]``) are all views onto the same storage rather
+    than copies. Methods which change a matrix in place, such as
+    :py:meth:`.gauss`, give it new storage, so views are never affected by
+    changes to the matrix they came from.
+
     :param iter args: The rows of the Matrix. Each row must be iterable.
     :raises ValueError: if you create an empty matrix.
     :raises TypeError: if you mix Vectors with other iterables.
@@ -17,17 +611,41 @@ class Matrix:
     :raises ValueError: if you give rows of different lengths."""
 
     def __init__(self, *rows, columns=False):
-        rows_ = []
+        values, width = [], None
         for row in rows:
             try:
-                rows_.append(list(row))
+                row = list(row)
             except TypeError:
                 raise TypeError("{} is not iterable".format(row))
-        if len(set(len(row) for row in rows_)) != 1:
+            if width is None:
+                width = len(row)
+            elif len(row) != width:
+                raise ValueError("Cannot make Matrix with unequal rows")
+            values += row
+        if width is None:
             raise ValueError("Cannot make Matrix with unequal rows")
+        self._values, self._offset, self._cache = values, 0, {}
         if columns:
-            rows_ = [[col[n] for col in rows_] for n in range(len(rows_[0]))]
-        self._rows = rows_
+            self._shape, self._strides = (width, len(rows)), (1, width)
+        else:
+            self._shape, self._strides = (len(rows), width), (width, 1)
+
+
+    @staticmethod
+    def _view(values, shape, strides, offset=0):
+        """Creates a Matrix directly from some flat storage, without copying it.
+
+        :param list values: the flat storage.
+        :param tuple shape: the height and width of the matrix.
+        :param tuple strides: the distance in the storage between rows, and\
+        between columns.
+        :param int offset: the position of the first value in the storage.
+        :rtype: ``Matrix``"""
+
+        matrix = Matrix.__new__(Matrix)
+        matrix._values, matrix._shape = values, shape
+        matrix._strides, matrix._offset, matrix._cache = strides, offset, {}
+        return matrix
 
 
     @staticmethod
@@ -40,9 +658,9 @@ class Matrix:
 
         if not isinstance(dimensions, int):
             raise TypeError("Dimensions must be int, not {}".format(dimensions))
-        return Matrix(*[[
-         1 if j == i else 0 for j in range(dimensions)
-        ] for i in range(dimensions)])
+        return Matrix._view([
+         1 if j == i else 0 for i in range(dimensions) for j in range(dimensions)
+        ], (dimensions, dimensions), (dimensions, 1))
 
 
     def __repr__(self):
@@ -50,7 +668,7 @@ class Matrix:
 
 
     def __str__(self):
-        strings = [[str(val) for val in row] for row in self._rows]
+        strings = [[str(val) for val in row] for row in self._row_lists()]
         max_length = max([max([len(val) for val in row]) for row in strings])
         return "\n".join([
          " ".join([val.rjust(max_length) for val in row
@@ -58,14 +676,38 @@ class Matrix:
 
 
     def __contains__(self, item):
-        for row in self._rows:
-            if item in row:
-                return True
-        return False
+        return item in self._flat()
 
 
     def __eq__(self, other):
-        return isinstance(other, Matrix) and self._rows == other._rows
+        return (isinstance(other, Matrix) and self._shape == other._shape
+         and self._flat() == other._flat())
+
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple) or len(key) != 2:
+            raise TypeError("Matrix indices must be (row, column) pairs")
+        (height, width), (row_stride, column_stride) = self._shape, self._strides
+        if isinstance(key[0], int) and isinstance(key[1], int):
+            i, j = key
+            if i < 0: i += height
+            if j < 0: j += width
+            if not (0 <= i < height and 0 <= j < width):
+                raise IndexError("Matrix index out of range")
+            return self._values[self._offset + i * row_stride + j * column_stride]
+        for index, length in zip(key, self._shape):
+            if isinstance(index, int) and not -length <= index < length:
+                raise IndexError("Matrix index out of range")
+        rows, columns = [range(*(
+         index if isinstance(index, slice) else slice(index, index + 1 or None)
+        ).indices(length)) for index, length in zip(key, self._shape)]
+        if rows.step < 0 or columns.step < 0:
+            raise ValueError("Matrix slices cannot have negative steps")
+        if not rows or not columns:
+            raise ValueError("Cannot make empty Matrix")
+        return Matrix._view(self._values, (len(rows), len(columns)), (
+         row_stride * rows.step, column_stride * columns.step
+        ), self._offset + rows.start * row_stride + columns.start * column_stride)
 
 
     def __add__(self, other):
@@ -73,9 +715,10 @@ class Matrix:
             raise TypeError("{} is not a Matrix".format(other))
         if self.size() != other.size():
             raise ValueError("{} & {} are different sizes".format(self, other))
-        return Matrix(*[[
-         n1 + n2 for n1, n2 in zip(row1, row2)
-        ] for row1, row2 in zip(self._rows, other._rows)])
+        return Matrix._view(
+         list(map(add, self._flat(), other._flat())), self._shape,
+         (self._shape[1], 1)
+        )
 
 
     def __sub__(self, other):
@@ -83,9 +726,10 @@ class Matrix:
             raise TypeError("{} is not a Matrix".format(other))
         if self.size() != other.size():
             raise ValueError("{} & {} are different sizes".format(self, other))
-        return Matrix(*[[
-         n1 - n2 for n1, n2 in zip(row1, row2)
-        ] for row1, row2 in zip(self._rows, other._rows)])
+        return Matrix._view(
+         list(map(sub, self._flat(), other._flat())), self._shape,
+         (self._shape[1], 1)
+        )
 
 
     def __mul__(self, other):
@@ -93,8 +737,9 @@ class Matrix:
             raise TypeError(
              "{} isn't numeric - Matrix * operator needs scalars".format(other)
             )
-        rows = [[n * other for n in row] for row in self._rows]
-        return Matrix(*rows)
+        return Matrix._view(
+         [n * other for n in self._flat()], self._shape, (self._shape[1], 1)
+        )
 
 
     def __rmul__(self, other):
@@ -103,28 +748,137 @@ class Matrix:
 
     def __matmul__(self, other):
         if isinstance(other, Vector):
-            if self.size()[1] != len(other):
+            if self._shape[1] != len(other):
                 raise ValueError(
                  "{} and {} dimensions incompatible".format(self, other)
                 )
-            return Vector(*[sum(
-             val * other.values()[i] for i, val in enumerate(row)
-            ) for row in self._rows])
+            values = other._values
+            products = [sum(map(mul, row, values)) for row in self._row_tuples()]
+            vector = Vector.__new__(Vector)
+            vector._values = products if isinstance(values, list) else array(
+             "d", products
+            )
+            return vector
         if not isinstance(other, Matrix):
             raise TypeError("{} is not a Matrix".format(other))
         if self.size()[1] != other.size()[0]:
             raise ValueError(
              "{} and {} dimensions incompatible".format(self, other)
             )
-        new_rows, other_columns = [], other.columns()
-        for row in self._rows:
-            new_row = []
-            for c in range(len(other_columns)):
-                new_row.append(sum([
-                 row[j] * other._rows[j][c] for j in range(len(other._rows))
-                ]))
-            new_rows.append(new_row)
-        return Matrix(*new_rows)
+        columns = other._column_lists()
+        return Matrix._view(
+         _matmul(self._row_lists(), columns),
+         (self._shape[0], len(columns)), (len(columns), 1)
+        )
+
+
+    def matmul(self, other, workers=None):
+        """Multiplies this Matrix by another Matrix or a Vector, as ``@`` does,
+        optionally splitting the work between several processes.
+
+        When ``workers`` is more than one, blocks of rows of the product are
+        computed in separate processes. Float matrices are sent to the
+        processes through shared memory rather than being pickled. This is only
+        worthwhile for large matrices (roughly 256×256 and above) as starting
+        the processes has a cost of its own. Before Python 3.7, process pools
+        cannot be given an initializer, and the product is computed serially.
+
+        :param other: The Matrix or Vector to multiply by.
+        :param int workers: The number of processes to use.
+        :raises TypeError: if a non-Matrix is given.
+        :raises ValueError: if the dimensions are incompatible.
+        :rtype: ``Matrix`` or ``Vector``"""
+
+        if (not workers or workers < 2 or not isinstance(other, Matrix)
+         or not _POOL_INITIALIZERS):
+            return self @ other
+        if self.size()[1] != other.size()[0]:
+            raise ValueError(
+             "{} and {} dimensions incompatible".format(self, other)
+            )
+        height, width = self._shape[0], other._shape[1]
+        step = -(-height // workers)
+        blocks = []
+        try:
+            for operand in (self._row_lists(), other._column_lists()):
+                blocks.append(_share(operand))
+            with ProcessPoolExecutor(
+             max_workers=workers, initializer=_start_matmul_worker,
+             initargs=tuple(shared for _, shared in blocks)
+            ) as executor:
+                starts = range(0, height, step)
+                values = []
+                for chunk in executor.map(_matmul_rows, starts, [
+                 start + step for start in starts
+                ]):
+                    values += chunk
+        finally:
+            for block, _ in blocks:
+                if block:
+                    block.close()
+                    block.unlink()
+        return Matrix._view(values, (height, width), (width, 1))
+
+
+    def _row_lists(self):
+        """Returns the rows of the Matrix as new lists, which can be modified
+        without affecting the Matrix.
+
+        :rtype: ``list``"""
+
+        values, offset = self._values, self._offset
+        (height, width), (row_stride, column_stride) = self._shape, self._strides
+        length = (width - 1) * column_stride + 1
+        return [values[
+         start:start + length:column_stride
+        ] for start in range(offset, offset + height * row_stride, row_stride)]
+
+
+    def _row_tuples(self):
+        """Returns the rows of the Matrix as tuples. These are cached until the
+        Matrix is changed in place, so repeatedly multiplying vectors by the
+        same Matrix only needs to read its storage once.
+
+        :rtype: ``list``"""
+
+        if "row_tuples" not in self._cache:
+            self._cache["row_tuples"] = list(map(tuple, self._row_lists()))
+        return self._cache["row_tuples"]
+
+
+    def _column_lists(self):
+        """Returns the columns of the Matrix as new lists, which can be modified
+        without affecting the Matrix.
+
+        :rtype: ``list``"""
+
+        return self.transposed()._row_lists()
+
+
+    def _flat(self):
+        """Returns the values of the Matrix in row-major order. If the Matrix
+        storage is already laid out this way, the storage itself is returned,
+        so the list must not be modified.
+
+        :rtype: ``list``"""
+
+        height, width = self._shape
+        if (self._strides == (width, 1) and self._offset == 0
+         and len(self._values) == height * width):
+            return self._values
+        return [val for row in self._row_lists() for val in row]
+
+
+    def _set_rows(self, rows):
+        """Replaces the Matrix's storage with new storage made from some rows,
+        and discards any cached results, as the Matrix has changed in place.
+
+        :param list rows: the new rows."""
+
+        width = len(rows[0])
+        self._values = [val for row in rows for val in row]
+        self._shape, self._strides = (len(rows), width), (width, 1)
+        self._offset, self._cache = 0, {}
 
 
     def width(self):
@@ -132,7 +886,7 @@ class Matrix:
 
         :rtype: ``int``"""
 
-        return len(self._rows[0])
+        return self._shape[1]
 
 
     def height(self):
@@ -140,7 +894,7 @@ class Matrix:
 
         :rtype: ``int``"""
 
-        return len(self._rows)
+        return self._shape[0]
 
 
     def size(self):
@@ -152,21 +906,29 @@ class Matrix:
 
 
     def rows(self):
-        """Returns the rows of the Matrix.
+        """Returns the rows of the Matrix. Each row is a
+        :py:class:`.MatrixLine` view onto the Matrix, which behaves like a
+        tuple.
 
         :rtype: ``tuple``"""
 
-        return tuple([tuple(row) for row in self._rows])
+        (height, width), (row_stride, column_stride) = self._shape, self._strides
+        return tuple([MatrixLine(
+         self._values, self._offset + i * row_stride, column_stride, width
+        ) for i in range(height)])
 
 
     def columns(self):
-        """Returns the rows of the Matrix.
+        """Returns the columns of the Matrix. Each column is a
+        :py:class:`.MatrixLine` view onto the Matrix, which behaves like a
+        tuple.
 
         :rtype: ``tuple``"""
 
-        return tuple([tuple([
-         row[n] for row in self._rows
-        ]) for n in range(len(self._rows[0]))])
+        (height, width), (row_stride, column_stride) = self._shape, self._strides
+        return tuple([MatrixLine(
+         self._values, self._offset + j * column_stride, row_stride, height
+        ) for j in range(width)])
 
 
     def is_square(self):
@@ -179,11 +941,14 @@ class Matrix:
 
     def transposed(self):
         """Returns a transposed version of the matrix. The matrix calling the
-        method is unaffected.
+        method is unaffected. The new matrix is a view onto the same storage, so
+        no values are copied.
 
         :rtype: ``Matrix``"""
 
-        return Matrix(*map(list, zip(*self._rows)))
+        return Matrix._view(
+         self._values, self._shape[::-1], self._strides[::-1], self._offset
+        )
 
 
     def minor(self, i, j):
@@ -197,10 +962,10 @@ class Matrix:
         if not self.is_square():
             raise ValueError("{} is not square".format(self))
         if self.width() == 2:
-            return self._rows[1-i][1-j]
+            return self[1 - i, 1 - j]
         return Matrix(*[[
          cell for c, cell in enumerate(row) if c != j
-        ] for r, row in enumerate(self.rows()) if r != i]).determinant()
+        ] for r, row in enumerate(self._row_lists()) if r != i]).determinant()
 
 
     def cofactor(self, i, j):
@@ -221,8 +986,8 @@ class Matrix:
         :rtype: ``Matrix``"""
 
         return Matrix(*[[
-         self.minor(i, j) for j in range(len(row))
-        ] for i, row in enumerate(self._rows)])
+         self.minor(i, j) for j in range(self.width())
+        ] for i in range(self.height())])
 
 
     def cofactors(self):
@@ -232,28 +997,93 @@ class Matrix:
         :rtype: ``Matrix``"""
 
         return Matrix(*[[
-         self.cofactor(i, j) for j in range(len(row))
-        ] for i, row in enumerate(self._rows)])
+         self.cofactor(i, j) for j in range(self.width())
+        ] for i in range(self.height())])
 
 
     def determinant(self):
         """Returns the determinant of the matrix - the matrix must be square for
         this to happen.
 
-        The Laplace expansion is used to calculate matrices of three dimensions
-        and above.
+        Matrices of two or three dimensions use the closed form expressions.
+        Larger matrices made entirely of integers or Fractions use the
+        fraction-free Bareiss algorithm, so that the result is exact, and all
+        others use LU decomposition with partial pivoting.
 
         :raises ValueError: if a non-square matrix is given.
         :rtype: ``float``"""
 
         if not self.is_square():
             raise ValueError("{} is not square".format(self))
-        if self.width() == 2:
-            return ((self._rows[0][0] * self._rows[1][1])
-             - (self._rows[0][1] * self._rows[1][0]))
-        else:
-            return sum([cell * self.cofactor(0, index) for index, cell
-             in enumerate(self._rows[0])])
+        rows, size = self._row_lists(), self.width()
+        if size == 1:
+            return rows[0][0]
+        if size == 2:
+            return (rows[0][0] * rows[1][1]) - (rows[0][1] * rows[1][0])
+        if size == 3:
+            (a, b, c), (d, e, f), (g, h, i) = rows
+            return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+        if _is_exact(rows):
+            return _bareiss_determinant(rows)
+        lu, _, sign = _lu_decompose(rows)
+        determinant = sign
+        for k in range(size):
+            determinant *= lu[k][k]
+        return determinant
+
+
+    def lu(self):
+        """Returns the LU decomposition of the matrix, which can be used to
+        solve many systems of linear equations which share this matrix as their
+        coefficients. The decomposition is cached, so calling this again will
+        not factorise the matrix a second time.
+
+        :raises ValueError: if a non-square matrix is given.
+        :rtype: ``LUDecomposition``"""
+
+        if "lu" not in self._cache:
+            self._cache["lu"] = LUDecomposition(self)
+        return self._cache["lu"]
+
+
+    def qr(self, reduced=False):
+        """Returns the QR decomposition of the matrix - an orthogonal matrix Q
+        and an upper triangular matrix R whose product is this matrix. It is
+        found using Householder reflections, and is cached until the matrix is
+        next changed in place.
+
+        The columns of Q are orthonormal, and for a matrix whose columns are
+        linearly independent, the first of them are an orthonormal basis of
+        its column space.
+
+        :param bool reduced: if ``True``, Q will only have as many columns as\
+        the smaller dimension of the matrix, and R that many rows.
+        :returns: Q and R, as ``Matrix`` objects.
+        :rtype: ``tuple``"""
+
+        key = ("qr", bool(reduced))
+        if key not in self._cache:
+            self._cache[key] = _householder_qr(self._row_lists(), reduced)
+        q, r = self._cache[key]
+        return Matrix(*q), Matrix(*r)
+
+
+    def solve(self, b):
+        """Solves the system of linear equations Ax = b, where A is this matrix.
+        If b is a Vector, the solution x will be a Vector - if b is a Matrix,
+        each of its columns is treated as a separate right-hand side and the
+        solutions will be the columns of the returned Matrix.
+
+        The matrix's cached LU decomposition is used, so solving many systems
+        with the same matrix only requires it to be factorised once.
+
+        :param b: The Vector or Matrix of right-hand sides.
+        :raises ValueError: if the matrix is not square or is singular.
+        :raises ValueError: if b has the wrong dimensions.
+        :raises TypeError: if b is not a Vector or Matrix.
+        :rtype: ``Vector`` or ``Matrix``"""
+
+        return self.lu().solve(b)
 
 
     def adjoint(self):
@@ -268,13 +1098,24 @@ class Matrix:
     def inverse(self):
         """Returns the inverse matrix of this matrix.
 
+        Gauss-Jordan elimination is used, carried out exactly if the matrix is
+        made entirely of integers or Fractions. The result is cached until the
+        matrix is next changed in place.
+
         :raises ValueError: if the matrix is not invertible.
         :rtype: ``Matrix``"""
 
-        det = self.determinant()
-        if not det:
-            raise ValueError("{} has no inverse: determinant is 0".format(self))
-        return self.adjoint() * (1 / self.determinant())
+        if "inverse" not in self._cache:
+            if not self.is_square():
+                raise ValueError("{} is not square".format(self))
+            rows, determinant = _gauss_jordan_inverse(self._row_lists())
+            if rows is None:
+                raise ValueError("{} has no inverse: {}".format(
+                 self, "determinant is 0" if determinant == 0
+                 else "singular to within floating point precision"
+                ))
+            self._cache["inverse"] = [[float(val) for val in row] for row in rows]
+        return Matrix(*self._cache["inverse"])
 
 
     def column_space(self):
@@ -286,44 +1127,176 @@ class Matrix:
         return VectorSpan(*[Vector(col) for col in self.columns()])
 
 
-    def rank(self):
-        """The dimensions of the matrix's column space.
+    def column_space_basis(self, exact=None, tolerance=1e-12):
+        """Returns a basis of the matrix's column space - the matrix's own
+        pivot columns, as Vectors.
+
+        :param bool exact: if ``True``, the reduction will be exact - if\
+        ``False``, floats will be used. The default is to decide based on the\
+        values.
+        :param float tolerance: the relative tolerance for treating floats\
+        as zero.
+        :rtype: ``tuple``"""
+
+        rows = self._row_tuples()
+        return tuple(Vector(*[row[c] for row in rows]) for c in self.pivot_columns(
+         exact=exact, tolerance=tolerance
+        ))
+
+
+    def null_space_basis(self, exact=None, tolerance=1e-12):
+        """Returns a basis of the matrix's null space - the vectors x for which
+        Ax = 0. There is one basis Vector for each non-pivot column of the
+        matrix's reduced row echelon form, so a matrix whose columns are
+        linearly independent has an empty basis.
 
+        :param bool exact: if ``True``, the reduction will be exact - if\
+        ``False``, floats will be used. The default is to decide based on the\
+        values.
+        :param float tolerance: the relative tolerance for treating floats\
+        as zero.
+        :rtype: ``tuple``"""
+
+        reduced, pivots, _ = self.rref(exact=exact, tolerance=tolerance)
+        rows, width = reduced._row_tuples(), self.width()
+        basis = []
+        for free in sorted(set(range(width)) - set(pivots)):
+            values = [0.0] * width
+            values[free] = 1.0
+            for row, pivot in zip(rows, pivots):
+                values[pivot] = -row[free] or 0.0
+            basis.append(Vector(*values))
+        return tuple(basis)
+
+
+    def null_space(self, exact=None, tolerance=1e-12):
+        """Returns the null space of the matrix - the set of vectors x for
+        which Ax = 0. If this is just the zero vector, the span of the zero
+        vector is returned.
+
+        :param bool exact: if ``True``, the reduction will be exact - if\
+        ``False``, floats will be used. The default is to decide based on the\
+        values.
+        :param float tolerance: the relative tolerance for treating floats\
+        as zero.
+        :rtype: ``VectorSpan``"""
+
+        basis = self.null_space_basis(exact=exact, tolerance=tolerance)
+        return VectorSpan(*basis) if basis else VectorSpan(
+         Vector(*[0] * self.width())
+        )
+
+
+    def pivot_columns(self, exact=None, tolerance=1e-12):
+        """Returns the indices of the matrix's pivot columns - the columns
+        which hold the leading value of a row once the matrix is in row echelon
+        form. These columns are linearly independent, and together span the
+        column space.
+
+        They are found by reducing a copy of the matrix once - by default
+        exactly if the matrix is made entirely of integers or Fractions, and
+        otherwise using floats, with any value whose magnitude is no more than
+        ``tolerance`` times the largest magnitude in the matrix treated as
+        zero. The result is cached until the matrix is next changed in place.
+
+        :param bool exact: if ``True``, the reduction will be exact - if\
+        ``False``, floats will be used. The default is to decide based on the\
+        values.
+        :param float tolerance: the relative tolerance for treating floats\
+        as zero.
+        :rtype: ``tuple``"""
+
+        if exact is None: exact = _is_exact(self._row_tuples())
+        key = ("pivot_columns", exact, None if exact else tolerance)
+        if key not in self._cache:
+            self._cache[key] = tuple(
+             _pivot_columns(self._row_lists(), exact, tolerance)
+            )
+        return self._cache[key]
+
+
+    def rank(self, exact=None, tolerance=1e-12):
+        """The dimensions of the matrix's column space - the number of its
+        pivot columns.
+
+        :param bool exact: if ``True``, the reduction will be exact - if\
+        ``False``, floats will be used. The default is to decide based on the\
+        values.
+        :param float tolerance: the relative tolerance for treating floats\
+        as zero.
         :rtype: ``int``"""
 
-        return self.column_space().rank()
+        return len(self.pivot_columns(exact=exact, tolerance=tolerance))
 
 
-    def is_full_rank(self):
+    def is_full_rank(self, exact=None, tolerance=1e-12):
         """Checks if the matrix is full rank - that is, whether its rank equals
         the number of dimensions of its column space.
 
+        :param bool exact: if ``True``, the reduction will be exact - if\
+        ``False``, floats will be used. The default is to decide based on the\
+        values.
+        :param float tolerance: the relative tolerance for treating floats\
+        as zero.
         :rtype: ``bool``"""
 
-        return self.rank() == len(self._rows)
+        return self.rank(exact=exact, tolerance=tolerance) == self.height()
 
 
-    def gauss(self):
+    def gauss(self, exact=None, tolerance=1e-12):
         """Performs Gaussian elimination on the matrix, changing it in place,
         and putting it into row echelon form (not *reduced* row echelon form).
+        Partial pivoting is used, and the values are floats once complete.
+
+        By default, matrices made entirely of integers or Fractions are
+        eliminated exactly using Fractions, and all others are eliminated using
+        much faster floating point arithmetic. During floating point
+        elimination, any value whose magnitude is no more than ``tolerance``
+        times the largest magnitude in the matrix is treated as zero.
+
+        This is useful in solving systems of linear equations.
+
+        :param bool exact: if ``True``, Fractions will be used - if ``False``,\
+        floats will be. The default is to decide based on the values.
+        :param float tolerance: the relative tolerance for treating floats\
+        as zero."""
+
+        rows = self._row_lists()
+        if exact is None: exact = _is_exact(rows)
+        rows, _ = _row_echelon(rows, exact, tolerance)
+        self._set_rows([[float(val) for val in row] for row in rows])
+
+
+    def rref(self, exact=None, tolerance=1e-12):
+        """Returns the reduced row echelon form of the matrix, along with its
+        pivot columns and rank, all from one elimination. Unlike
+        :py:meth:`gauss`, the matrix itself is not changed.
+
+        By default, matrices made entirely of integers or Fractions are
+        eliminated exactly, and all others using floating point arithmetic,
+        with any value whose magnitude is no more than ``tolerance`` times the
+        largest magnitude in the matrix treated as zero. The values of the
+        returned Matrix are floats either way. The result is cached until the
+        matrix is next changed in place.
+
+        :param bool exact: if ``True``, Fractions will be used - if ``False``,\
+        floats will be. The default is to decide based on the values.
+        :param float tolerance: the relative tolerance for treating floats\
+        as zero.
+        :returns: the reduced ``Matrix``, the pivot columns as a ``tuple``,\
+        and the rank.
+        :rtype: ``tuple``"""
 
-        This is useful in solving systems of linear equations."""
-
-        r, c = 0, 0
-        while r < len(self._rows) and c < len(self._rows[0]):
-            mx = max([[i, abs(self._rows[i][c])]
-             for i in range(r, len(self._rows))], key=lambda x: x[1])[0]
-            if self._rows[mx][c] == 0:
-                c += 1
-            else:
-                self._rows[r], self._rows[mx] = self._rows[mx], self._rows[r]
-            for i in range(r + 1, len(self._rows)):
-                f = Fraction(self._rows[i][c]) / Fraction(self._rows[r][c])
-                self._rows[i][c] = 0
-                for j in range(c + 1, len(self._rows[0])):
-                    self._rows[i][j] -= self._rows[c][j] * f
-            r, c = r + 1, c + 1
-        self._rows = [[float(val) for val in row] for row in self._rows]
+        if exact is None: exact = _is_exact(self._row_tuples())
+        key = ("rref", exact, None if exact else tolerance)
+        if key not in self._cache:
+            rows, pivots = _reduced_row_echelon(
+             self._row_lists(), exact, tolerance
+            )
+            self._cache[key] = [[float(val) for val in row] for row in rows]
+            self._cache[("pivot_columns",) + key[1:]] = tuple(pivots)
+        pivots = self._cache[("pivot_columns",) + key[1:]]
+        return Matrix(*self._cache[key]), pivots, len(pivots)
 
 
     def is_row_echelon(self):
@@ -332,7 +1305,7 @@ class Matrix:
         :rtype: ``bool``"""
 
         in_zero, lead = False, -1
-        for row in self._rows:
+        for row in self._row_lists():
             if set(row) == {0}:
                 in_zero = True
             else:
@@ -349,13 +1322,227 @@ class Matrix:
         :rtype: ``bool``"""
 
         if not self.is_row_echelon(): return False
-        for row in self._rows:
+        rows = self._row_lists()
+        for row in rows:
             if set(row) != {0}:
                 for i, val in enumerate(row):
                     if val != 0:
                         if val != 1: return False
-                        column = [row[i] for row in self._rows]
+                        column = [row[i] for row in rows]
                         if set(column) != {1, 0}: return False
                         if column.count(1) != 1: return False
                         break
         return True
+
+
+
+class LUDecomposition:
+    """An LUDecomposition is the factorisation of a square Matrix A into a
+    lower triangular matrix L and an upper triangular matrix U such that
+    PA = LU, where P is a permutation matrix recording the row swaps made by
+    partial pivoting.
+
+    Once created, it can be used to solve any number of systems of linear
+    equations with A as their coefficients, each costing O(n²) rather than the
+    O(n³) of a fresh elimination. You would normally get one from
+    :py:meth:`.Matrix.lu` rather than creating it directly.
+
+    :param Matrix matrix: The Matrix to factorise.
+    :raises ValueError: if a non-square matrix is given."""
+
+    def __init__(self, matrix):
+        if not matrix.is_square():
+            raise ValueError("{} is not square".format(matrix))
+        self._lu, self._permutation, self._sign = _lu_decompose(
+         matrix._row_lists()
+        )
+        rows = matrix._row_tuples()
+        self._singular = any(_negligible(
+         row[k], max(map(abs, rows[original])), len(self._lu)
+        ) for k, (row, original) in enumerate(zip(self._lu, self._permutation)))
+
+
+    def __repr__(self):
+        return "<LUDecomposition of {0}×{0} Matrix>".format(len(self._lu))
+
+
+    def lower(self):
+        """Returns the lower triangular factor L, whose diagonal is all ones.
+
+        :rtype: ``Matrix``"""
+
+        return Matrix(*[[
+         val if c < r else 1 if c == r else 0 for c, val in enumerate(row)
+        ] for r, row in enumerate(self._lu)])
+
+
+    def upper(self):
+        """Returns the upper triangular factor U.
+
+        :rtype: ``Matrix``"""
+
+        return Matrix(*[[
+         val if c >= r else 0 for c, val in enumerate(row)
+        ] for r, row in enumerate(self._lu)])
+
+
+    def permutation(self):
+        """Returns the permutation matrix P.
+
+        :rtype: ``Matrix``"""
+
+        size = len(self._lu)
+        return Matrix(*[[
+         1 if c == p else 0 for c in range(size)
+        ] for p in self._permutation])
+
+
+    def is_singular(self):
+        """Checks if the factorised matrix is singular (to within floating point
+        precision), in which case there are no unique solutions to solve for.
+
+        :rtype: ``bool``"""
+
+        return self._singular
+
+
+    def determinant(self):
+        """Returns the determinant of the factorised matrix - the product of
+        U's diagonal, negated if an odd number of row swaps were made.
+
+        :rtype: ``float``"""
+
+        determinant = self._sign
+        for k, row in enumerate(self._lu):
+            determinant *= row[k]
+        return determinant
+
+
+    def _solve_values(self, values):
+        """Solves the system for one right-hand side, using forward and back
+        substitution.
+
+        :param values: the right-hand side values.
+        :rtype: ``list``"""
+
+        lu = self._lu
+        x = [float(values[p]) for p in self._permutation]
+        for i in range(1, len(lu)):
+            x[i] -= sum(map(mul, lu[i][:i], x[:i]))
+        for i in reversed(range(len(lu))):
+            row = lu[i]
+            x[i] = (x[i] - sum(map(mul, row[i + 1:], x[i + 1:]))) / row[i]
+        return x
+
+
+    def solve(self, b):
+        """Solves the system of linear equations Ax = b, where A is the
+        factorised matrix. If b is a Vector, the solution x will be a Vector -
+        if b is a Matrix, each of its columns is treated as a separate
+        right-hand side and the solutions will be the columns of the returned
+        Matrix.
+
+        :param b: The Vector or Matrix of right-hand sides.
+        :raises ValueError: if the matrix is singular.
+        :raises ValueError: if b has the wrong dimensions.
+        :raises TypeError: if b is not a Vector or Matrix.
+        :rtype: ``Vector`` or ``Matrix``"""
+
+        if isinstance(b, Vector):
+            if len(b) != len(self._lu):
+                raise ValueError("{} is the wrong dimension".format(b))
+        elif isinstance(b, Matrix):
+            if b.height() != len(self._lu):
+                raise ValueError("{} is the wrong dimension".format(b))
+        else:
+            raise TypeError("{} is not a Vector or Matrix".format(b))
+        if self._singular:
+            raise ValueError("Cannot solve - matrix is singular")
+        if isinstance(b, Vector):
+            return Vector(self._solve_values(b.values()))
+        return Matrix(
+         *[self._solve_values(col) for col in b.columns()], columns=True
+        )
+
+
+
+class CondensedMatrix:
+    """A CondensedMatrix is a square, symmetric Matrix with zeros on its
+    diagonal - such as a matrix of the distances between every pair of a set of
+    things. Only the values above the diagonal are stored, in a flat array of
+    floats in row order, which takes half the memory of the full matrix.
+
+    Values are looked up in constant time by ``(row, column)`` indices, in
+    either order.
+
+    :param int size: The number of rows (and columns) of the full matrix.
+    :param values: The values above the diagonal, in row order. If not given,\
+    they will all be zero.
+    :raises ValueError: if the size is not a non-negative integer.
+    :raises ValueError: if the wrong number of values is given."""
+
+    __slots__ = ("_size", "_values")
+
+    def __init__(self, size, values=None):
+        if not isinstance(size, int) or size < 0:
+            raise ValueError("{} is not a valid size".format(size))
+        count = size * (size - 1) // 2
+        if values is None:
+            values = array("d", bytes(count * 8))
+        elif not isinstance(values, array):
+            values = array("d", values)
+        if len(values) != count:
+            raise ValueError("A {0}×{0} CondensedMatrix needs {1} values".format(
+             size, count
+            ))
+        self._size, self._values = size, values
+
+
+    def __repr__(self):
+        return "<CondensedMatrix {0}×{0}>".format(self._size)
+
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple) or len(key) != 2:
+            raise TypeError("CondensedMatrix indices must be (row, column) pairs")
+        i, j = [index + self._size if index < 0 else index for index in key]
+        if not (0 <= i < self._size and 0 <= j < self._size):
+            raise IndexError("{} is out of range".format(key))
+        if i == j: return 0.0
+        if i > j: i, j = j, i
+        return self._values[self._size * i - i * (i + 1) // 2 + j - i - 1]
+
+
+    def size(self):
+        """Returns the dimensions of the full matrix.
+
+        :rtype: ``tuple``"""
+
+        return (self._size, self._size)
+
+
+    def values(self):
+        """Returns the stored values - those above the diagonal, in row order.
+
+        :rtype: ``tuple``"""
+
+        return tuple(self._values)
+
+
+    def row(self, i):
+        """Returns one row of the full matrix.
+
+        :param int i: The index of the row.
+        :raises IndexError: if the row doesn't exist.
+        :rtype: ``list``"""
+
+        return [self[i, j] for j in range(self._size)]
+
+
+    def matrix(self):
+        """Expands the CondensedMatrix into a full :py:class:`.Matrix`.
+
+        :raises ValueError: if the CondensedMatrix is empty.
+        :rtype: ``Matrix``"""
+
+        return Matrix(*[self.row(i) for i in range(self._size)])
@@ -0,0 +1,258 @@
+"""Contains the Quaternion class."""
+
+from math import sqrt, sin, cos, acos, atan2, radians
+from .vectors import Vector
+from .matrices import Matrix
+from .geometry import Transform, _quaternion_rotation
+
+class Quaternion:
+    """A Quaternion is a four part number ``w + xi + yj + zk``. Unit
+    quaternions represent rotations in three dimensional space, and are a more
+    compact and numerically stable way of composing rotations than rotation
+    matrices - combining two rotations with ``*`` takes 16 multiplications
+    rather than the 27 needed to multiply two 3×3 matrices, and the result is
+    easily renormalised to remove accumulated rounding errors.
+
+    ``q2 * q1`` is the rotation ``q1`` followed by ``q2``, matching the order
+    used when composing a :py:class:`.Transform` with ``@``.
+
+    :param w: The real (scalar) part.
+    :param x: The i component.
+    :param y: The j component.
+    :param z: The k component."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, w=1, x=0, y=0, z=0):
+        self._values = (w, x, y, z)
+
+
+    def __repr__(self):
+        return "<Quaternion {}>".format(list(self._values))
+
+
+    def __eq__(self, other):
+        return isinstance(other, Quaternion) and self._values == other._values
+
+
+    def __hash__(self):
+        return hash(self._values)
+
+
+    def __iter__(self):
+        return iter(self._values)
+
+
+    def __mul__(self, other):
+        if not isinstance(other, Quaternion):
+            if not isinstance(other, (int, float)):
+                raise TypeError(
+                 "{} isn't numeric - Quaternion * operator needs scalars or "
+                 "Quaternions".format(other)
+                )
+            return Quaternion(*[val * other for val in self._values])
+        w1, x1, y1, z1 = self._values
+        w2, x2, y2, z2 = other._values
+        return Quaternion(
+         w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+         w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+         w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+         w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
+        )
+
+
+    def __rmul__(self, other):
+        return self * other
+
+
+    @staticmethod
+    def from_axis_angle(axis, angle, degrees=False):
+        """Creates a unit Quaternion representing a rotation about some axis
+        through the origin.
+
+        :param axis: A 3D vector pointing along the axis of rotation.
+        :param float angle: The angle in radians.
+        :param bool degrees: if ``True``, the angle given will be interpreted\
+        as being in degrees, not radians.
+        :raises ValueError: if the axis is not a non-zero 3D vector.
+        :rtype: ``Quaternion``"""
+
+        if degrees: angle = radians(angle)
+        try:
+            x, y, z = axis
+            length = sqrt(x * x + y * y + z * z)
+        except (TypeError, ValueError):
+            raise ValueError("{} is not a valid axis".format(axis))
+        if not length:
+            raise ValueError("Cannot rotate about zero vector {}".format(axis))
+        s = sin(angle / 2) / length
+        return Quaternion(cos(angle / 2), x * s, y * s, z * s)
+
+
+    @staticmethod
+    def from_matrix(matrix):
+        """Creates a unit Quaternion from a rotation matrix - either a 3×3
+        matrix or the 4×4 homogeneous matrix of a rotation :py:class:`.Transform`
+        (in which case any translation is ignored).
+
+        :param Matrix matrix: The rotation matrix.
+        :raises TypeError: if a non-Matrix is given.
+        :raises ValueError: if the Matrix is the wrong size.
+        :rtype: ``Quaternion``"""
+
+        if not isinstance(matrix, Matrix):
+            raise TypeError("{} is not a Matrix".format(matrix))
+        if matrix.size() not in ((3, 3), (4, 4)):
+            raise ValueError("{} is not a 3×3 or 4×4 Matrix".format(matrix))
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = [
+         row[:3] for row in matrix._row_tuples()[:3]
+        ]
+        trace = m00 + m11 + m22
+        if trace > 0:
+            s = 2 * sqrt(trace + 1)
+            quaternion = Quaternion(
+             s / 4, (m21 - m12) / s, (m02 - m20) / s, (m10 - m01) / s
+            )
+        elif m00 > m11 and m00 > m22:
+            s = 2 * sqrt(1 + m00 - m11 - m22)
+            quaternion = Quaternion(
+             (m21 - m12) / s, s / 4, (m01 + m10) / s, (m02 + m20) / s
+            )
+        elif m11 > m22:
+            s = 2 * sqrt(1 + m11 - m00 - m22)
+            quaternion = Quaternion(
+             (m02 - m20) / s, (m01 + m10) / s, s / 4, (m12 + m21) / s
+            )
+        else:
+            s = 2 * sqrt(1 + m22 - m00 - m11)
+            quaternion = Quaternion(
+             (m10 - m01) / s, (m02 + m20) / s, (m12 + m21) / s, s / 4
+            )
+        return quaternion.normalized()
+
+
+    def values(self):
+        """Returns the four parts of the Quaternion, as ``(w, x, y, z)``.
+
+        :rtype: ``tuple``"""
+
+        return self._values
+
+
+    def magnitude(self):
+        """Returns the magnitude (norm) of the Quaternion. Quaternions which
+        represent rotations have magnitude 1.
+
+        :rtype: ``float``"""
+
+        return sqrt(sum(val * val for val in self._values))
+
+
+    def normalized(self):
+        """Returns a unit Quaternion pointing in the same direction as this
+        one. Renormalising after many compositions removes the drift that
+        rounding errors would otherwise introduce.
+
+        :raises ValueError: if the Quaternion is zero.
+        :rtype: ``Quaternion``"""
+
+        magnitude = self.magnitude()
+        if not magnitude:
+            raise ValueError("Cannot normalize zero Quaternion")
+        return Quaternion(*[val / magnitude for val in self._values])
+
+
+    def conjugate(self):
+        """Returns the conjugate of the Quaternion. For a unit Quaternion this
+        is also its inverse - the opposite rotation.
+
+        :rtype: ``Quaternion``"""
+
+        w, x, y, z = self._values
+        return Quaternion(w, -x, -y, -z)
+
+
+    def axis_angle(self):
+        """Returns the rotation the Quaternion represents, as a unit axis
+        :py:class:`.Vector` and an angle in radians between 0 and 2π. If there
+        is no rotation, the x axis is returned as the axis.
+
+        :raises ValueError: if the Quaternion is zero.
+        :rtype: ``tuple``"""
+
+        w, x, y, z = self.normalized()._values
+        length = sqrt(x * x + y * y + z * z)
+        if not length: return Vector(1.0, 0.0, 0.0), 0.0
+        return (
+         Vector(x / length, y / length, z / length), 2 * atan2(length, w)
+        )
+
+
+    def _rotation_rows(self):
+        """Returns the rows of the 3×3 rotation matrix of the Quaternion. The
+        Quaternion doesn't need to be a unit Quaternion.
+
+        :raises ValueError: if the Quaternion is zero.
+        :rtype: ``list``"""
+
+        if not any(self._values):
+            raise ValueError("Zero Quaternion is not a rotation")
+        return _quaternion_rotation(*self._values)
+
+
+    def matrix(self):
+        """Returns the 3×3 rotation :py:class:`.Matrix` of the Quaternion.
+
+        :raises ValueError: if the Quaternion is zero.
+        :rtype: ``Matrix``"""
+
+        return Matrix(*self._rotation_rows())
+
+
+    def transform(self):
+        """Returns a :py:class:`.Transform` which performs the rotation, so
+        that it can be combined with translations and scalings.
+
+        :raises ValueError: if the Quaternion is zero.
+        :rtype: ``Transform``"""
+
+        return Transform(3)._then(self._rotation_rows(), [0, 0, 0])
+
+
+    def apply(self, *vectors):
+        """Rotates some 3D vectors about the origin, changing them in place.
+        The rotation matrix is built once and applied to every vector in a
+        single pass, and VectorArrays can be given as well as Vectors.
+
+        :param \*vectors: The vectors to rotate.
+        :raises TypeError: if non-vectors are given.
+        :raises ValueError: if the vectors are not 3D."""
+
+        self.transform().apply(*vectors)
+
+
+    def slerp(self, other, t):
+        """Spherically interpolates between this rotation and another, giving
+        the rotation a fraction ``t`` of the way along the shortest arc between
+        them at constant angular speed.
+
+        :param Quaternion other: The rotation to interpolate towards.
+        :param float t: How far to go - 0 is this rotation, 1 is the other.
+        :raises TypeError: if a non-Quaternion is given.
+        :raises ValueError: if either Quaternion is zero.
+        :rtype: ``Quaternion``"""
+
+        if not isinstance(other, Quaternion):
+            raise TypeError("{} is not a Quaternion".format(other))
+        start, end = self.normalized()._values, other.normalized()._values
+        dot = sum(a * b for a, b in zip(start, end))
+        if dot < 0:
+            end, dot = [-val for val in end], -dot
+        if dot > 0.9995:
+            return Quaternion(*[
+             a + (b - a) * t for a, b in zip(start, end)
+            ]).normalized()
+        theta = acos(dot)
+        s1, s2 = sin((1 - t) * theta), sin(t * theta)
+        s = sin(theta)
+        return Quaternion(*[(a * s1 + b * s2) / s for a, b in zip(start, end)])
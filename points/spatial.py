@@ -0,0 +1,386 @@
+"""Contains tools for finding vectors which are close to each other in space."""
+
+from array import array
+from heapq import heappush, heappushpop
+from itertools import product
+from math import sqrt, floor
+from .vectors import Vector, VectorArray
+from .matrices import Matrix, CondensedMatrix
+
+KDTREE_LEAF_SIZE = 8
+"""The number of vectors at and below which a part of a :py:class:`KDTree`
+is searched by checking each vector rather than being divided further."""
+
+class KDTree:
+    """A KDTree is an index of a fixed set of vectors, which can quickly find
+    the vectors nearest to any point, or all of those within some distance of
+    it. Finding them by checking every vector takes time proportional to the
+    number of vectors - with a KDTree it takes time proportional to its
+    logarithm, on average.
+
+    The tree is built in one go by repeatedly splitting the vectors at the
+    median of whichever axis they are most spread out along. It can be built
+    from a sequence of :py:class:`.Vector` objects, from a
+    :py:class:`.VectorArray`, or from plain sequences of coordinates, and it
+    does not keep references to the vectors themselves - changing them after
+    the tree is built will not update it.
+
+    Query results identify vectors by their position in the sequence the tree
+    was built from.
+
+    :param vectors: The vectors to index.
+    :raises ValueError: if there are no vectors.
+    :raises ValueError: if the vectors are of different dimensions."""
+
+    __slots__ = ("_points", "_indices", "_axes", "_dimension")
+
+    def __init__(self, vectors):
+        points = _points(vectors)
+        if not points:
+            raise ValueError("Cannot make KDTree with no vectors")
+        dimension, count = len(points[0]), len(points)
+        order, axes, stack = list(range(count)), [0] * count, [(0, count)]
+        while stack:
+            start, stop = stack.pop()
+            if stop - start <= KDTREE_LEAF_SIZE: continue
+            segment = order[start:stop]
+            axis = max(range(dimension), key=lambda a: _spread(
+             [points[i][a] for i in segment]
+            ))
+            segment.sort(key=lambda i: points[i][axis])
+            order[start:stop] = segment
+            middle = (start + stop) // 2
+            axes[middle] = axis
+            stack += [(start, middle), (middle + 1, stop)]
+        self._points = [points[i] for i in order]
+        self._indices, self._axes, self._dimension = order, axes, dimension
+
+
+    def __repr__(self):
+        return "<KDTree - {} Vectors, {} dimensions>".format(
+         len(self), self._dimension
+        )
+
+
+    def __len__(self):
+        return len(self._points)
+
+
+    def dimension(self):
+        """Returns the dimension of the vectors in the tree.
+
+        :rtype: ``int``"""
+
+        return self._dimension
+
+
+    def nearest(self, vector, k=1):
+        """Finds the vectors in the tree nearest to some point.
+
+        :param vector: The point - a Vector or sequence of coordinates.
+        :param int k: The number of vectors to find.
+        :raises ValueError: if the point is the wrong dimension.
+        :raises ValueError: if k is not positive.
+        :returns: ``(index, distance)`` pairs for the nearest vectors, nearest\
+        first (and in order of index when equally near).
+        :rtype: ``list``"""
+
+        point = self._point(vector)
+        if k < 1:
+            raise ValueError("{} is not a valid number of vectors".format(k))
+        points, axes, heap = self._points, self._axes, []
+
+        def search(start, stop):
+            if stop - start <= KDTREE_LEAF_SIZE:
+                positions, middle = range(start, stop), None
+            else:
+                middle = (start + stop) // 2
+                positions = (middle,)
+            for position in positions:
+                distance = _squared_distance(point, points[position])
+                if len(heap) < k:
+                    heappush(heap, (-distance, position))
+                elif distance < -heap[0][0]:
+                    heappushpop(heap, (-distance, position))
+            if middle is None: return
+            difference = point[axes[middle]] - points[middle][axes[middle]]
+            if difference < 0:
+                near, far = (start, middle), (middle + 1, stop)
+            else:
+                near, far = (middle + 1, stop), (start, middle)
+            search(*near)
+            if len(heap) < k or difference * difference < -heap[0][0]:
+                search(*far)
+
+        search(0, len(points))
+        return [(index, sqrt(distance)) for distance, index in sorted(
+         (-distance, self._indices[position]) for distance, position in heap
+        )]
+
+
+    def within(self, vector, radius):
+        """Finds all the vectors in the tree within some distance of a point.
+
+        :param vector: The point - a Vector or sequence of coordinates.
+        :param float radius: The distance to search within (inclusive).
+        :raises ValueError: if the point is the wrong dimension.
+        :returns: ``(index, distance)`` pairs for the vectors found, nearest\
+        first (and in order of index when equally near).
+        :rtype: ``list``"""
+
+        point = self._point(vector)
+        points, axes, limit, found = self._points, self._axes, radius ** 2, []
+        stack = [(0, len(points))] if radius >= 0 else []
+        while stack:
+            start, stop = stack.pop()
+            if stop - start <= KDTREE_LEAF_SIZE:
+                positions, middle = range(start, stop), None
+            else:
+                middle = (start + stop) // 2
+                positions = (middle,)
+            for position in positions:
+                distance = _squared_distance(point, points[position])
+                if distance <= limit:
+                    found.append((distance, self._indices[position]))
+            if middle is None: continue
+            difference = point[axes[middle]] - points[middle][axes[middle]]
+            if difference <= 0 or difference * difference <= limit:
+                stack.append((start, middle))
+            if difference >= 0 or difference * difference <= limit:
+                stack.append((middle + 1, stop))
+        return [(index, sqrt(distance)) for distance, index in sorted(found)]
+
+
+    def _point(self, vector):
+        """Gets the coordinates of a query point, checking its dimension.
+
+        :param vector: a Vector or sequence of coordinates.
+        :raises ValueError: if the point is the wrong dimension.
+        :rtype: ``tuple``"""
+
+        point = tuple(vector._values if isinstance(vector, Vector) else vector)
+        if len(point) != self._dimension:
+            raise ValueError("{} is not {}D".format(vector, self._dimension))
+        return point
+
+
+def find_pairs_within(vectors, cutoff):
+    """Finds every pair of vectors in a set which are within some distance of
+    each other.
+
+    Rather than checking every pair, space is divided into a grid of cubic
+    cells as wide as the cutoff (a cell list), and each vector is only checked
+    against the vectors in its own and neighbouring cells. For vectors spread
+    through space at a roughly even density this takes time proportional to
+    the number of vectors, rather than to its square.
+
+    :param vectors: The vectors - a VectorArray, or sequence of Vectors or\
+    coordinates.
+    :param float cutoff: The distance to search within (inclusive).
+    :raises ValueError: if the cutoff is not positive.
+    :raises ValueError: if the vectors are of different dimensions.
+    :returns: ``(i, j, distance)`` for every pair found, where ``i < j`` are\
+    the positions of the two vectors, in order of ``i`` and then ``j``.
+    :rtype: ``list``"""
+
+    points = _points(vectors)
+    if cutoff <= 0:
+        raise ValueError("Cutoff {} is not positive".format(cutoff))
+    if not points: return []
+    cells, limit, pairs = _cells(points, cutoff), cutoff * cutoff, []
+    offsets = [offset for offset in product(
+     (-1, 0, 1), repeat=len(points[0])
+    ) if offset > (0,) * len(offset)]
+    for cell, members in cells.items():
+        for n, i in enumerate(members):
+            for j, distance in _close(points[i], members[n + 1:], points, limit):
+                pairs.append((i, j, sqrt(distance)))
+        for offset in offsets:
+            neighbours = cells.get(tuple(map(sum, zip(cell, offset))))
+            if not neighbours: continue
+            for i in members:
+                for j, distance in _close(points[i], neighbours, points, limit):
+                    pairs.append((i, j, sqrt(distance)) if i < j
+                     else (j, i, sqrt(distance)))
+    pairs.sort()
+    return pairs
+
+
+def find_contacts(vectors1, vectors2, cutoff):
+    """Finds every pair of vectors, one from each of two sets, which are within
+    some distance of each other. Like :py:func:`find_pairs_within`, this uses
+    a cell list built over the second set rather than checking every pair.
+
+    :param vectors1: The first set of vectors - a VectorArray, or sequence of\
+    Vectors or coordinates.
+    :param vectors2: The second set of vectors, in the same form.
+    :param float cutoff: The distance to search within (inclusive).
+    :raises ValueError: if the cutoff is not positive.
+    :raises ValueError: if the vectors are of different dimensions.
+    :returns: ``(i, j, distance)`` for every pair found, where ``i`` is the\
+    position of a vector in the first set and ``j`` in the second, in order of\
+    ``i`` and then ``j``.
+    :rtype: ``list``"""
+
+    points1, points2 = _points(vectors1), _points(vectors2)
+    if cutoff <= 0:
+        raise ValueError("Cutoff {} is not positive".format(cutoff))
+    if not points1 or not points2: return []
+    if len(points1[0]) != len(points2[0]):
+        raise ValueError("Vectors must all have the same dimension")
+    cells, limit, contacts = _cells(points2, cutoff), cutoff * cutoff, []
+    offsets = list(product((-1, 0, 1), repeat=len(points1[0])))
+    for i, point in enumerate(points1):
+        cell = _cell(point, cutoff)
+        for offset in offsets:
+            neighbours = cells.get(tuple(map(sum, zip(cell, offset))))
+            if not neighbours: continue
+            for j, distance in _close(point, neighbours, points2, limit):
+                contacts.append((i, j, sqrt(distance)))
+    contacts.sort()
+    return contacts
+
+
+def distance_matrix(vectors):
+    """Calculates the distance between every pair of vectors in a set.
+
+    As the distances are symmetric, with zeros on the diagonal, they are
+    returned as a :py:class:`.CondensedMatrix`, which stores each distance once
+    as a float in a flat array, and where ``result[i, j]`` is the distance
+    between vectors ``i`` and ``j``.
+
+    :param vectors: The vectors - a VectorArray, or sequence of Vectors or\
+    coordinates.
+    :raises ValueError: if the vectors are of different dimensions.
+    :rtype: ``CondensedMatrix``"""
+
+    points, values = _points(vectors), array("d")
+    for i, point in enumerate(points):
+        values.extend(_distances(point, points[i + 1:]))
+    return CondensedMatrix(len(points), values)
+
+
+def cdist(vectors1, vectors2):
+    """Calculates the distance between every vector in one set and every
+    vector in another.
+
+    :param vectors1: The first set of vectors - a VectorArray, or sequence of\
+    Vectors or coordinates.
+    :param vectors2: The second set of vectors, in the same form.
+    :raises ValueError: if either set is empty.
+    :raises ValueError: if the vectors are of different dimensions.
+    :returns: a Matrix where the value at ``(i, j)`` is the distance between\
+    vector ``i`` of the first set and vector ``j`` of the second.
+    :rtype: ``Matrix``"""
+
+    points1, points2 = _points(vectors1), _points(vectors2)
+    if not points1 or not points2:
+        raise ValueError("Cannot find distances between empty sets")
+    if len(points1[0]) != len(points2[0]):
+        raise ValueError("Vectors must all have the same dimension")
+    values = []
+    for point in points1:
+        values += _distances(point, points2)
+    width = len(points2)
+    return Matrix._view(values, (len(points1), width), (width, 1))
+
+
+def _distances(point, others):
+    """Returns the distances from a point to each of some other points. Three
+    dimensional points are handled without any intermediate objects.
+
+    :param tuple point: the point.
+    :param list others: the other points.
+    :rtype: ``list``"""
+
+    if len(point) == 3:
+        x, y, z = point
+        return [
+         sqrt((x - a) * (x - a) + (y - b) * (y - b) + (z - c) * (z - c))
+         for a, b, c in others
+        ]
+    return [sqrt(_squared_distance(point, other)) for other in others]
+
+
+def _close(point, candidates, points, limit):
+    """Yields those of some candidate points which are within some distance of
+    a point. Three dimensional points are handled without any intermediate
+    objects, as they are by far the most common.
+
+    :param tuple point: the point.
+    :param list candidates: the positions of the candidates in ``points``.
+    :param list points: the points the candidates are taken from.
+    :param float limit: the square of the distance to search within.
+    :returns: the position and squared distance of each point found."""
+
+    if len(point) == 3:
+        x, y, z = point
+        for j in candidates:
+            a, b, c = points[j]
+            distance = (x - a) * (x - a) + (y - b) * (y - b) + (z - c) * (z - c)
+            if distance <= limit: yield j, distance
+    else:
+        for j in candidates:
+            distance = _squared_distance(point, points[j])
+            if distance <= limit: yield j, distance
+
+
+def _cells(points, size):
+    """Sorts some points into the cubic cells of a grid.
+
+    :param list points: the points.
+    :param float size: the width of the cells.
+    :returns: the positions of the points in each occupied cell, keyed by the\
+    cell's grid coordinates.
+    :rtype: ``dict``"""
+
+    cells = {}
+    for index, point in enumerate(points):
+        cells.setdefault(_cell(point, size), []).append(index)
+    return cells
+
+
+def _cell(point, size):
+    """Returns the grid coordinates of the cell a point lies in.
+
+    :param tuple point: the point.
+    :param float size: the width of the cells.
+    :rtype: ``tuple``"""
+
+    return tuple(floor(val / size) for val in point)
+
+
+def _points(vectors):
+    """Gets the coordinates of some vectors as a list of tuples, checking that
+    they all have the same dimension.
+
+    :param vectors: a VectorArray, or sequence of Vectors or coordinates.
+    :raises ValueError: if the vectors are of different dimensions.
+    :rtype: ``list``"""
+
+    if isinstance(vectors, VectorArray): return list(vectors._groups())
+    points = [tuple(
+     vector._values if isinstance(vector, Vector) else vector
+    ) for vector in vectors]
+    if points and any(len(point) != len(points[0]) for point in points):
+        raise ValueError("Vectors must all have the same dimension")
+    return points
+
+
+def _spread(values):
+    """Returns the difference between the largest and smallest of some values.
+
+    :param list values: the values.
+    :rtype: ``float``"""
+
+    return max(values) - min(values)
+
+
+def _squared_distance(point1, point2):
+    """Returns the square of the distance between two points.
+
+    :param tuple point1: the first point.
+    :param tuple point2: the second point.
+    :rtype: ``float``"""
+
+    return sum((a - b) * (a - b) for a, b in zip(point1, point2))
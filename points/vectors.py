@@ -2,6 +2,14 @@
 
 import math
 from math import sqrt, acos, pi
+from operator import add, sub, mul
+from array import array
+from fractions import Fraction
+
+SPAN_TOLERANCE = 1e-12
+"""When a :py:class:`.VectorSpan` is reduced using floats, any value whose
+magnitude is no more than this times the largest magnitude in the vector being
+reduced is treated as zero."""
 
 class Vector:
     """A Vector is a sequence of numbers. They can represent a point in space,
@@ -11,25 +19,33 @@ class Vector:
     reserved for scalar multiplication - you can use it to multiply the vector
     by a number but not by another vector (there are special methods for this).
 
+    By default the values are held in a ``list``, which can hold any kind of
+    number. If ``compact`` is ``True`` they are instead held in a typed
+    ``array`` of floats, which takes up several times less memory - useful
+    when creating very large numbers of Vectors. Vectors derived from a compact
+    Vector (by addition, scaling etc.) will also be compact.
+
     :param values: The numbers that make up the Vector. If a single sequence is\
-    given, that sequence will be unpacked to make the vector."""
+    given, that sequence will be unpacked to make the vector.
+    :param bool compact: if ``True``, the values will be stored as floats in a\
+    compact array."""
 
-    def __init__(self, *values):
+    __slots__ = ("_values",)
+
+    def __init__(self, *values, compact=False):
         if len(values) == 1:
             try:
-                self._values = list(values[0])
-                return
-            except: pass
-        self._values = list(values)
+                values = iter(values[0])
+            except TypeError: pass
+        self._values = array("d", values) if compact else list(values)
 
 
     def __repr__(self):
-        return "<Vector {}>".format(self._values)
+        return "<Vector {}>".format(list(self._values))
 
 
     def __str__(self):
         if len(self._values) >= 10:
-            values = self._values[:2] + [] + self._values[-2:]
             return "<Vector [{}, {}, (...{} items omitted...), {}, {}]>".format(
              self._values[0], self._values[1], len(self._values) - 4,
              self._values[-2], self._values[-1]
@@ -57,12 +73,22 @@ class Vector:
         return len(self._values)
 
 
+    def __getstate__(self):
+        if isinstance(self._values, memoryview):
+            return array("d", self._values)
+        return self._values
+
+
+    def __setstate__(self, values):
+        self._values = values
+
+
     def __add__(self, other):
         if not isinstance(other, Vector):
             raise TypeError("Cannot add {} - not a Vector".format(other))
         if len(self) != len(other):
             raise ValueError("Cannot add {} - unequal length".format(other))
-        return Vector(v1 + v2 for v1, v2 in zip(self._values, other._values))
+        return self._new(v1 + v2 for v1, v2 in zip(self._values, other._values))
 
 
     def __sub__(self, other):
@@ -70,20 +96,30 @@ class Vector:
             raise TypeError("Cannot subtract {} - not a Vector".format(other))
         if len(self) != len(other):
             raise ValueError("Cannot subtract {} - unequal length".format(other))
-        return Vector(v1 - v2 for v1, v2 in zip(self._values, other._values))
+        return self._new(v1 - v2 for v1, v2 in zip(self._values, other._values))
 
 
     def __mul__(self, other):
         if isinstance(other, Vector):
             raise TypeError("'*' is reserved for scalar multiplication")
         else:
-            return Vector([v * other for v in self._values])
+            return self._new([v * other for v in self._values])
 
 
     def __rmul__(self, other):
         return self * other
 
 
+    def _new(self, values):
+        """Creates a new Vector from some values, using the same kind of
+        storage as this Vector.
+
+        :param values: the values of the new Vector.
+        :rtype: ``Vector``"""
+
+        return Vector(values, compact=self.is_compact())
+
+
     def length(self):
         """Returns the length of the vector. This is the number of values it
         contains, not its :py:meth:`magnitude`.
@@ -101,6 +137,30 @@ class Vector:
         return tuple(self._values)
 
 
+    def is_compact(self):
+        """Checks if the vector's values are stored in a compact buffer of
+        floats rather than a list.
+
+        :rtype: ``bool``"""
+
+        return not isinstance(self._values, list)
+
+
+    def _resizable_values(self):
+        """Returns the storage of the vector's values, checking first that it
+        can change length - Vectors which are views onto a
+        :py:class:`.VectorArray` cannot.
+
+        :raises TypeError: if the Vector is a view onto a VectorArray.
+        :rtype: ``list`` or ``array``"""
+
+        if isinstance(self._values, memoryview):
+            raise TypeError(
+             "Cannot change the length of a Vector viewing a VectorArray"
+            )
+        return self._values
+
+
     def magnitude(self):
         """Returns the magnitude of the vector - the length of the line it
         represents in space.
@@ -113,35 +173,39 @@ class Vector:
     def append(self, value):
         """Adds a value to the end of the vector.
 
-        :param value: the value to add."""
+        :param value: the value to add.
+        :raises TypeError: if the Vector is a view onto a VectorArray."""
 
-        self._values.append(value)
+        self._resizable_values().append(value)
 
 
     def insert(self, index, value):
         """Insertes a value into the vector.
 
         :param int index: The location to insert to.
-        :param value: the value to add."""
+        :param value: the value to add.
+        :raises TypeError: if the Vector is a view onto a VectorArray."""
 
-        self._values.insert(index, value)
+        self._resizable_values().insert(index, value)
 
 
     def remove(self, value):
         """Removes a value from the vector.
 
-        :param value: the value to remove."""
+        :param value: the value to remove.
+        :raises TypeError: if the Vector is a view onto a VectorArray."""
 
-        self._values.remove(value)
+        self._resizable_values().remove(value)
 
 
     def pop(self, index=-1):
         """Removes a value from the vector and returns it.
 
         :param index: the index to remove, default being ``-1``.
+        :raises TypeError: if the Vector is a view onto a VectorArray.
         :returns: the removed value."""
 
-        return self._values.pop(index)
+        return self._resizable_values().pop(index)
 
 
     def components(self):
@@ -226,11 +290,11 @@ class Vector:
         values, other = self._values, other._values
         if len(values) != 3 or len(other) != 3:
             raise ValueError("{} or {} is not 3D".format(self, other))
-        return Vector(
+        return self._new((
          values[1] * other[2] - values[2] * other[1],
          values[2] * other[0] - values[0] * other[2],
          values[0] * other[1] - values[1] * other[0]
-        )
+        ))
 
 
     def distance_to(self, other):
@@ -268,8 +332,19 @@ class VectorSpan:
     performing linear combinations of some starter set of vectors.
 
     A Vector is ``in`` this span if it can be constructed from a linear
-    combination of the defining Vectors. This is calculated using Gaussian
-    elimination.
+    combination of the defining Vectors. This is calculated by elimination
+    against the span's basis, which takes time proportional to the rank of the
+    span times its dimension.
+
+    The span keeps a basis in reduced echelon form - each basis row has a one
+    in its own pivot column and zeros in every other row's pivot column - which
+    is updated as each vector is added. Deciding whether a new vector adds
+    anything to the span is then one elimination of that vector against the
+    basis, rather than a fresh elimination of every vector seen so far.
+
+    Spans made entirely of integers or Fractions are reduced exactly using
+    Fractions, and all others using floats to within
+    :py:data:`SPAN_TOLERANCE`.
 
     :param \*vectors: The vectors which define the span. Any vectors that are\
     linearly dependent on the others will be discarded.
@@ -278,11 +353,15 @@ class VectorSpan:
     def __init__(self, *vectors):
         self._vectors = {vectors[0]}
         self._dimension = len(vectors[0])
+        self._exact = all(isinstance(val, (int, Fraction))
+         for v in vectors for val in v.values())
+        self._basis, self._factors, self._orthonormal = [], None, None
+        self._extend(vectors[0].values())
         for v in vectors[1:]:
             if len(v) != self._dimension: raise ValueError(
              "{} has Vectors of different dimensions".format(vectors)
             )
-            if v.linearly_independent_of(*self._vectors):
+            if self._extend(v.values()):
                 self._vectors.add(v)
 
 
@@ -296,21 +375,22 @@ class VectorSpan:
 
     def __contains__(self, vector):
         if len(vector) != self._dimension: return False
-        if set(vector.values()) == {0}: return True
-        if len(self._vectors) == 1:
-            one_vector = list(self._vectors)[0]
-            if set(one_vector.values()) == {0}: return False
-            if any(val1 == 0 and val2 != 0 for val1, val2
-             in zip(vector.values(), one_vector.values())): return False
-            if len(set([v1 / v2 for v1, v2 in zip(one_vector, vector)])) == 1:
-                return True
-        else:
-            from .matrices import Matrix
-            augmented = Matrix(*self._vectors, vector, columns=True)
-            augmented.gauss()
-            for row in augmented.rows():
-                if set(row[:-1]) == {0} and row[-1] != 0: return False
-            return True
+        return self._produces(vector.values())
+
+
+    def contains_many(self, vectors):
+        """Checks which of many vectors are in the span. The span's basis is
+        only prepared once, and if a :py:class:`.VectorArray` is given its
+        values are read directly rather than through a Vector for each row.
+
+        :param vectors: A VectorArray, or any iterable of Vectors.
+        :returns: a ``bool`` for each vector, in order.
+        :rtype: ``list``"""
+
+        if isinstance(vectors, VectorArray):
+            if vectors._dimension != self._dimension: return [False] * len(vectors)
+            return [self._produces(values) for values in vectors._groups()]
+        return [vector in self for vector in vectors]
 
 
     def dimension(self):
@@ -331,4 +411,374 @@ class VectorSpan:
 
         :rtype: ``int``"""
 
-        return len(self._vectors)
+        return len(self._basis)
+
+
+    def orthonormal_basis(self):
+        """Returns an orthonormal basis of the span - unit Vectors at right
+        angles to each other, which between them span the same space. It
+        comes from the QR decomposition of the span's basis, which is only
+        worked out once.
+
+        :rtype: ``tuple``"""
+
+        return tuple(Vector(*values) for values in self._orthonormal_values())
+
+
+    def project(self, vector):
+        """Returns the orthogonal projection of a Vector onto the span - the
+        Vector in the span which is closest to it. Using the span's orthonormal
+        basis, this is a dot product and a scaled addition for each basis
+        Vector.
+
+        :param Vector vector: The Vector to project.
+        :raises ValueError: if the Vector is the wrong dimension.
+        :rtype: ``Vector``"""
+
+        if len(vector) != self._dimension: raise ValueError(
+         "{} is not {}-dimensional".format(vector, self._dimension)
+        )
+        values, projection = vector.values(), [0.0] * self._dimension
+        for basis in self._orthonormal_values():
+            factor = sum(map(mul, basis, values))
+            if factor:
+                projection = [a + factor * b for a, b in zip(projection, basis)]
+        return Vector(*projection)
+
+
+    def _orthonormal_values(self):
+        """Returns the values of each Vector in the span's orthonormal basis.
+        These are the columns of Q in the reduced QR decomposition of a matrix
+        whose columns are the span's basis, and are cached.
+
+        :rtype: ``list``"""
+
+        if self._orthonormal is None:
+            self._orthonormal = []
+            if self._basis:
+                from .matrices import _householder_qr
+                q, _ = _householder_qr(
+                 list(zip(*[row for _, row in self._basis])), reduced=True
+                )
+                self._orthonormal = list(zip(*q))
+        return self._orthonormal
+
+
+    def _factorization(self):
+        """Returns the parts of the span's basis needed to test membership -
+        the pivot columns, and for every other column the values of each
+        basis row in that column. This is worked out once and then cached.
+
+        :returns: the pivot columns, and a list of (column, values) pairs."""
+
+        if self._factors is None:
+            pivots = [pivot for pivot, _ in self._basis]
+            others = set(range(self._dimension)) - set(pivots)
+            self._factors = pivots, [
+             (c, tuple(row[c] for _, row in self._basis)) for c in sorted(others)
+            ]
+        return self._factors
+
+
+    def _produces(self, values):
+        """Checks whether some values are a linear combination of the span's
+        basis. Because the basis is in reduced echelon form, the only possible
+        combination uses the values in the pivot columns as coefficients, so
+        this is one pass over the remaining columns.
+
+        :param values: The values to check.
+        :rtype: ``bool``"""
+
+        pivots, columns = self._factorization()
+        if self._exact and all(isinstance(val, (int, Fraction)) for val in values):
+            limit = 0
+        else:
+            limit = SPAN_TOLERANCE * max(map(abs, values), default=0)
+        coefficients = [values[pivot] for pivot in pivots]
+        for c, column in columns:
+            if abs(values[c] - sum(map(mul, coefficients, column))) > limit:
+                return False
+        return True
+
+
+    def _residual(self, values):
+        """Eliminates every pivot column of the span's basis from some values,
+        leaving whatever part of them the basis cannot produce.
+
+        :param values: The values to reduce.
+        :returns: the remaining values, and the magnitude at or below which\
+        they count as zero."""
+
+        if self._exact and all(isinstance(val, (int, Fraction)) for val in values):
+            residual, limit = [Fraction(val) for val in values], 0
+        else:
+            residual = [float(val) for val in values]
+            limit = SPAN_TOLERANCE * max(map(abs, residual), default=0)
+        for pivot, row in self._basis:
+            factor = residual[pivot]
+            if factor:
+                residual = [a - factor * b for a, b in zip(residual, row)]
+        return residual, limit
+
+
+    def _extend(self, values):
+        """Adds whatever part of some values the span's basis cannot produce
+        to the basis as a new row, eliminating the new pivot column from the
+        existing rows so that the basis stays in reduced echelon form.
+
+        :param values: The values of the vector being added.
+        :returns: ``True`` if the basis grew, ``False`` if the values were\
+        already in the span."""
+
+        residual, limit = self._residual(values)
+        if not residual: return False
+        pivot = max(range(len(residual)), key=lambda i: abs(residual[i]))
+        lead = residual[pivot]
+        if abs(lead) <= limit: return False
+        row = [val / lead if abs(val) > limit else 0 * lead for val in residual]
+        for _, other in self._basis:
+            factor = other[pivot]
+            if factor:
+                other[:] = [a - factor * b for a, b in zip(other, row)]
+        self._basis.append((pivot, row))
+        self._factors = self._orthonormal = None
+        return True
+
+
+
+class VectorArray:
+    """A VectorArray is a fixed-size collection of Vectors which all have the
+    same dimension. Their values are stored together in one contiguous array of
+    floats, which makes it far more efficient than a list of Vector objects
+    when there are very many of them.
+
+    Operations such as magnitudes, dot products and distances are performed on
+    all the Vectors at once, and a VectorArray can be added to and subtracted
+    from another VectorArray (or a single Vector) of the same dimension with
+    ``+`` and ``-``, and scaled with ``*``.
+
+    Indexing a VectorArray returns a Vector which is a view onto the array's
+    storage - changing its values will change the VectorArray, though its
+    length cannot be changed. Copying or pickling such a Vector gives an
+    independent compact Vector. Slicing a VectorArray returns a new VectorArray
+    with copies of the selected vectors.
+
+    :param \*vectors: The Vectors (or other sequences of numbers) to store.
+    :param int dimension: The dimension of the vectors - only needed if no\
+    vectors are given.
+    :raises ValueError: if vectors of different dimensions are provided.
+    :raises ValueError: if there are no vectors and no dimension."""
+
+    __slots__ = ("_values", "_dimension")
+
+    def __init__(self, *vectors, dimension=None):
+        if dimension is None:
+            if not vectors:
+                raise ValueError("Cannot make VectorArray with no dimension")
+            dimension = len(vectors[0])
+        values = array("d")
+        for vector in vectors:
+            if len(vector) != dimension: raise ValueError(
+             "{} is not {}-dimensional".format(vector, dimension)
+            )
+            values.extend(vector)
+        self._values, self._dimension = values, dimension
+
+
+    @staticmethod
+    def _from_array(values, dimension):
+        """Creates a VectorArray directly from a flat array of floats, without
+        copying it.
+
+        :param array values: the flat array.
+        :param int dimension: the dimension of each vector.
+        :rtype: ``VectorArray``"""
+
+        vectors = VectorArray(dimension=dimension)
+        vectors._values = values
+        return vectors
+
+
+    def __repr__(self):
+        return "<VectorArray - {} Vectors, {} dimensions>".format(
+         len(self), self._dimension
+        )
+
+
+    def __len__(self):
+        return len(self._values) // self._dimension if self._dimension else 0
+
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._slice(index)
+        length = len(self)
+        if index < 0: index += length
+        if not 0 <= index < length:
+            raise IndexError("VectorArray index out of range")
+        start = index * self._dimension
+        vector = Vector.__new__(Vector)
+        vector._values = memoryview(self._values)[
+         start:start + self._dimension
+        ]
+        return vector
+
+
+    def __setitem__(self, index, vector):
+        if isinstance(index, slice):
+            raise TypeError("VectorArray slices cannot be assigned to")
+        if len(vector) != self._dimension:
+            raise ValueError("{} is not {}-dimensional".format(
+             vector, self._dimension
+            ))
+        view = self[index]._values
+        for i, value in enumerate(vector): view[i] = value
+
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+    def _slice(self, index):
+        """Creates a new VectorArray from copies of the vectors selected by a
+        slice.
+
+        :param slice index: the slice to apply.
+        :rtype: ``VectorArray``"""
+
+        start, stop, step = index.indices(len(self))
+        dimension = self._dimension
+        if step == 1:
+            values = self._values[start * dimension:max(start, stop) * dimension]
+        else:
+            values = array("d")
+            for n in range(start, stop, step):
+                values.extend(self._values[n * dimension:(n + 1) * dimension])
+        return VectorArray._from_array(values, dimension)
+
+
+    def __add__(self, other):
+        return self._combine(other, add, "add")
+
+
+    def __sub__(self, other):
+        return self._combine(other, sub, "subtract")
+
+
+    def __mul__(self, other):
+        if isinstance(other, (Vector, VectorArray)):
+            raise TypeError("'*' is reserved for scalar multiplication")
+        return VectorArray._from_array(
+         array("d", [v * other for v in self._values]), self._dimension
+        )
+
+
+    def __rmul__(self, other):
+        return self * other
+
+
+    def _combine(self, other, func, verb):
+        """Combines this VectorArray with another, or with a single Vector which
+        is applied to every vector in the array, value by value.
+
+        :param other: the VectorArray or Vector.
+        :param func: the function to combine two values with.
+        :param str verb: the name of the operation, for error messages.
+        :raises TypeError: if other is not a VectorArray or Vector.
+        :raises ValueError: if the dimensions don't match.
+        :rtype: ``VectorArray``"""
+
+        if isinstance(other, Vector):
+            if len(other) != self._dimension:
+                raise ValueError("Cannot {} {} - wrong dimension".format(
+                 verb, other
+                ))
+            other_values = list(other._values) * len(self)
+        elif isinstance(other, VectorArray):
+            if other._dimension != self._dimension or len(other) != len(self):
+                raise ValueError("Cannot {} {} - wrong shape".format(
+                 verb, other
+                ))
+            other_values = other._values
+        else:
+            raise TypeError("Cannot {} {} - not a VectorArray".format(
+             verb, other
+            ))
+        return VectorArray._from_array(
+         array("d", map(func, self._values, other_values)), self._dimension
+        )
+
+
+    def _groups(self):
+        """Returns an iterator of tuples, one for each vector in the array.
+
+        :rtype: ``iterator``"""
+
+        return zip(*[iter(self._values)] * self._dimension)
+
+
+    def dimension(self):
+        """Returns the dimension of the vectors in the array.
+
+        :rtype: ``int``"""
+
+        return self._dimension
+
+
+    def values(self):
+        """Returns the values of every vector in the array.
+
+        :rtype: ``tuple``"""
+
+        return tuple(self._groups())
+
+
+    def magnitudes(self):
+        """Returns the magnitude of every vector in the array.
+
+        :rtype: ``list``"""
+
+        return [sqrt(sum(map(mul, v, v))) for v in self._groups()]
+
+
+    def dot(self, other):
+        """Returns the dot products of every vector in the array with either a
+        single Vector, or with the corresponding vectors of another VectorArray.
+
+        :param other: The Vector or VectorArray.
+        :raises TypeError: If a non-Vector is given.
+        :raises ValueError: If the dimensions don't match.
+        :rtype: ``list``"""
+
+        if isinstance(other, Vector):
+            if len(other) != self._dimension:
+                raise ValueError("{} and {} not equal length".format(self, other))
+            values = tuple(other._values)
+            return [sum(map(mul, v, values)) for v in self._groups()]
+        if not isinstance(other, VectorArray):
+            raise TypeError("{} is not a Vector or VectorArray".format(other))
+        if other._dimension != self._dimension or len(other) != len(self):
+            raise ValueError("{} and {} not the same shape".format(self, other))
+        return [
+         sum(map(mul, v1, v2)) for v1, v2 in zip(self._groups(), other._groups())
+        ]
+
+
+    def distances_to(self, vector):
+        """Returns the distance between every vector in the array and some
+        other Vector.
+
+        :param Vector vector: the other Vector.
+        :raises TypeError: If a non-Vector is given.
+        :raises ValueError: If the dimensions don't match.
+        :rtype: ``list``"""
+
+        if not isinstance(vector, Vector):
+            raise TypeError("{} is not a Vector".format(vector))
+        if len(vector) != self._dimension:
+            raise ValueError("{} and {} not equal length".format(self, vector))
+        values = tuple(vector._values)
+        return [sqrt(sum([
+         (a - b) * (a - b) for a, b in zip(v, values)
+        ])) for v in self._groups()]
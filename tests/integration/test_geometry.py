@@ -101,3 +101,114 @@ class GeometryTests(TestCase):
         self.assertEqual(v7.values(), (1, 0, -1))
         self.assertEqual(v8.values(), (1, 1, 0))
         self.assertEqual(v9.values(), (1, -1, 0))
+
+
+    def test_transforms(self):
+        # A chain of operations matches applying them one at a time
+        v1, v2 = points.Vector(1, -9, 5), points.Vector(14, 1.1, -9.01)
+        v3, v4 = points.Vector(1, -9, 5), points.Vector(14, 1.1, -9.01)
+        transform = points.Transform().translate(0.3, 0.4, -10).rotate(
+         45, 0, degrees=True
+        ).scale(2).rotate(-10, 1, degrees=True)
+        transform.apply(v1, v2)
+        points.translate_vectors((0.3, 0.4, -10), v3, v4)
+        points.rotate_3d_vectors(45, 0, v3, v4, degrees=True)
+        for v in (v3, v4):
+            v._values = [val * 2 for val in v._values]
+        points.rotate_3d_vectors(-10, 1, v3, v4, degrees=True)
+        for v, expected in ((v1, v3), (v2, v4)):
+            for val1, val2 in zip(v.values(), expected.values()):
+                self.assertAlmostEqual(val1, val2, delta=0.000001)
+
+        # Transforms compose, later operations on the left
+        shift = points.Transform(2).translate(1, 0)
+        turn = points.Transform(2).rotate(90, degrees=True)
+        v5 = points.Vector(1, 1, compact=True)
+        (turn @ shift).apply(v5)
+        self.assertTrue(v5.is_compact())
+        self.assertAlmostEqual(v5.values()[0], -1, delta=0.000001)
+        self.assertAlmostEqual(v5.values()[1], 2, delta=0.000001)
+
+
+    def test_axis_rotations(self):
+        # Rotating about a basis vector matches rotate_3d_vectors
+        v1, v2 = points.Vector(1, -9, 5), points.Vector(1, -9, 5)
+        points.rotate_vectors_about_axis(
+         30, points.Vector(0, 3, 0), v1, degrees=True, point=[1, 1, 1]
+        )
+        points.rotate_3d_vectors(30, 1, v2, degrees=True, point=[1, 1, 1])
+        for val1, val2 in zip(v1.values(), v2.values()):
+            self.assertAlmostEqual(val1, val2, delta=0.000001)
+
+        # Whole arrays can be rotated about any axis in one go
+        vectors = points.VectorArray([1, 0, 0], [0, 1, 0], [0, 0, 1])
+        first = vectors[0]
+        points.rotate_vectors_about_axis(
+         -120, [1, 1, 1], vectors, degrees=True, trim=6
+        )
+        self.assertEqual(vectors[0].values(), (0, 0, 1))
+        self.assertEqual(vectors[1].values(), (1, 0, 0))
+        self.assertEqual(vectors[2].values(), (0, 1, 0))
+        self.assertEqual(first.values(), (0, 0, 1))
+
+
+    def test_rotation_cache(self):
+        points.clear_rotation_cache()
+        v1 = points.Vector(1, 0, 0)
+        for _ in range(4):
+            points.rotate_3d_vectors(90, 2, v1, degrees=True, trim=6)
+        self.assertEqual(v1.values(), (1, 0, 0))
+        info = points.rotation_cache_info()
+        self.assertEqual((info["hits"], info["misses"]), (3, 1))
+        points.clear_rotation_cache()
+        self.assertEqual(points.rotation_cache_info()["size"], 0)
+
+
+    def test_superposition(self):
+        target = points.VectorArray(
+         [1.2, 0.5, -0.3], [2.7, 1.1, 0.4], [3.1, -0.8, 1.9], [0.2, 2.2, 2.5],
+         [-1.4, 0.9, 1.1]
+        )
+        mobile = points.VectorArray(*target)
+        points.rotate_vectors_about_axis(
+         73, [0.3, -1, 2], mobile, degrees=True, point=[4, 4, 4]
+        )
+        points.translate_vectors((-10, 3, 0.5), mobile)
+        mobile[2] = mobile[2] + points.Vector(0, 0, 0.5)
+
+        transform, rmsd = points.superimpose(mobile, target)
+        deviations = [(m - t).magnitude() ** 2 for m, t in zip(mobile, target)]
+        self.assertAlmostEqual(
+         rmsd, math.sqrt(sum(deviations) / 5), delta=0.000001
+        )
+        self.assertLess(rmsd, 0.25)
+
+        # Superimposing again changes nothing
+        again, rmsd2 = points.superimpose(mobile, target)
+        self.assertAlmostEqual(rmsd, rmsd2, delta=0.000001)
+        identity = points.Matrix.identity(4)
+        for row, expected in zip(again.matrix().rows(), identity.rows()):
+            for val1, val2 in zip(row, expected):
+                self.assertAlmostEqual(val1, val2, delta=0.000001)
+
+
+    def test_rmsd_matrix(self):
+        reference = [[1.2, 0.5, -0.3], [2.7, 1.1, 0.4], [3.1, -0.8, 1.9]]
+        sets = []
+        for n in range(5):
+            vectors = points.VectorArray(*reference)
+            vectors[n % 3] = vectors[n % 3] + points.Vector(0, 0, n * 0.1)
+            points.rotate_vectors_about_axis(n * 20, [1, n, 2], vectors)
+            sets.append(vectors)
+        serial = points.rmsd_matrix(sets)
+        parallel = points.rmsd_matrix(sets, workers=2)
+        self.assertEqual(serial.values(), parallel.values())
+        for i in range(5):
+            self.assertEqual(serial[i, i], 0)
+            for j in range(5):
+                self.assertEqual(serial[i, j], serial[j, i])
+                mobile = points.VectorArray(*sets[i])
+                self.assertAlmostEqual(
+                 serial[i, j], points.superimpose(mobile, sets[j])[1],
+                 delta=0.000001
+                )
@@ -12,6 +12,8 @@ class MatrixTests(TestCase):
         self.assertEqual(matrix.rows()[2], (7, 8, 9))
         self.assertEqual(matrix.columns()[0], (1, 4, 7))
         self.assertEqual(matrix.columns()[1], (2, 5, 8))
+        self.assertEqual(sorted(matrix.rows(), reverse=True)[0], (7, 8, 9))
+        self.assertEqual(max(matrix.columns()), (3, 6, 9))
         self.assertEqual(matrix.columns()[2], (3, 6, 9))
         self.assertIn(7, matrix)
         self.assertNotIn(10, matrix)
@@ -46,6 +48,31 @@ class MatrixTests(TestCase):
         self.assertEqual(matrix.rank(), 3)
         self.assertTrue(matrix.is_full_rank())
 
+        # Reduced row echelon form, null space and column space
+        matrix = points.Matrix([1, 0, 1], [-2, -3, 1], [3, 3, 0])
+        reduced, pivots, rank = matrix.rref()
+        self.assertTrue(reduced.is_reduced_row_echelon())
+        self.assertEqual(pivots, (0, 1))
+        self.assertEqual(rank, matrix.rank())
+        self.assertEqual(
+         [v.values() for v in matrix.column_space_basis()], [(1, -2, 3), (0, -3, 3)]
+        )
+        null_space = matrix.null_space()
+        self.assertEqual(null_space.rank(), 1)
+        self.assertIn(points.Vector(-2, 2, 2), null_space)
+        self.assertNotIn(points.Vector(1, 1, 1), null_space)
+        for vector in matrix.column_space_basis():
+            self.assertIn(vector, matrix.column_space())
+
+        # QR decomposition
+        matrix = points.Matrix([12, -51, 4], [6, 167, -68], [-4, 24, -41])
+        q, r = matrix.qr()
+        for val1, val2 in zip((q @ r)._flat(), matrix._flat()):
+            self.assertAlmostEqual(val1, val2, delta=0.000001)
+        for val1, val2 in zip((q.transposed() @ q)._flat(), points.Matrix.identity(3)._flat()):
+            self.assertAlmostEqual(val1, val2, delta=0.000001)
+        self.assertTrue(r.is_row_echelon())
+
         # 2D Matrix minors, cofactors, and determinant
         matrix2d = points.Matrix([1, 9], [2, 4])
         self.assertEqual(matrix2d.minor(0, 0), 4)
@@ -107,6 +134,50 @@ class MatrixTests(TestCase):
          [1, 3, 5, 9], [1, 3, 1, 7], [4, 3, 9, 7], [5, 2, 0, 9]
         )
         self.assertEqual(matrix4d.determinant(), -376)
+        matrix4d = points.Matrix(
+         [1.0, 3, 5, 9], [1, 3, 1, 7], [4, 3, 9, 7], [5, 2, 0, 9]
+        )
+        self.assertAlmostEqual(matrix4d.determinant(), -376, delta=0.000001)
+
+        # Large matrix determinant
+        matrix = points.Matrix(*[[
+         i + 1 if i == j else 1 for j in range(12)
+        ] for i in range(12)])
+        self.assertEqual(matrix.determinant(), 39916800)
+
+        # Views
+        matrix = points.Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9], [10, 11, 12])
+        self.assertEqual(matrix[2, 1], 8)
+        self.assertEqual(matrix[1:3, 1:].rows(), ((5, 6), (8, 9)))
+        self.assertEqual(matrix[1:3, 1:].transposed().rows(), ((5, 8), (6, 9)))
+        self.assertEqual(matrix[::3, ::2].determinant(), 1 * 12 - 3 * 10)
+        self.assertEqual(matrix.transposed().columns(), matrix.rows())
+        self.assertEqual(matrix.transposed() @ matrix, points.Matrix(
+         [166, 188, 210], [188, 214, 240], [210, 240, 270]
+        ))
+        submatrix = matrix[:2, :2]
+        submatrix.gauss()
+        self.assertEqual(submatrix.rows(), ((4, 5), (0, 0.75)))
+        self.assertEqual(matrix.rows()[0], (1, 2, 3))
+
+        # Solving linear equations
+        matrix = points.Matrix([2, 1, -1], [-3, -1, 2], [-2, 1, 2])
+        solution = matrix.solve(points.Vector(8, -11, -3))
+        for val1, val2 in zip(solution, (2, 3, -1)):
+            self.assertAlmostEqual(val1, val2, delta=0.000001)
+        lu = matrix.lu()
+        self.assertIs(lu, matrix.lu())
+        self.assertAlmostEqual(lu.determinant(), matrix.determinant(), delta=0.000001)
+        for b in [points.Vector(1, 2, 3), points.Vector(-4, 0, 9.5)]:
+            x = matrix.solve(b)
+            for val1, val2 in zip(matrix @ x, b):
+                self.assertAlmostEqual(val1, val2, delta=0.000001)
+        solutions = matrix.solve(points.Matrix([8, 1], [-11, 2], [-3, 3]))
+        for row1, row2 in zip((matrix @ solutions).rows(), ((8, 1), (-11, 2), (-3, 3))):
+            for val1, val2 in zip(row1, row2):
+                self.assertAlmostEqual(val1, val2, delta=0.000001)
+        with self.assertRaises(ValueError):
+            points.Matrix([1, 2], [2, 4]).solve(points.Vector(1, 2))
 
         # Echelon form
         self.assertFalse(points.Matrix([1, 3, -1], [9, 1, 7]).is_row_echelon())
@@ -147,6 +218,21 @@ class MatrixTests(TestCase):
          (matrix2 @ matrix).rows(), ((276, 330, 384), (528, 645, 762), (474, 591, 708))
         )
 
+        # Parallel matrix multiplication
+        self.assertEqual(matrix.matmul(matrix2, workers=2), matrix @ matrix2)
+        matrix3 = matrix * 0.5
+        self.assertEqual(matrix3.matmul(matrix2, workers=3), matrix3 @ matrix2)
+
+        # Large matrix multiplication
+        matrix = points.Matrix(*[[i * j % 7 for j in range(150)] for i in range(140)])
+        matrix2 = points.Matrix(*[[i + j for j in range(200)] for i in range(150)])
+        product = matrix @ matrix2
+        self.assertEqual(product.size(), (140, 200))
+        for i, j in [(0, 0), (3, 129), (139, 199), (70, 64)]:
+            self.assertEqual(product[i, j], sum(
+             matrix[i, k] * matrix2[k, j] for k in range(150)
+            ))
+
 
 
 class MatrixVectorTests(TestCase):
@@ -0,0 +1,44 @@
+import math
+from unittest import TestCase
+import points
+
+class QuaternionTests(TestCase):
+
+    def test_rotation_composition(self):
+        # Composing quaternions matches composing Transforms
+        q1 = points.Quaternion.from_axis_angle([0, 0, 1], 30, degrees=True)
+        q2 = points.Quaternion.from_axis_angle([1, 0, 0], 45, degrees=True)
+        q3 = points.Quaternion.from_axis_angle([1, -2, 0.5], 100, degrees=True)
+        composed = q3 * q2 * q1
+        transform = q3.transform() @ q2.transform() @ q1.transform()
+        v1, v2 = points.Vector(1, -9, 5), points.Vector(1, -9, 5)
+        composed.apply(v1)
+        transform.apply(v2)
+        for val1, val2 in zip(v1.values(), v2.values()):
+            self.assertAlmostEqual(val1, val2, delta=0.000001)
+
+        # Many small steps don't drift once renormalised
+        step = points.Quaternion.from_axis_angle([1, 2, 3], 1, degrees=True)
+        total = points.Quaternion()
+        for _ in range(360):
+            total = (step * total).normalized()
+        axis, angle = total.axis_angle()
+        self.assertAlmostEqual(abs(math.sin(angle / 2)), 0, delta=0.000001)
+
+        # Round trip through a rotation matrix and back
+        matrix = points.Transform().rotate(0.7, [2, 1, -1]).matrix()
+        axis, angle = points.Quaternion.from_matrix(matrix).axis_angle()
+        self.assertAlmostEqual(angle, 0.7, delta=0.000001)
+        for val1, val2 in zip(axis.values(), (2, 1, -1)):
+            self.assertAlmostEqual(val1, val2 / math.sqrt(6), delta=0.000001)
+
+
+    def test_interpolation(self):
+        start = points.Quaternion.from_axis_angle([0, 0, 1], 0)
+        end = points.Quaternion.from_axis_angle([0, 0, 1], 90, degrees=True)
+        vectors = points.VectorArray([1, 0, 0], [0, 1, 0])
+        start.slerp(end, 1 / 3).apply(vectors)
+        root = math.sqrt(3) / 2
+        for vector, expected in zip(vectors, ((root, 0.5, 0), (-0.5, root, 0))):
+            for val1, val2 in zip(vector.values(), expected):
+                self.assertAlmostEqual(val1, val2, delta=0.000001)
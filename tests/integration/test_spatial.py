@@ -0,0 +1,84 @@
+import random
+from unittest import TestCase
+import points
+
+class SpatialTests(TestCase):
+
+    def test_kd_tree(self):
+        random.seed(1)
+        vectors = [points.Vector(
+         random.uniform(-10, 10), random.uniform(-10, 10), random.uniform(-10, 10)
+        ) for _ in range(500)]
+        tree = points.KDTree(points.VectorArray(*vectors))
+        for _ in range(20):
+            point = points.Vector(
+             random.uniform(-12, 12), random.uniform(-12, 12), random.uniform(-12, 12)
+            )
+            distances = sorted(
+             (vector.distance_to(point), index)
+             for index, vector in enumerate(vectors)
+            )
+
+            nearest = tree.nearest(point, k=4)
+            self.assertEqual([index for index, _ in nearest], [
+             index for _, index in distances[:4]
+            ])
+            for (_, distance), (expected, _) in zip(nearest, distances):
+                self.assertAlmostEqual(distance, expected, delta=0.000001)
+
+            within = tree.within(point, 3)
+            self.assertEqual([index for index, _ in within], [
+             index for distance, index in distances if distance <= 3
+            ])
+
+
+    def test_neighbour_searches(self):
+        random.seed(2)
+        vectors = points.VectorArray(*[[
+         random.uniform(0, 15) for _ in range(3)
+        ] for _ in range(300)])
+        others = [points.Vector(
+         random.uniform(0, 15), random.uniform(0, 15), random.uniform(0, 15)
+        ) for _ in range(100)]
+
+        pairs = points.find_pairs_within(vectors, 2.5)
+        expected = [(i, j) for i in range(300) for j in range(i + 1, 300)
+         if vectors[i].distance_to(vectors[j]) <= 2.5]
+        self.assertEqual([(i, j) for i, j, _ in pairs], expected)
+        for i, j, distance in pairs:
+            self.assertAlmostEqual(
+             distance, vectors[i].distance_to(vectors[j]), delta=0.000001
+            )
+
+        contacts = points.find_contacts(others, vectors, 2.5)
+        expected = [(i, j) for i in range(100) for j in range(300)
+         if others[i].distance_to(vectors[j]) <= 2.5]
+        self.assertEqual([(i, j) for i, j, _ in contacts], expected)
+
+        # The KDTree finds the same neighbours
+        tree = points.KDTree(vectors)
+        for i, vector in enumerate(others):
+            self.assertEqual(
+             sorted(j for j, _ in tree.within(vector, 2.5)),
+             [j for i2, j, _ in contacts if i2 == i]
+            )
+
+
+    def test_distance_matrices(self):
+        random.seed(3)
+        vectors = [points.Vector(
+         random.uniform(-5, 5), random.uniform(-5, 5), random.uniform(-5, 5)
+        ) for _ in range(40)]
+        others = points.VectorArray(*vectors[:10])
+
+        matrix = points.distance_matrix(vectors)
+        cross = points.cdist(others, vectors)
+        self.assertEqual(cross.size(), (10, 40))
+        for i in range(40):
+            for j in range(40):
+                self.assertAlmostEqual(
+                 matrix[i, j], vectors[i].distance_to(vectors[j]),
+                 delta=0.000001
+                )
+                if i < 10: self.assertEqual(cross[i, j], matrix[i, j])
+        self.assertEqual(matrix.matrix()[0:10, 0:40], cross)
@@ -119,3 +119,56 @@ class VectorTests(TestCase):
         self.assertNotIn(points.Vector(1, 2, 3), span)
         self.assertNotIn(points.Vector(14, -4), span)
         self.assertNotIn(points.Vector(14, -4, 0), span)
+        self.assertEqual(span.contains_many(points.VectorArray(
+         [19, 19, 26], [-9, 27, 8], [0, 0, 0], [19, 19, 26.5]
+        )), [True, True, True, False])
+        basis = span.orthonormal_basis()
+        self.assertEqual(len(basis), 2)
+        self.assertAlmostEqual(basis[0].dot(basis[1]), 0, delta=0.000001)
+        projection = span.project(points.Vector(19, 19, 30))
+        self.assertNotIn(points.Vector(19, 19, 30), span)
+        self.assertIn(projection, span)
+        self.assertAlmostEqual(
+         (points.Vector(19, 19, 30) - projection).dot(v1), 0, delta=0.000001
+        )
+
+
+    def test_compact_vectors(self):
+        v1 = points.Vector(5, 23, 17, compact=True)
+        v2 = points.Vector([14, -4, 9], compact=True)
+        self.assertTrue(v1.is_compact())
+        self.assertEqual(v1.values(), (5, 23, 17))
+        self.assertEqual((v1 + v2).values(), (19, 19, 26))
+        self.assertTrue((v1 + v2).is_compact())
+        self.assertEqual((v1 - v2).values(), (-9, 27, 8))
+        self.assertEqual((v1 * 10).values(), (50, 230, 170))
+        self.assertEqual(v1.dot(v2), 131)
+        self.assertEqual(v1.cross(v2).values(), (275, 193, -342))
+        self.assertAlmostEqual(points.Vector(3, 4, compact=True).magnitude(), 5)
+        self.assertEqual(list(v1), [5, 23, 17])
+        v1.append(3)
+        self.assertEqual(v1.values(), (5, 23, 17, 3))
+
+
+    def test_vector_arrays(self):
+        vectors = points.VectorArray(
+         points.Vector(3, 4, 12), [1, 2, 2], points.Vector(0, 0, 0)
+        )
+        self.assertEqual(len(vectors), 3)
+        self.assertEqual(vectors.magnitudes(), [13, 3, 0])
+        self.assertEqual(vectors.dot(points.Vector(1, 1, 1)), [19, 5, 0])
+        self.assertEqual(vectors.dot(vectors), [169, 9, 0])
+        self.assertEqual(vectors.distances_to(points.Vector(1, 2, 2)), [
+         points.Vector(3, 4, 12).distance_to(points.Vector(1, 2, 2)), 0, 3
+        ])
+        moved = (vectors + points.Vector(1, 1, 1)) * 2
+        self.assertEqual(moved.values(), ((8, 10, 26), (4, 6, 6), (2, 2, 2)))
+        self.assertEqual((moved - moved).magnitudes(), [0, 0, 0])
+
+        # Vector views
+        vector = vectors[1]
+        self.assertEqual(vector.magnitude(), 3)
+        self.assertEqual((vector + vector).values(), (2, 4, 4))
+        vector[2] = 4
+        self.assertEqual(vectors.values()[1], (1, 2, 4))
+        self.assertEqual([v.values() for v in vectors], list(vectors.values()))
@@ -0,0 +1,129 @@
+from array import array
+from unittest import TestCase
+from points.matrices import CondensedMatrix, Matrix
+
+class CondensedMatrixTest(TestCase):
+
+    def setUp(self):
+        self.matrix = CondensedMatrix(4, [1, 2, 3, 4, 5, 6])
+
+
+
+class CondensedMatrixCreationTests(CondensedMatrixTest):
+
+    def test_can_make_condensed_matrix(self):
+        self.assertEqual(self.matrix._size, 4)
+        self.assertEqual(self.matrix._values, array("d", [1, 2, 3, 4, 5, 6]))
+
+
+    def test_arrays_are_not_copied(self):
+        values = array("d", [1, 2, 3])
+        self.assertIs(CondensedMatrix(3, values)._values, values)
+
+
+    def test_can_make_zero_condensed_matrix(self):
+        matrix = CondensedMatrix(3)
+        self.assertEqual(matrix._values, array("d", [0, 0, 0]))
+
+
+    def test_can_make_small_condensed_matrices(self):
+        self.assertEqual(len(CondensedMatrix(1)._values), 0)
+        self.assertEqual(len(CondensedMatrix(0)._values), 0)
+
+
+    def test_values_must_be_right_length(self):
+        with self.assertRaises(ValueError):
+            CondensedMatrix(4, [1, 2, 3, 4, 5])
+
+
+    def test_size_must_be_valid(self):
+        with self.assertRaises(ValueError):
+            CondensedMatrix(-1)
+        with self.assertRaises(ValueError):
+            CondensedMatrix(2.5)
+
+
+    def test_condensed_matrix_has_no_dict(self):
+        with self.assertRaises(AttributeError):
+            self.matrix.__dict__
+
+
+
+class CondensedMatrixReprTests(CondensedMatrixTest):
+
+    def test_condensed_matrix_repr(self):
+        self.assertEqual(repr(self.matrix), "<CondensedMatrix 4×4>")
+
+
+
+class CondensedMatrixIndexingTests(CondensedMatrixTest):
+
+    def test_can_get_values(self):
+        self.assertEqual(self.matrix[0, 1], 1)
+        self.assertEqual(self.matrix[0, 3], 3)
+        self.assertEqual(self.matrix[1, 2], 4)
+        self.assertEqual(self.matrix[2, 3], 6)
+
+
+    def test_values_are_symmetric(self):
+        for i in range(4):
+            for j in range(4):
+                self.assertEqual(self.matrix[i, j], self.matrix[j, i])
+
+
+    def test_diagonal_is_zero(self):
+        for i in range(4):
+            self.assertEqual(self.matrix[i, i], 0)
+
+
+    def test_can_use_negative_indices(self):
+        self.assertEqual(self.matrix[-1, 0], 3)
+        self.assertEqual(self.matrix[-2, -1], 6)
+
+
+    def test_indices_must_be_pairs(self):
+        with self.assertRaises(TypeError):
+            self.matrix[1]
+
+
+    def test_indices_must_be_in_range(self):
+        with self.assertRaises(IndexError):
+            self.matrix[0, 4]
+        with self.assertRaises(IndexError):
+            self.matrix[-5, 0]
+
+
+
+class CondensedMatrixSizeTests(CondensedMatrixTest):
+
+    def test_can_get_size(self):
+        self.assertEqual(self.matrix.size(), (4, 4))
+
+
+
+class CondensedMatrixValuesTests(CondensedMatrixTest):
+
+    def test_can_get_values(self):
+        self.assertEqual(self.matrix.values(), (1, 2, 3, 4, 5, 6))
+
+
+
+class CondensedMatrixRowTests(CondensedMatrixTest):
+
+    def test_can_get_row(self):
+        self.assertEqual(self.matrix.row(0), [0, 1, 2, 3])
+        self.assertEqual(self.matrix.row(2), [2, 4, 0, 6])
+
+
+    def test_row_must_exist(self):
+        with self.assertRaises(IndexError):
+            self.matrix.row(4)
+
+
+
+class CondensedMatrixMatrixTests(CondensedMatrixTest):
+
+    def test_can_expand_to_matrix(self):
+        self.assertEqual(self.matrix.matrix(), Matrix(
+         [0, 1, 2, 3], [1, 0, 4, 5], [2, 4, 0, 6], [3, 5, 6, 0]
+        ))
@@ -1,8 +1,14 @@
 import math
+from math import cos, sin
+from array import array
+import points.geometry
 from unittest import TestCase
 from unittest.mock import Mock, patch, MagicMock
 from points.geometry import *
-from points.vectors import Vector
+from points.geometry import _translate_in_place, _transform_in_place
+from points.geometry import _rmsd_pairs, _split_sets, ROTATION_CACHE_SIZE
+from points.vectors import Vector, VectorArray
+from points.matrices import Matrix, CondensedMatrix
 
 class GeometryTest(TestCase):
 
@@ -82,49 +88,37 @@ class Rotation2dTests(GeometryTest):
 
     def setUp(self):
         GeometryTest.setUp(self)
-        self.patch1 = patch("points.geometry.Matrix")
-        self.patch2 = patch("points.geometry.translate_vectors")
-        self.mock_matrix = self.patch1.start()
-        self.mock_trans = self.patch2.start()
         self.v1._values.pop(), self.v2._values.pop()
 
 
-    def tearDown(self):
-        self.patch1.stop()
-        self.patch2.stop()
+    @patch("points.geometry.Transform")
+    def test_can_rotate_2d(self, mock_transform):
+        transform = mock_transform.return_value
+        rotate_2d_vectors(0.5, self.v1, self.v2)
+        mock_transform.assert_called_with(2)
+        transform.rotate.assert_called_with(0.5)
+        transform.rotate.return_value.apply.assert_called_with(self.v1, self.v2)
+        self.assertFalse(transform.translate.called)
 
 
-    def test_can_rotate_2d(self):
-        matrix = Mock()
-        self.mock_matrix.return_value = matrix
-        matrix.__matmul__ = MagicMock()
-        matrix.__matmul__.side_effect = [self.v2, self.v3, self.v1]
-        rotate_2d_vectors(0.5, self.v1, self.v2)
-        self.mock_matrix.assert_called_with(
-         [cos(0.5), -sin(0.5)], [sin(0.5), cos(0.5)]
-        )
-        matrix.__matmul__.assert_any_call(self.v1)
-        matrix.__matmul__.assert_any_call(self.v2)
-        self.assertEqual(self.v1._values, [4, 5])
-        self.assertEqual(self.v2._values, [7, 8, 9])
-        self.assertFalse(self.mock_trans.called)
-
-
-    def test_can_rotate_2d_about_point(self):
-        matrix = Mock()
-        self.mock_matrix.return_value = matrix
-        matrix.__matmul__ = MagicMock()
-        matrix.__matmul__.side_effect = [self.v2, self.v3, self.v1]
+    @patch("points.geometry.Transform")
+    def test_can_rotate_2d_about_point(self, mock_transform):
+        transform = mock_transform.return_value
+        transform.dimension.return_value = 2
         rotate_2d_vectors(0.5, self.v1, self.v2, point=[1, 2])
-        self.mock_trans.assert_any_call((-1, -2), self.v1, self.v2)
-        self.mock_matrix.assert_called_with(
-         [cos(0.5), -sin(0.5)], [sin(0.5), cos(0.5)]
+        transform.translate.assert_called_with(-1, -2)
+        rotated = transform.translate.return_value.rotate
+        rotated.assert_called_with(0.5)
+        rotated.return_value.translate.assert_called_with(1, 2)
+        rotated.return_value.translate.return_value.apply.assert_called_with(
+         self.v1, self.v2
         )
-        matrix.__matmul__.assert_any_call(self.v1)
-        matrix.__matmul__.assert_any_call(self.v2)
-        self.assertEqual(self.v1._values, [4, 5])
-        self.assertEqual(self.v2._values, [7, 8, 9])
-        self.mock_trans.assert_any_call((1, 2), self.v1, self.v2)
+
+
+    def test_can_rotate_2d_vectors(self):
+        rotate_2d_vectors(math.pi / 2, self.v1, self.v2)
+        for val1, val2 in zip(self.v1._values + self.v2._values, [-2, 1, -5, 4]):
+            self.assertAlmostEqual(val1, val2, delta=0.000001)
 
 
     def test_rotation_needs_vectors(self):
@@ -147,81 +141,42 @@ class Rotation3dTests(GeometryTest):
 
     def setUp(self):
         GeometryTest.setUp(self)
-        self.patch1 = patch("points.geometry.Matrix")
-        self.patch2 = patch("points.geometry.translate_vectors")
-        self.mock_trans = self.patch2.start()
-        self.mock_matrix = self.patch1.start()
         self.v3._values.pop()
 
 
-    def tearDown(self):
-        self.patch1.stop()
-        self.patch2.stop()
-
-
-    def test_can_rotate_3d_x(self):
-        matrix = Mock()
-        self.mock_matrix.return_value = matrix
-        matrix.__matmul__ = MagicMock()
-        matrix.__matmul__.side_effect = [self.v2, self.v3, self.v1]
-        rotate_3d_vectors(0.5, 0, self.v1, self.v2)
-        self.mock_matrix.assert_called_with(
-         [1, 0, 0], [0, cos(0.5), -sin(0.5)], [0, sin(0.5), cos(0.5)]
-        )
-        matrix.__matmul__.assert_any_call(self.v1)
-        matrix.__matmul__.assert_any_call(self.v2)
-        self.assertEqual(self.v1._values, [4, 5, 6])
-        self.assertEqual(self.v2._values, [7, 8])
-        self.assertFalse(self.mock_trans.called)
-
-
-    def test_can_rotate_3d_y(self):
-        matrix = Mock()
-        self.mock_matrix.return_value = matrix
-        matrix.__matmul__ = MagicMock()
-        matrix.__matmul__.side_effect = [self.v2, self.v3, self.v1]
-        rotate_3d_vectors(0.5, 1, self.v1, self.v2)
-        self.mock_matrix.assert_called_with(
-         [cos(0.5), 0, sin(0.5)], [0, 1, 0], [-sin(0.5), 0, cos(0.5)]
-        )
-        matrix.__matmul__.assert_any_call(self.v1)
-        matrix.__matmul__.assert_any_call(self.v2)
-        self.assertEqual(self.v1._values, [4, 5, 6])
-        self.assertEqual(self.v2._values, [7, 8])
-        self.assertFalse(self.mock_trans.called)
-
-
-    def test_can_rotate_3d_z(self):
-        matrix = Mock()
-        self.mock_matrix.return_value = matrix
-        matrix.__matmul__ = MagicMock()
-        matrix.__matmul__.side_effect = [self.v2, self.v3, self.v1]
-        rotate_3d_vectors(0.5, 2, self.v1, self.v2)
-        self.mock_matrix.assert_called_with(
-         [cos(0.5), -sin(0.5), 0], [sin(0.5), cos(0.5), 0], [0, 0, 1]
-        )
-        matrix.__matmul__.assert_any_call(self.v1)
-        matrix.__matmul__.assert_any_call(self.v2)
-        self.assertEqual(self.v1._values, [4, 5, 6])
-        self.assertEqual(self.v2._values, [7, 8])
-        self.assertFalse(self.mock_trans.called)
-
-
-    def test_can_rotate_3d_about_point(self):
-        matrix = Mock()
-        self.mock_matrix.return_value = matrix
-        matrix.__matmul__ = MagicMock()
-        matrix.__matmul__.side_effect = [self.v2, self.v3, self.v1]
+    @patch("points.geometry.Transform")
+    def test_can_rotate_3d(self, mock_transform):
+        transform = mock_transform.return_value
+        for axis in range(3):
+            rotate_3d_vectors(0.5, axis, self.v1, self.v2)
+            mock_transform.assert_called_with(3)
+            transform.rotate.assert_called_with(0.5, axis)
+            transform.rotate.return_value.apply.assert_called_with(
+             self.v1, self.v2
+            )
+        self.assertFalse(transform.translate.called)
+
+
+    @patch("points.geometry.Transform")
+    def test_can_rotate_3d_about_point(self, mock_transform):
+        transform = mock_transform.return_value
+        transform.dimension.return_value = 3
         rotate_3d_vectors(0.5, 0, self.v1, self.v2, point=[1, 2, 3])
-        self.mock_trans.assert_any_call((-1, -2, -3), self.v1, self.v2)
-        self.mock_matrix.assert_called_with(
-         [1, 0, 0], [0, cos(0.5), -sin(0.5)], [0, sin(0.5), cos(0.5)]
+        transform.translate.assert_called_with(-1, -2, -3)
+        rotated = transform.translate.return_value.rotate
+        rotated.assert_called_with(0.5, 0)
+        rotated.return_value.translate.assert_called_with(1, 2, 3)
+        rotated.return_value.translate.return_value.apply.assert_called_with(
+         self.v1, self.v2
         )
-        matrix.__matmul__.assert_any_call(self.v1)
-        matrix.__matmul__.assert_any_call(self.v2)
-        self.assertEqual(self.v1._values, [4, 5, 6])
-        self.assertEqual(self.v2._values, [7, 8])
-        self.mock_trans.assert_any_call((1, 2, 3), self.v1, self.v2)
+
+
+    def test_can_rotate_3d_vectors(self):
+        rotate_3d_vectors(math.pi / 2, 2, self.v1, self.v2)
+        for val1, val2 in zip(
+         self.v1._values + self.v2._values, [-2, 1, 3, -5, 4, 6]
+        ):
+            self.assertAlmostEqual(val1, val2, delta=0.000001)
 
 
     def test_rotation_needs_vectors(self):
@@ -245,6 +200,490 @@ class Rotation3dTests(GeometryTest):
 
 
 
+class TransformTest(GeometryTest):
+
+    def assertRowsAlmostEqual(self, rows1, rows2):
+        self.assertEqual(len(rows1), len(rows2))
+        for row1, row2 in zip(rows1, rows2):
+            self.assertEqual(len(row1), len(row2))
+            for val1, val2 in zip(row1, row2):
+                self.assertAlmostEqual(val1, val2, delta=0.000001)
+
+
+
+class TransformCreationTests(TransformTest):
+
+    def test_can_make_transform(self):
+        transform = Transform()
+        self.assertEqual(transform._dimension, 3)
+        self.assertEqual(transform._matrix, Matrix.identity(4))
+        transform = Transform(2)
+        self.assertEqual(transform._dimension, 2)
+        self.assertEqual(transform._matrix, Matrix.identity(3))
+
+
+    def test_dimension_must_be_valid(self):
+        with self.assertRaises(ValueError):
+            Transform(0)
+        with self.assertRaises(ValueError):
+            Transform(2.5)
+
+
+
+class TransformReprTests(TransformTest):
+
+    def test_transform_repr(self):
+        self.assertEqual(repr(Transform(2)), "<2D Transform>")
+
+
+
+class TransformCompositionTests(TransformTest):
+
+    def test_can_compose_transforms(self):
+        t1, t2 = Transform(2).translate(1, 2), Transform(2).scale(3)
+        self.assertEqual(
+         (t2 @ t1)._matrix.rows(), ((3, 0, 3), (0, 3, 6), (0, 0, 1))
+        )
+        self.assertEqual(
+         (t1 @ t2)._matrix.rows(), ((3, 0, 1), (0, 3, 2), (0, 0, 1))
+        )
+
+
+    def test_can_only_compose_transforms(self):
+        with self.assertRaises(TypeError):
+            Transform(2) @ Matrix.identity(3)
+
+
+    def test_can_only_compose_same_dimension(self):
+        with self.assertRaises(ValueError):
+            Transform(2) @ Transform(3)
+
+
+
+class TransformPropertyTests(TransformTest):
+
+    def test_can_get_dimension(self):
+        self.assertEqual(Transform(2).dimension(), 2)
+
+
+    def test_can_get_matrix(self):
+        transform = Transform(2)
+        self.assertIs(transform.matrix(), transform._matrix)
+
+
+
+class TransformTranslationTests(TransformTest):
+
+    def test_can_translate(self):
+        transform = Transform(2).translate(4, 5)
+        self.assertEqual(
+         transform._matrix.rows(), ((1, 0, 4), (0, 1, 5), (0, 0, 1))
+        )
+        transform = transform.translate(1, -1)
+        self.assertEqual(
+         transform._matrix.rows(), ((1, 0, 5), (0, 1, 4), (0, 0, 1))
+        )
+
+
+    def test_translation_must_be_right_dimension(self):
+        with self.assertRaises(ValueError):
+            Transform(2).translate(1, 2, 3)
+
+
+
+class TransformRotationTests(TransformTest):
+
+    def test_can_rotate_2d(self):
+        transform = Transform(2).rotate(0.5)
+        self.assertRowsAlmostEqual(transform._matrix.rows(), [
+         [cos(0.5), -sin(0.5), 0], [sin(0.5), cos(0.5), 0], [0, 0, 1]
+        ])
+
+
+    def test_can_rotate_3d(self):
+        c, s = cos(0.5), sin(0.5)
+        self.assertRowsAlmostEqual(Transform().rotate(0.5, 0)._matrix.rows(), [
+         [1, 0, 0, 0], [0, c, -s, 0], [0, s, c, 0], [0, 0, 0, 1]
+        ])
+        self.assertRowsAlmostEqual(Transform().rotate(0.5, 1)._matrix.rows(), [
+         [c, 0, s, 0], [0, 1, 0, 0], [-s, 0, c, 0], [0, 0, 0, 1]
+        ])
+        self.assertRowsAlmostEqual(Transform().rotate(0.5, 2)._matrix.rows(), [
+         [c, -s, 0, 0], [s, c, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]
+        ])
+
+
+    def test_can_rotate_about_axis_vector(self):
+        c, s = cos(0.5), sin(0.5)
+        self.assertRowsAlmostEqual(
+         Transform().rotate(0.5, [0, 0, 2])._matrix.rows(),
+         [[c, -s, 0, 0], [s, c, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+        )
+        self.assertRowsAlmostEqual(
+         Transform().rotate(2 * math.pi / 3, Vector(1, 1, 1))._matrix.rows(),
+         [[0, 0, 1, 0], [1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1]]
+        )
+
+
+    def test_axis_vector_must_be_valid(self):
+        with self.assertRaises(ValueError):
+            Transform().rotate(0.5, [0, 0, 0])
+        with self.assertRaises(ValueError):
+            Transform().rotate(0.5, [0, 1])
+
+
+    def test_can_rotate_in_degrees(self):
+        self.assertRowsAlmostEqual(
+         Transform(2).rotate(90, degrees=True)._matrix.rows(),
+         [[0, -1, 0], [1, 0, 0], [0, 0, 1]]
+        )
+
+
+    def test_axis_must_be_valid(self):
+        with self.assertRaises(ValueError):
+            Transform().rotate(0.5, 3)
+        with self.assertRaises(ValueError):
+            Transform().rotate(0.5)
+
+
+    def test_can_only_rotate_2d_and_3d(self):
+        with self.assertRaises(ValueError):
+            Transform(4).rotate(0.5, 0)
+
+
+
+class TransformScalingTests(TransformTest):
+
+    def test_can_scale_uniformly(self):
+        self.assertEqual(Transform(2).scale(3)._matrix.rows(), (
+         (3, 0, 0), (0, 3, 0), (0, 0, 1)
+        ))
+
+
+    def test_can_scale_by_axis(self):
+        self.assertEqual(Transform(2).scale(3, 4)._matrix.rows(), (
+         (3, 0, 0), (0, 4, 0), (0, 0, 1)
+        ))
+
+
+    def test_scale_must_be_right_dimension(self):
+        with self.assertRaises(ValueError):
+            Transform(2).scale(1, 2, 3)
+
+
+
+class TransformApplicationTests(TransformTest):
+
+    def test_can_apply_transform(self):
+        Transform().rotate(math.pi / 2, 2).translate(1, 1, 1).apply(
+         self.v1, self.v2
+        )
+        self.assertRowsAlmostEqual(
+         [self.v1._values, self.v2._values], [[-1, 2, 4], [-4, 5, 7]]
+        )
+
+
+    def test_can_apply_translation(self):
+        Transform().translate(1, 1, 1).apply(self.v1, self.v2)
+        self.assertEqual(self.v1._values, [2, 3, 4])
+        self.assertEqual(self.v2._values, [5, 6, 7])
+
+
+    def test_application_keeps_storage(self):
+        values = self.v1._values
+        Transform().rotate(0.5, 0).translate(1, 2, 3).apply(self.v1)
+        self.assertIs(self.v1._values, values)
+        Transform().translate(1, 2, 3).apply(self.v1)
+        self.assertIs(self.v1._values, values)
+
+
+    def test_can_apply_to_compact_vectors(self):
+        vector = Vector(1, 2, 3, compact=True)
+        Transform().scale(2).apply(vector)
+        self.assertTrue(vector.is_compact())
+        self.assertEqual(vector.values(), (2, 4, 6))
+
+
+    def test_can_apply_to_vector_arrays(self):
+        vectors = VectorArray([1, 2, 3], [4, 5, 6])
+        view = vectors[1]
+        Transform().rotate(math.pi / 2, 2).translate(1, 1, 1).apply(
+         vectors, self.v1
+        )
+        self.assertRowsAlmostEqual(
+         [vectors._values, self.v1._values], [[-1, 2, 4, -4, 5, 7], [-1, 2, 4]]
+        )
+        self.assertRowsAlmostEqual([view.values()], [[-4, 5, 7]])
+
+
+    def test_can_apply_translation_to_vector_arrays(self):
+        vectors = VectorArray([1, 2, 3], [4, 5, 6])
+        Transform().translate(1, 1, 1).apply(vectors)
+        self.assertEqual(list(vectors._values), [2, 3, 4, 5, 6, 7])
+
+
+    def test_application_needs_vectors(self):
+        with self.assertRaises(TypeError):
+            Transform().apply(self.v1, "vector")
+
+
+    def test_application_needs_right_dimension(self):
+        with self.assertRaises(ValueError):
+            Transform(2).apply(self.v1)
+        with self.assertRaises(ValueError):
+            Transform(2).apply(VectorArray([1, 2, 3]))
+
+
+
+class InPlaceTranslationTests(TestCase):
+
+    def test_can_translate_buffers(self):
+        buffers = [[1, 2, 3], array("d", [4, 5, 6, 7, 8, 9])]
+        _translate_in_place(buffers, [1, 2, 3])
+        self.assertEqual(buffers, [[2, 4, 6], array("d", [5, 7, 9, 8, 10, 12])])
+
+
+    def test_can_translate_other_dimensions(self):
+        buffers = [[1, 2], array("d", [1, 2, 3, 4])]
+        _translate_in_place(buffers, [1, -1])
+        self.assertEqual(buffers, [[2, 1], array("d", [2, 1, 4, 3])])
+
+
+
+class InPlaceTransformationTests(TestCase):
+
+    def test_can_transform_3d_buffers(self):
+        buffers = [[1, 2, 3], array("d", [1, 0, 0, 0, 1, 0])]
+        _transform_in_place(
+         buffers, [[0, -1, 0], [1, 0, 0], [0, 0, 2]], [1, 1, 1]
+        )
+        self.assertEqual(buffers, [
+         [-1, 2, 7], array("d", [1, 2, 1, 0, 1, 1])
+        ])
+
+
+    def test_can_transform_2d_buffers(self):
+        buffers = [[1, 2], array("d", [1, 0, 0, 1])]
+        _transform_in_place(buffers, [[0, -1], [1, 0]], [1, 1])
+        self.assertEqual(buffers, [[-1, 2], array("d", [1, 2, 0, 1])])
+
+
+    def test_can_transform_other_dimensions(self):
+        buffers = [[1, 2, 3, 4], array("d", [1, 0, 0, 0, 0, 0, 0, 1])]
+        _transform_in_place(buffers, [
+         [2, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [1, 0, 0, 1]
+        ], [0, 0, 0, 1])
+        self.assertEqual(buffers, [
+         [2, 3, 2, 6], array("d", [2, 0, 0, 2, 0, 0, 0, 2])
+        ])
+
+
+
+class RotationCacheTests(TransformTest):
+
+    def setUp(self):
+        TransformTest.setUp(self)
+        clear_rotation_cache()
+
+
+    def tearDown(self):
+        clear_rotation_cache()
+
+
+    def test_rotation_matrices_are_cached(self):
+        t1 = Transform().rotate(0.5, 2)
+        t2 = Transform().rotate(0.5, 2)
+        self.assertIs(t1._matrix._values, t2._matrix._values)
+        self.assertEqual(rotation_cache_info(), {
+         "hits": 1, "misses": 1, "size": 1, "maxsize": ROTATION_CACHE_SIZE
+        })
+
+
+    def test_cache_is_keyed_by_dimension_angle_and_axis(self):
+        Transform().rotate(0.5, 2)
+        Transform().rotate(0.5, 1)
+        Transform().rotate(0.6, 2)
+        Transform(2).rotate(0.5)
+        Transform().rotate(0.5, [0, 0, 1])
+        Transform().rotate(0.5, Vector(0, 0, 1))
+        self.assertEqual(rotation_cache_info()["misses"], 5)
+        self.assertEqual(rotation_cache_info()["hits"], 1)
+
+
+    def test_cache_keys_are_after_degree_conversion(self):
+        Transform().rotate(90, 2, degrees=True)
+        Transform().rotate(math.pi / 2, 2)
+        self.assertEqual(rotation_cache_info()["hits"], 1)
+
+
+    def test_cached_matrices_are_protected(self):
+        t1 = Transform().rotate(0.5, 2)
+        t1._matrix.gauss()
+        t2 = Transform().rotate(0.5, 2)
+        self.assertRowsAlmostEqual(t2._matrix.rows(), [
+         [cos(0.5), -sin(0.5), 0, 0], [sin(0.5), cos(0.5), 0, 0],
+         [0, 0, 1, 0], [0, 0, 0, 1]
+        ])
+
+
+    def test_composed_rotations_use_cache(self):
+        transform = Transform().translate(1, 2, 3)
+        Transform().rotate(0.5, 0)
+        self.assertRowsAlmostEqual(transform.rotate(0.5, 0)._matrix.rows(), [
+         [1, 0, 0, 1], [0, cos(0.5), -sin(0.5), 2 * cos(0.5) - 3 * sin(0.5)],
+         [0, sin(0.5), cos(0.5), 2 * sin(0.5) + 3 * cos(0.5)], [0, 0, 0, 1]
+        ])
+        self.assertEqual(rotation_cache_info()["hits"], 1)
+
+
+    @patch("points.geometry.ROTATION_CACHE_SIZE", 2)
+    def test_cache_discards_least_recently_used(self):
+        for angle in (0.1, 0.2, 0.1, 0.3):
+            Transform().rotate(angle, 0)
+        self.assertEqual(list(points.geometry._rotation_cache), [
+         (3, 0.1, 0), (3, 0.3, 0)
+        ])
+        self.assertEqual(rotation_cache_info(), {
+         "hits": 1, "misses": 3, "size": 2, "maxsize": 2
+        })
+
+
+    @patch("points.geometry.ROTATION_CACHE_SIZE", 0)
+    def test_cache_can_be_turned_off(self):
+        Transform().rotate(0.5, 0)
+        Transform().rotate(0.5, 0)
+        self.assertEqual(rotation_cache_info()["misses"], 2)
+        self.assertEqual(rotation_cache_info()["size"], 0)
+
+
+    def test_invalid_axes_are_not_cached(self):
+        with self.assertRaises(ValueError):
+            Transform().rotate(0.5, [0, 0, 0])
+        with self.assertRaises(ValueError):
+            Transform().rotate(0.5, [[0], [0], [1]])
+        self.assertEqual(rotation_cache_info()["size"], 0)
+
+
+    def test_can_clear_cache(self):
+        Transform().rotate(0.5, 0)
+        Transform().rotate(0.5, 0)
+        clear_rotation_cache()
+        self.assertEqual(rotation_cache_info(), {
+         "hits": 0, "misses": 0, "size": 0, "maxsize": ROTATION_CACHE_SIZE
+        })
+
+
+
+class RotationCacheSizeTests(TestCase):
+
+    def setUp(self):
+        clear_rotation_cache()
+
+
+    def tearDown(self):
+        set_rotation_cache_size(256)
+        clear_rotation_cache()
+
+
+    def test_can_set_cache_size(self):
+        set_rotation_cache_size(10)
+        self.assertEqual(rotation_cache_info()["maxsize"], 10)
+        self.assertEqual(points.geometry.ROTATION_CACHE_SIZE, 10)
+
+
+    def test_setting_cache_size_discards_oldest_matrices(self):
+        for angle in (0.1, 0.2, 0.3):
+            Transform().rotate(angle, 0)
+        set_rotation_cache_size(1)
+        self.assertEqual(list(points.geometry._rotation_cache), [(3, 0.3, 0)])
+
+
+    def test_setting_cache_size_to_zero_turns_cache_off(self):
+        set_rotation_cache_size(0)
+        Transform().rotate(0.5, 0)
+        Transform().rotate(0.5, 0)
+        self.assertEqual(rotation_cache_info()["misses"], 2)
+        self.assertEqual(rotation_cache_info()["size"], 0)
+
+
+    def test_cache_size_must_be_non_negative_integer(self):
+        for size in (-1, 1.5, "10", True):
+            with self.assertRaises(ValueError):
+                set_rotation_cache_size(size)
+        self.assertEqual(rotation_cache_info()["maxsize"], 256)
+
+
+    def test_package_does_not_export_mutable_size(self):
+        self.assertFalse(hasattr(points, "ROTATION_CACHE_SIZE"))
+        for name in ("OrderedDict", "ProcessPoolExecutor", "sqrt", "mul"):
+            self.assertFalse(hasattr(points, name))
+        self.assertIs(points.set_rotation_cache_size, set_rotation_cache_size)
+
+
+
+class AxisRotationTests(GeometryTest):
+
+    @patch("points.geometry.Transform")
+    def test_can_rotate_about_axis(self, mock_transform):
+        transform = mock_transform.return_value
+        rotate_vectors_about_axis(0.5, [1, 1, 0], self.v1, self.v2)
+        mock_transform.assert_called_with(3)
+        transform.rotate.assert_called_with(0.5, [1, 1, 0])
+        transform.rotate.return_value.apply.assert_called_with(self.v1, self.v2)
+        self.assertFalse(transform.translate.called)
+
+
+    @patch("points.geometry.Transform")
+    def test_can_rotate_about_axis_through_point(self, mock_transform):
+        transform = mock_transform.return_value
+        transform.dimension.return_value = 3
+        rotate_vectors_about_axis(
+         0.5, [1, 1, 0], self.v1, self.v2, point=[1, 2, 3]
+        )
+        transform.translate.assert_called_with(-1, -2, -3)
+        rotated = transform.translate.return_value.rotate
+        rotated.assert_called_with(0.5, [1, 1, 0])
+        rotated.return_value.translate.assert_called_with(1, 2, 3)
+        rotated.return_value.translate.return_value.apply.assert_called_with(
+         self.v1, self.v2
+        )
+
+
+    def test_can_rotate_vectors_about_axis(self):
+        vectors = VectorArray([1, 0, 0], [0, 1, 0])
+        rotate_vectors_about_axis(
+         120, [1, 1, 1], self.v1, vectors, degrees=True, trim=6
+        )
+        self.assertEqual(self.v1._values, [3, 1, 2])
+        self.assertEqual(list(vectors._values), [0, 1, 0, 0, 0, 1])
+
+
+    def test_trimming_leaves_axis_unchanged(self):
+        axis = Vector(0.123456, 0.654321, 1.0)
+        vector = Vector(0.123456, 0.654321, 2.0)
+        rotate_vectors_about_axis(0.3, axis, vector, trim=2)
+        self.assertEqual(axis.values(), (0.123456, 0.654321, 1.0))
+        for val in vector.values():
+            self.assertEqual(val, round(val, 2))
+
+
+    def test_rotation_needs_vectors(self):
+        with self.assertRaises(TypeError):
+            rotate_vectors_about_axis(0.5, [0, 0, 1], self.v1, "vector")
+
+
+    def test_rotation_needs_3d_vectors(self):
+        self.v2._values.pop()
+        with self.assertRaises(ValueError):
+            rotate_vectors_about_axis(0.5, [0, 0, 1], self.v1, self.v2)
+
+
+    def test_axis_must_be_valid(self):
+        with self.assertRaises(ValueError):
+            rotate_vectors_about_axis(0.5, [0, 0, 0], self.v1)
+
+
+
 class VectorAlignmentTests(GeometryTest):
 
     @patch("points.geometry.Vector")
@@ -267,3 +706,188 @@ class VectorAlignmentTests(GeometryTest):
             align_vectors_to_plane(2, 3, self.v1, self.v2, self.v3)
         with self.assertRaises(ValueError):
             align_vectors_to_plane(2, 2, self.v1, self.v2, self.v3)
+
+
+
+class SuperpositionTests(TestCase):
+
+    def setUp(self):
+        self.target = [
+         Vector(0, 0, 0), Vector(2, 0, 0), Vector(0, 3, 0), Vector(1, 1, 4)
+        ]
+        self.mobile = [Vector(*v.values()) for v in self.target]
+        Transform().rotate(1.2, [1, -2, 0.5]).translate(5, -3, 2).apply(
+         *self.mobile
+        )
+
+
+    def assertSetsAlmostEqual(self, set1, set2):
+        for v1, v2 in zip(set1, set2):
+            for val1, val2 in zip(v1, v2):
+                self.assertAlmostEqual(val1, val2, delta=0.000001)
+
+
+    def test_can_superimpose_identical_shapes(self):
+        transform, rmsd = superimpose(self.mobile, self.target)
+        self.assertIsInstance(transform, Transform)
+        self.assertAlmostEqual(rmsd, 0, delta=0.000001)
+        self.assertSetsAlmostEqual(self.mobile, self.target)
+
+
+    def test_transform_moves_original_positions(self):
+        original = [Vector(*v.values()) for v in self.mobile]
+        transform, rmsd = superimpose(self.mobile, self.target)
+        transform.apply(*original)
+        self.assertSetsAlmostEqual(original, self.target)
+
+
+    def test_can_superimpose_vector_arrays(self):
+        mobile = VectorArray(*self.mobile)
+        transform, rmsd = superimpose(mobile, VectorArray(*self.target))
+        self.assertAlmostEqual(rmsd, 0, delta=0.000001)
+        self.assertSetsAlmostEqual(mobile, self.target)
+
+
+    def test_rmsd_of_different_shapes(self):
+        target = [Vector(-1, 0, 0), Vector(1, 0, 0)]
+        mobile = [Vector(0, -2, 0), Vector(0, 2, 0)]
+        transform, rmsd = superimpose(mobile, target)
+        self.assertAlmostEqual(rmsd, 1, delta=0.000001)
+        self.assertSetsAlmostEqual(mobile, [(-2, 0, 0), (2, 0, 0)])
+
+
+    def test_mirror_images_are_not_reflected(self):
+        target = [
+         Vector(1, 0, 0), Vector(0, 1, 0), Vector(0, 0, 1), Vector(0, 0, 0)
+        ]
+        mobile = [
+         Vector(-1, 0, 0), Vector(0, 1, 0), Vector(0, 0, 1), Vector(0, 0, 0)
+        ]
+        transform, rmsd = superimpose(mobile, target)
+        self.assertGreater(rmsd, 0.1)
+        self.assertAlmostEqual(
+         transform.matrix()[0:3, 0:3].determinant(), 1, delta=0.000001
+        )
+
+
+    def test_sets_must_be_vectors(self):
+        with self.assertRaises(TypeError):
+            superimpose(self.mobile[:3] + ["vector"], self.target)
+
+
+    def test_sets_must_be_3d(self):
+        with self.assertRaises(ValueError):
+            superimpose([Vector(1, 2)], [Vector(1, 2)])
+        with self.assertRaises(ValueError):
+            superimpose(VectorArray([1, 2]), VectorArray([1, 2]))
+
+
+    def test_sets_must_be_same_size(self):
+        with self.assertRaises(ValueError):
+            superimpose(self.mobile[:3], self.target)
+
+
+    def test_sets_must_not_be_empty(self):
+        with self.assertRaises(ValueError):
+            superimpose([], [])
+
+
+
+class RmsdMatrixTests(TestCase):
+
+    def setUp(self):
+        self.sets = [VectorArray(
+         [0, 0, 0], [2, 0, 0], [0, 3, 0], [1, 1, 4]
+        ) for _ in range(4)]
+        Transform().rotate(1.2, [1, -2, 0.5]).translate(5, -3, 2).apply(
+         self.sets[1]
+        )
+        self.sets[2][3] = Vector(1, 1, 5)
+        self.sets[3][0] = Vector(0, 0, -1)
+
+
+    def test_can_get_rmsd_matrix(self):
+        matrix = rmsd_matrix(self.sets)
+        self.assertIsInstance(matrix, CondensedMatrix)
+        self.assertEqual(matrix.size(), (4, 4))
+        for i in range(4):
+            for j in range(4):
+                mobile = VectorArray(*self.sets[i])
+                self.assertAlmostEqual(
+                 matrix[i, j], superimpose(mobile, self.sets[j])[1],
+                 delta=0.000001
+                )
+
+
+    def test_sets_are_not_moved(self):
+        values = list(self.sets[1]._values)
+        rmsd_matrix(self.sets)
+        self.assertEqual(list(self.sets[1]._values), values)
+
+
+    def test_can_use_vector_sequences(self):
+        matrix = rmsd_matrix([list(vectors) for vectors in self.sets])
+        self.assertEqual(matrix.values(), rmsd_matrix(self.sets).values())
+
+
+    @patch("points.geometry.ProcessPoolExecutor")
+    def test_single_worker_does_not_make_processes(self, mock_executor):
+        rmsd_matrix(self.sets, workers=1)
+        self.assertFalse(mock_executor.called)
+
+
+    @patch("points.geometry._POOL_INITIALIZERS", False)
+    @patch("points.geometry.ProcessPoolExecutor")
+    def test_serial_without_pool_initializers(self, mock_executor):
+        self.assertEqual(
+         rmsd_matrix(self.sets, workers=2).values(),
+         rmsd_matrix(self.sets).values()
+        )
+        self.assertFalse(mock_executor.called)
+
+
+    def test_can_use_workers(self):
+        self.assertEqual(
+         rmsd_matrix(self.sets, workers=2).values(),
+         rmsd_matrix(self.sets).values()
+        )
+
+
+    def test_fewer_than_two_sets(self):
+        self.assertEqual(rmsd_matrix(self.sets[:1], workers=2).size(), (1, 1))
+        self.assertEqual(rmsd_matrix([]).size(), (0, 0))
+
+
+    def test_sets_must_be_same_size(self):
+        with self.assertRaises(ValueError):
+            rmsd_matrix([self.sets[0], list(self.sets[1])[:3]])
+
+
+    def test_sets_must_not_be_empty(self):
+        with self.assertRaises(ValueError):
+            rmsd_matrix([[], []])
+
+
+    def test_sets_must_be_3d(self):
+        with self.assertRaises(ValueError):
+            rmsd_matrix([VectorArray([1, 2]), VectorArray([1, 2])])
+
+
+
+class RmsdPairTests(TestCase):
+
+    def test_any_run_of_pairs(self):
+        rows = [[float(i), 1, 2, 3, 4 * i, 5, 6, 7, i * i] for i in range(5)]
+        sets = _split_sets(rows)
+        values = _rmsd_pairs(sets, 0, 10)
+        for start in range(11):
+            for stop in range(start, 11):
+                self.assertEqual(
+                 _rmsd_pairs(sets, start, stop), values[start:stop]
+                )
+
+
+    def test_sets_are_split_into_axes(self):
+        self.assertEqual(_split_sets([[1, 2, 3, 4, 5, 6]]), [
+         ([[1, 2], [3, 4], [5, 6]], 91)
+        ])
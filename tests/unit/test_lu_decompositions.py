@@ -0,0 +1,134 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch, MagicMock
+from points.matrices import Matrix, LUDecomposition
+from points.vectors import Vector
+
+class LUDecompositionTest(TestCase):
+
+    def setUp(self):
+        self.matrix = Matrix([2, 1, -1], [-3, -1, 2], [-2, 1, 2])
+
+
+
+class LUDecompositionCreationTests(LUDecompositionTest):
+
+    def test_can_make_lu_decomposition(self):
+        lu = LUDecomposition(self.matrix)
+        self.assertEqual(lu._permutation, [1, 2, 0])
+        self.assertEqual(lu._sign, 1)
+        self.assertEqual(lu._lu[0], [-3, -1, 2])
+        self.assertFalse(lu._singular)
+
+
+    def test_matrix_must_be_square(self):
+        with self.assertRaises(ValueError):
+            LUDecomposition(Matrix([1, 2, 3], [4, 5, 6]))
+
+
+    def test_singular_matrices_detected(self):
+        self.assertTrue(LUDecomposition(Matrix([1, 2], [2, 4]))._singular)
+        self.assertTrue(LUDecomposition(Matrix([0.1, 0.2], [0.3, 0.6]))._singular)
+        self.assertTrue(LUDecomposition(Matrix([0, 0], [0, 0]))._singular)
+
+
+    def test_badly_scaled_matrices_not_singular(self):
+        self.assertFalse(LUDecomposition(Matrix([1e-20, 0], [0, 1.0]))._singular)
+        self.assertFalse(LUDecomposition(Matrix([0, 1.0], [1e-20, 0]))._singular)
+        lu = LUDecomposition(Matrix([1e-20, 0], [0, 1.0]))
+        self.assertEqual(lu.solve(Vector(1, 1)).values(), (1e20, 1))
+
+
+
+class LUDecompositionReprTests(LUDecompositionTest):
+
+    def test_lu_decomposition_repr(self):
+        lu = LUDecomposition(self.matrix)
+        self.assertEqual(repr(lu), "<LUDecomposition of 3×3 Matrix>")
+
+
+
+class LUDecompositionFactorTests(LUDecompositionTest):
+
+    def test_can_get_lower(self):
+        lower = LUDecomposition(self.matrix).lower()
+        for r, row in enumerate(lower.rows()):
+            self.assertEqual(row[r], 1)
+            self.assertEqual(set(row[r + 1:]), set() if r == 2 else {0})
+
+
+    def test_can_get_upper(self):
+        upper = LUDecomposition(self.matrix).upper()
+        self.assertEqual(upper.rows()[0], (-3, -1, 2))
+        for r, row in enumerate(upper.rows()):
+            self.assertEqual(set(row[:r]), set() if r == 0 else {0})
+
+
+    def test_can_get_permutation(self):
+        permutation = LUDecomposition(self.matrix).permutation()
+        self.assertEqual(permutation.rows(), ((0, 1, 0), (0, 0, 1), (1, 0, 0)))
+
+
+    def test_factors_multiply_to_matrix(self):
+        lu = LUDecomposition(self.matrix)
+        product = lu.lower() @ lu.upper()
+        expected = lu.permutation() @ self.matrix
+        for row1, row2 in zip(product.rows(), expected.rows()):
+            for val1, val2 in zip(row1, row2):
+                self.assertAlmostEqual(val1, val2, delta=0.000001)
+
+
+
+class LUDecompositionSingularityTests(LUDecompositionTest):
+
+    def test_can_check_singularity(self):
+        lu = LUDecomposition(self.matrix)
+        self.assertFalse(lu.is_singular())
+        lu._singular = True
+        self.assertTrue(lu.is_singular())
+
+
+
+class LUDecompositionDeterminantTests(LUDecompositionTest):
+
+    def test_can_get_determinant(self):
+        lu = LUDecomposition(self.matrix)
+        self.assertAlmostEqual(lu.determinant(), -1, delta=0.000001)
+        lu = LUDecomposition(Matrix([0, 1], [1, 0]))
+        self.assertEqual(lu.determinant(), -1)
+
+
+
+class LUDecompositionSolvingTests(LUDecompositionTest):
+
+    def test_can_solve_for_vector(self):
+        x = LUDecomposition(self.matrix).solve(Vector(8, -11, -3))
+        self.assertIsInstance(x, Vector)
+        for val1, val2 in zip(x, [2, 3, -1]):
+            self.assertAlmostEqual(val1, val2, delta=0.000001)
+
+
+    def test_can_solve_for_matrix(self):
+        x = LUDecomposition(self.matrix).solve(Matrix([8, 1], [-11, 0], [-3, 0]))
+        self.assertIsInstance(x, Matrix)
+        self.assertEqual(x.size(), (3, 2))
+        for row1, row2 in zip(x.rows(), ((2, 4), (3, -2), (-1, 5))):
+            for val1, val2 in zip(row1, row2):
+                self.assertAlmostEqual(val1, val2, delta=0.000001)
+
+
+    def test_solving_needs_vector_or_matrix(self):
+        with self.assertRaises(TypeError):
+            LUDecomposition(self.matrix).solve([8, -11, -3])
+
+
+    def test_solving_needs_right_dimension(self):
+        lu = LUDecomposition(self.matrix)
+        with self.assertRaises(ValueError):
+            lu.solve(Vector(8, -11))
+        with self.assertRaises(ValueError):
+            lu.solve(Matrix([8, -11], [1, 2]))
+
+
+    def test_cannot_solve_singular_matrix(self):
+        with self.assertRaises(ValueError):
+            LUDecomposition(Matrix([1, 2], [2, 4])).solve(Vector(1, 2))
@@ -1,7 +1,11 @@
-from unittest import TestCase
+from fractions import Fraction
+from unittest import TestCase, skipIf
 from unittest.mock import Mock, patch, MagicMock
-from points.matrices import Matrix
-from points.vectors import Vector
+from points.matrices import Matrix, MatrixLine, _matmul, _share, _unshare
+from points.matrices import _jacobi_eigen, _pivot_columns, _reduced_row_echelon
+from points.matrices import _householder_qr, _reflect, shared_memory
+from points.matrices import _negligible
+from points.vectors import Vector, VectorArray
 
 class MatrixTest(TestCase):
 
@@ -15,12 +19,17 @@ class MatrixCreationTests(MatrixTest):
 
     def test_can_make_matrix(self):
         matrix = Matrix([1, 2], [3, 4])
-        self.assertEqual(matrix._rows, [[1, 2], [3, 4]])
+        self.assertEqual(matrix._values, [1, 2, 3, 4])
+        self.assertEqual(matrix._shape, (2, 2))
+        self.assertEqual(matrix._strides, (2, 1))
+        self.assertEqual(matrix._offset, 0)
+        self.assertEqual(matrix._cache, {})
 
 
     def test_can_make_matrix_with_tuple(self):
         matrix = Matrix([1, 2], (3, 4))
-        self.assertEqual(matrix._rows, [[1, 2], [3, 4]])
+        self.assertEqual(matrix._values, [1, 2, 3, 4])
+        self.assertEqual(matrix._shape, (2, 2))
 
 
     def test_matrix_rows_must_be_iterable(self):
@@ -38,7 +47,15 @@ class MatrixCreationTests(MatrixTest):
 
     def test_can_make_matrix_with_columns(self):
         matrix = Matrix([1, 2], (0.1, 0.2), [3, 4], columns=True)
-        self.assertEqual(matrix._rows, [[1, 0.1, 3], [2, 0.2, 4]])
+        self.assertEqual(matrix._values, [1, 2, 0.1, 0.2, 3, 4])
+        self.assertEqual(matrix._shape, (2, 3))
+        self.assertEqual(matrix._strides, (1, 2))
+        self.assertEqual(matrix._row_lists(), [[1, 0.1, 3], [2, 0.2, 4]])
+
+
+    def test_cannot_make_empty_matrix(self):
+        with self.assertRaises(ValueError):
+            Matrix()
 
 
 
@@ -46,11 +63,11 @@ class IdentityMatrixTests(TestCase):
 
     def test_can_get_identity_matrix(self):
         i = Matrix.identity(1)
-        self.assertEqual(i._rows, [[1]])
+        self.assertEqual(i._row_lists(), [[1]])
         i = Matrix.identity(2)
-        self.assertEqual(i._rows, [[1, 0], [0, 1]])
+        self.assertEqual(i._row_lists(), [[1, 0], [0, 1]])
         i = Matrix.identity(3)
-        self.assertEqual(i._rows, [[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+        self.assertEqual(i._row_lists(), [[1, 0, 0], [0, 1, 0], [0, 0, 1]])
 
 
     def test_dimensions_must_be_int(self):
@@ -119,7 +136,7 @@ class MatrixAdditionTests(TestCase):
 
     def setUp(self):
         self.matrix2 = Mock(Matrix)
-        self.matrix2._rows = [[10, 20], [30, 40], [50, 60]]
+        self.matrix2._flat.return_value = [10, 20, 30, 40, 50, 60]
         self.patch1 = patch("points.matrices.Matrix.size")
         self.mock_size = self.patch1.start()
         self.mock_size.return_value = self.matrix2.size.return_value = (3, 2)
@@ -145,7 +162,7 @@ class MatrixAdditionTests(TestCase):
     def test_can_add_matrices(self):
         matrix = Matrix([1, 2], [3, 4], [5, 6])
         matrix3 = matrix + self.matrix2
-        self.assertEqual(matrix3._rows, [[11, 22], [33, 44], [55, 66]])
+        self.assertEqual(matrix3._row_lists(), [[11, 22], [33, 44], [55, 66]])
 
 
 
@@ -153,7 +170,7 @@ class MatrixSubtractionTests(TestCase):
 
     def setUp(self):
         self.matrix2 = Mock(Matrix)
-        self.matrix2._rows = [[10, 20], [30, 40], [50, 60]]
+        self.matrix2._flat.return_value = [10, 20, 30, 40, 50, 60]
         self.patch1 = patch("points.matrices.Matrix.size")
         self.mock_size = self.patch1.start()
         self.mock_size.return_value = self.matrix2.size.return_value = (3, 2)
@@ -179,7 +196,7 @@ class MatrixSubtractionTests(TestCase):
     def test_can_subtract_matrices(self):
         matrix = Matrix([1, 2], [3, 4], [5, 6])
         matrix3 = matrix - self.matrix2
-        self.assertEqual(matrix3._rows, [[-9, -18], [-27, -36], [-45, -54]])
+        self.assertEqual(matrix3._row_lists(), [[-9, -18], [-27, -36], [-45, -54]])
 
 
 
@@ -188,13 +205,13 @@ class MatrixScalarMultiplicationTests(TestCase):
     def test_can_multiply_matrix_by_number(self):
         matrix = Matrix([1, 2], [3, 4], [5, 6])
         matrix2 = matrix * 2
-        self.assertEqual(matrix2._rows, [[2, 4], [6, 8], [10, 12]])
+        self.assertEqual(matrix2._row_lists(), [[2, 4], [6, 8], [10, 12]])
 
 
     def test_can_multiply_number_by_matrix(self):
         matrix = Matrix([1, 2], [3, 4], [5, 6])
         matrix2 = 2 * matrix
-        self.assertEqual(matrix2._rows, [[2, 4], [6, 8], [10, 12]])
+        self.assertEqual(matrix2._row_lists(), [[2, 4], [6, 8], [10, 12]])
 
 
     def test_matrix_multiplication_requires_numbers(self):
@@ -255,12 +272,11 @@ class MatrixMatMultiplicationTests(TestCase):
 
     def setUp(self):
         self.matrix2 = Mock(Matrix)
-        self.matrix2._rows = [[10, 20, 30], [40, 50, 60]]
+        self.matrix2._column_lists.return_value = [[10, 40], [20, 50], [30, 60]]
         self.patch1 = patch("points.matrices.Matrix.size")
         self.mock_size = self.patch1.start()
         self.mock_size.return_value = (3, 2)
         self.matrix2.size.return_value = (2, 3)
-        self.matrix2.columns.return_value = ((10, 40), (20, 50), (30, 60))
 
 
     def tearDown(self):
@@ -283,18 +299,30 @@ class MatrixMatMultiplicationTests(TestCase):
         matrix = Matrix([1, 2], [3, 4], [5, 6])
         matrix3 = matrix @ self.matrix2
         self.assertEqual(
-         matrix3._rows, [[90, 120, 150], [190, 260, 330], [290, 400, 510]]
+         matrix3._row_lists(), [[90, 120, 150], [190, 260, 330], [290, 400, 510]]
         )
 
 
     def test_can_mat_mul_vectors(self):
         matrix = Matrix([1, 2], [3, 4])
         vector = Mock(Vector)
-        vector.values.return_value = [5, 6]
+        vector._values = [5, 6]
         vector.__len__, vector.__len__.return_value = MagicMock(), 2
         output = matrix @ vector
         self.assertIsInstance(output, Vector)
         self.assertEqual(output._values, [17, 39])
+        self.assertFalse(vector.values.called)
+
+
+    def test_can_mat_mul_compact_vectors(self):
+        matrix = Matrix([1, 2], [3, 4])
+        output = matrix @ Vector(5, 6, compact=True)
+        self.assertTrue(output.is_compact())
+        self.assertEqual(list(output._values), [17, 39])
+        output = matrix @ VectorArray([1, 1], [5, 6])[1]
+        self.assertTrue(output.is_compact())
+        self.assertEqual(list(output._values), [17, 39])
+        self.assertFalse((matrix @ Vector(5, 6)).is_compact())
 
 
     def test_vector_must_be_right_size_for_matmul(self):
@@ -307,6 +335,146 @@ class MatrixMatMultiplicationTests(TestCase):
 
 
 
+class MatrixMultiplicationKernelTests(TestCase):
+
+    def setUp(self):
+        self.rows = [[1, 2], [3, 4], [5, 6]]
+        self.columns = [[10, 40], [20, 50], [30, 60], [1, 0], [0, 1]]
+        self.product = [
+         90, 120, 150, 1, 2, 190, 260, 330, 3, 4, 290, 400, 510, 5, 6
+        ]
+
+
+    def test_can_multiply_unblocked(self):
+        self.assertEqual(_matmul(self.rows, self.columns), self.product)
+
+
+    @patch("points.matrices.MATMUL_BLOCK_THRESHOLD", 2)
+    @patch("points.matrices.MATMUL_BLOCK_SIZE", 2)
+    def test_can_multiply_blocked(self):
+        self.assertEqual(_matmul(self.rows, self.columns), self.product)
+
+
+    @patch("points.matrices._matmul")
+    def test_matmul_uses_kernel(self, mock_matmul):
+        mock_matmul.return_value = [1, 2, 3, 4]
+        matrix = Matrix([1, 2], [3, 4]) @ Matrix([5, 6], [7, 8])
+        mock_matmul.assert_called_with([[1, 2], [3, 4]], [[5, 7], [6, 8]])
+        self.assertEqual(matrix._row_lists(), [[1, 2], [3, 4]])
+
+
+
+class JacobiEigenTests(TestCase):
+
+    def test_diagonal_matrix(self):
+        values, vectors = _jacobi_eigen([[2, 0], [0, 3]])
+        self.assertEqual(values, [2, 3])
+        self.assertEqual(vectors, [[1, 0], [0, 1]])
+
+
+    def test_symmetric_matrix(self):
+        rows = [[4, 1, 2, 0.5], [1, 3, 0, 1], [2, 0, 5, 2], [0.5, 1, 2, 1]]
+        values, vectors = _jacobi_eigen(rows)
+        self.assertAlmostEqual(sum(values), 13, delta=0.000001)
+        for value, vector in zip(values, vectors):
+            for row, val in zip(rows, vector):
+                self.assertAlmostEqual(
+                 sum(a * b for a, b in zip(row, vector)), value * val,
+                 delta=0.000001
+                )
+
+
+    def test_eigenvectors_are_orthonormal(self):
+        values, vectors = _jacobi_eigen([[2, 1, 1], [1, 2, 1], [1, 1, 2]])
+        self.assertEqual(sorted(round(val, 6) for val in values), [1, 1, 4])
+        for i, v1 in enumerate(vectors):
+            for j, v2 in enumerate(vectors):
+                self.assertAlmostEqual(
+                 sum(a * b for a, b in zip(v1, v2)), i == j, delta=0.000001
+                )
+
+
+
+class MatrixSharingTests(TestCase):
+
+    def test_exact_rows_not_put_in_shared_memory(self):
+        block, shared = _share([[1, 2], [3, 4]])
+        self.assertIsNone(block)
+        self.assertEqual(shared, [[1, 2], [3, 4]])
+        self.assertEqual(_unshare(shared), [[1, 2], [3, 4]])
+
+
+    @skipIf(shared_memory is None, "shared memory needs Python 3.8")
+    def test_float_rows_put_in_shared_memory(self):
+        block, shared = _share([[1.5, 2], [3, 4], [5, 6]])
+        try:
+            self.assertEqual(shared, (block.name, 3, 2))
+            self.assertEqual(_unshare(shared), [[1.5, 2], [3, 4], [5, 6]])
+        finally:
+            block.close()
+            block.unlink()
+
+
+    @patch("points.matrices.shared_memory", None)
+    def test_rows_used_if_no_shared_memory(self):
+        block, shared = _share([[1.5, 2], [3, 4]])
+        self.assertIsNone(block)
+        self.assertEqual(shared, [[1.5, 2], [3, 4]])
+
+
+
+class MatrixParallelMultiplicationTests(TestCase):
+
+    def setUp(self):
+        self.matrix = Matrix([1, 2], [3, 4], [5, 6])
+        self.matrix2 = Matrix([10, 20, 30], [40, 50, 60])
+        self.product = [[90, 120, 150], [190, 260, 330], [290, 400, 510]]
+
+
+    @patch("points.matrices.ProcessPoolExecutor")
+    def test_serial_multiplication_by_default(self, mock_executor):
+        self.assertEqual(
+         self.matrix.matmul(self.matrix2)._row_lists(), self.product
+        )
+        self.assertEqual(
+         self.matrix.matmul(self.matrix2, workers=1)._row_lists(), self.product
+        )
+        self.assertFalse(mock_executor.called)
+
+
+    @patch("points.matrices.ProcessPoolExecutor")
+    def test_vectors_multiplied_serially(self, mock_executor):
+        vector = Vector(1, 2)
+        self.assertEqual(
+         self.matrix.matmul(vector, workers=2).values(), (5, 11, 17)
+        )
+        self.assertFalse(mock_executor.called)
+
+
+    @patch("points.matrices._POOL_INITIALIZERS", False)
+    @patch("points.matrices.ProcessPoolExecutor")
+    def test_serial_without_pool_initializers(self, mock_executor):
+        self.assertEqual(
+         self.matrix.matmul(self.matrix2, workers=2)._row_lists(), self.product
+        )
+        self.assertFalse(mock_executor.called)
+
+
+    def test_dimensions_must_match(self):
+        with self.assertRaises(ValueError):
+            self.matrix.matmul(self.matrix, workers=2)
+
+
+    def test_can_multiply_in_parallel(self):
+        product = self.matrix.matmul(self.matrix2, workers=2)
+        self.assertEqual(product._row_lists(), self.product)
+        product = (self.matrix * 0.5).matmul(self.matrix2, workers=2)
+        self.assertEqual(
+         product._row_lists(), [[val / 2 for val in row] for row in self.product]
+        )
+
+
+
 class MatrixRowsTests(TestCase):
 
     def test_can_get_rows(self):
@@ -314,6 +482,44 @@ class MatrixRowsTests(TestCase):
         self.assertEqual(matrix.rows(), ((1, 2), (3, 4), (5, 6)))
 
 
+    def test_rows_are_views(self):
+        matrix = Matrix([1, 2], [3, 4], [5, 6])
+        rows = matrix.rows()
+        self.assertIsInstance(rows[0], MatrixLine)
+        self.assertIs(rows[0]._values, matrix._values)
+        self.assertEqual((rows[1]._offset, rows[1]._stride), (2, 1))
+
+
+    def test_rows_can_be_combined_like_tuples(self):
+        matrix = Matrix([1, 2], [3, 4], [5, 6])
+        rows = matrix.rows()
+        self.assertEqual(rows[0] + rows[1], (1, 2, 3, 4))
+        self.assertIsInstance(rows[0] + rows[1], tuple)
+        self.assertEqual(rows[0] + (7,), (1, 2, 7))
+        self.assertEqual((7,) + rows[0], (7, 1, 2))
+        self.assertEqual(rows[2] * 2, (5, 6, 5, 6))
+        self.assertEqual(2 * rows[2], (5, 6, 5, 6))
+        with self.assertRaises(TypeError):
+            rows[0] + [7]
+        with self.assertRaises(TypeError):
+            rows[0] * 1.5
+
+
+
+class MatrixRowTuplesTests(TestCase):
+
+    def test_can_get_row_tuples(self):
+        matrix = Matrix([1, 2], [3, 4], [5, 6])
+        self.assertEqual(matrix._row_tuples(), [(1, 2), (3, 4), (5, 6)])
+
+
+    def test_row_tuples_are_cached(self):
+        matrix = Matrix([1, 2], [3, 4], [5, 6])
+        self.assertIs(matrix._row_tuples(), matrix._row_tuples())
+        matrix.gauss()
+        self.assertEqual(matrix._row_tuples()[0], (5, 6))
+
+
 
 class MatrixColumnsTests(TestCase):
 
@@ -322,13 +528,137 @@ class MatrixColumnsTests(TestCase):
         self.assertEqual(matrix.columns(), ((1, 3, 5), (2, 4, 6)))
 
 
+    def test_columns_are_views(self):
+        matrix = Matrix([1, 2], [3, 4], [5, 6])
+        columns = matrix.columns()
+        self.assertIsInstance(columns[0], MatrixLine)
+        self.assertIs(columns[0]._values, matrix._values)
+        self.assertEqual((columns[1]._offset, columns[1]._stride), (1, 2))
+
+
+    def test_columns_can_be_combined_like_tuples(self):
+        matrix = Matrix([1, 2], [3, 4], [5, 6])
+        columns = matrix.columns()
+        self.assertEqual(columns[0] + columns[1], (1, 3, 5, 2, 4, 6))
+        self.assertEqual(columns[1] * 2, (2, 4, 6, 2, 4, 6))
+
+
 
 class MatrixTranspositionTests(TestCase):
 
     def test_can_transpose_matrix(self):
         matrix = Matrix([1, 2], [3, 4], [5, 6])
         matrix_t = matrix.transposed()
-        self.assertEqual(matrix_t._rows, [[1, 3, 5], [2, 4, 6]])
+        self.assertEqual(matrix_t._row_lists(), [[1, 3, 5], [2, 4, 6]])
+
+
+    def test_transposed_matrix_is_view(self):
+        matrix = Matrix([1, 2], [3, 4], [5, 6])
+        matrix_t = matrix.transposed()
+        self.assertIs(matrix_t._values, matrix._values)
+        self.assertEqual(matrix_t._shape, (2, 3))
+        self.assertEqual(matrix_t._strides, (1, 2))
+        self.assertEqual(matrix_t.transposed(), matrix)
+
+
+    def test_views_unaffected_by_changes_in_place(self):
+        matrix = Matrix([1, 2], [3, 4], [5, 6])
+        matrix_t, row = matrix.transposed(), matrix.rows()[1]
+        matrix.gauss()
+        self.assertEqual(matrix_t._row_lists(), [[1, 3, 5], [2, 4, 6]])
+        self.assertEqual(row, (3, 4))
+        matrix_t.gauss()
+        self.assertEqual(matrix.rows()[0], (5, 6))
+
+
+
+class MatrixIndexingTests(TestCase):
+
+    def test_can_get_values(self):
+        matrix = Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9])
+        self.assertEqual(matrix[0, 0], 1)
+        self.assertEqual(matrix[1, 2], 6)
+        self.assertEqual(matrix[-1, -2], 8)
+        self.assertEqual(matrix.transposed()[1, 2], 8)
+
+
+    def test_indices_must_be_pairs(self):
+        matrix = Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9])
+        with self.assertRaises(TypeError):
+            matrix[0]
+        with self.assertRaises(TypeError):
+            matrix[0, 1, 2]
+
+
+    def test_indices_must_be_in_range(self):
+        matrix = Matrix([1, 2, 3], [4, 5, 6])
+        with self.assertRaises(IndexError):
+            matrix[2, 0]
+        with self.assertRaises(IndexError):
+            matrix[0, -4]
+        with self.assertRaises(IndexError):
+            matrix[5, :]
+        with self.assertRaises(IndexError):
+            matrix[-3, 1:]
+        with self.assertRaises(IndexError):
+            matrix[:, 3]
+
+
+    def test_can_get_submatrix_views(self):
+        matrix = Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9])
+        submatrix = matrix[1:, :2]
+        self.assertIs(submatrix._values, matrix._values)
+        self.assertEqual(submatrix._row_lists(), [[4, 5], [7, 8]])
+        self.assertEqual(matrix[::2, ::2]._row_lists(), [[1, 3], [7, 9]])
+        self.assertEqual(matrix[1, :]._row_lists(), [[4, 5, 6]])
+        self.assertEqual(matrix[:, -1]._row_lists(), [[3], [6], [9]])
+        self.assertEqual(matrix[1:, 1:].transposed()[0:1, :]._row_lists(), [[5, 8]])
+
+
+    def test_submatrices_cannot_be_empty(self):
+        matrix = Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9])
+        with self.assertRaises(ValueError):
+            matrix[3:, :]
+
+
+    def test_submatrices_cannot_have_negative_steps(self):
+        matrix = Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9])
+        with self.assertRaises(ValueError):
+            matrix[::-1, :]
+
+
+
+class MatrixStorageTests(TestCase):
+
+    def test_can_get_row_lists(self):
+        matrix = Matrix([1, 2], [3, 4], [5, 6])
+        rows = matrix._row_lists()
+        self.assertEqual(rows, [[1, 2], [3, 4], [5, 6]])
+        rows[0][0] = 100
+        self.assertEqual(matrix._values, [1, 2, 3, 4, 5, 6])
+
+
+    def test_can_get_column_lists(self):
+        matrix = Matrix([1, 2], [3, 4], [5, 6])
+        self.assertEqual(matrix._column_lists(), [[1, 3, 5], [2, 4, 6]])
+
+
+    def test_can_get_flat_values(self):
+        matrix = Matrix([1, 2], [3, 4], [5, 6])
+        self.assertIs(matrix._flat(), matrix._values)
+        self.assertEqual(matrix.transposed()._flat(), [1, 3, 5, 2, 4, 6])
+        self.assertEqual(matrix[1:, :]._flat(), [3, 4, 5, 6])
+
+
+    def test_can_set_rows(self):
+        matrix = Matrix([1, 2], [3, 4], [5, 6]).transposed()
+        matrix._cache["inverse"] = "INVERSE"
+        matrix._set_rows([[1, 2, 3]])
+        self.assertEqual(matrix._values, [1, 2, 3])
+        self.assertEqual(matrix._shape, (1, 3))
+        self.assertEqual(matrix._strides, (3, 1))
+        self.assertEqual(matrix._offset, 0)
+        self.assertEqual(matrix._cache, {})
 
 
 
@@ -429,7 +759,7 @@ class MatrixMinorsTests(TestCase):
         mock_minor.side_effect = [4, 8, 15, 16, 23, 42, 19, 20, 21]
         matrix = Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9])
         minors = matrix.minors()
-        self.assertEqual(minors._rows, [[4, 8, 15], [16, 23, 42], [19, 20, 21]])
+        self.assertEqual(minors._row_lists(), [[4, 8, 15], [16, 23, 42], [19, 20, 21]])
         mock_minor.assert_any_call(0, 0)
         mock_minor.assert_any_call(0, 1)
         mock_minor.assert_any_call(0, 2)
@@ -449,7 +779,7 @@ class MatrixCofactorsTests(TestCase):
         mock_cof.side_effect = [4, 8, 15, 16, 23, 42, 19, 20, 21]
         matrix = Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9])
         minors = matrix.cofactors()
-        self.assertEqual(minors._rows, [[4, 8, 15], [16, 23, 42], [19, 20, 21]])
+        self.assertEqual(minors._row_lists(), [[4, 8, 15], [16, 23, 42], [19, 20, 21]])
         mock_cof.assert_any_call(0, 0)
         mock_cof.assert_any_call(0, 1)
         mock_cof.assert_any_call(0, 2)
@@ -490,15 +820,203 @@ class MatrixDeterminantTests(TestCase):
         self.assertEqual(matrix.determinant(), -2)
 
 
+    def test_1d_matrix(self):
+        self.mock_width.return_value = 1
+        matrix = Matrix([7])
+        self.assertEqual(matrix.determinant(), 7)
+
+
     @patch("points.matrices.Matrix.cofactor")
     def test_3d_matrix(self, mock_cof):
         self.mock_width.return_value = 3
-        mock_cof.side_effect = [16, -23, 42]
         matrix = Matrix([4, -3, 1], [2, -1, 2], [1, 5, 7])
-        self.assertEqual(matrix.determinant(), 175)
-        mock_cof.assert_any_call(0, 0)
-        mock_cof.assert_any_call(0, 1)
-        mock_cof.assert_any_call(0, 2)
+        self.assertEqual(matrix.determinant(), -21)
+        self.assertFalse(mock_cof.called)
+
+
+    @patch("points.matrices._bareiss_determinant")
+    def test_exact_4d_matrix(self, mock_bareiss):
+        self.mock_width.return_value = 4
+        mock_bareiss.return_value = 36
+        matrix = Matrix([1, 2, 3, 4], [5, 6, 7, 8], [2, 6, 4, 8], [3, 1, 1, 2])
+        self.assertEqual(matrix.determinant(), 36)
+        mock_bareiss.assert_called_with(matrix._row_lists())
+
+
+    def test_exact_4d_matrix_determinant_is_exact(self):
+        self.mock_width.return_value = 4
+        matrix = Matrix([1, 2, 3, 4], [5, 6, 7, 8], [2, 6, 4, 8], [3, 1, 1, 2])
+        self.assertEqual(matrix.determinant(), 72)
+        self.assertIsInstance(matrix.determinant(), int)
+        matrix = Matrix(
+         [Fraction(1, 2), 2, 3, 4], [5, 6, 7, 8], [2, 6, 4, 8], [3, 1, 1, 2]
+        )
+        self.assertEqual(matrix.determinant(), 78)
+        self.assertIsInstance(matrix.determinant(), Fraction)
+
+
+    def test_float_4d_matrix(self):
+        self.mock_width.return_value = 4
+        matrix = Matrix(
+         [1.5, 2, 3, 4], [5, 6, 7, 8], [2, 6, 4, 8], [3, 1, 1, 2]
+        )
+        self.assertAlmostEqual(matrix.determinant(), 66, delta=0.000001)
+
+
+    def test_singular_matrices(self):
+        self.mock_width.return_value = 4
+        matrix = Matrix([1, 2, 3, 4], [2, 4, 6, 8], [2, 6, 4, 8], [3, 1, 1, 2])
+        self.assertEqual(matrix.determinant(), 0)
+        matrix = Matrix([1.0, 2, 3, 4], [2, 4, 6, 8], [2, 6, 4, 8], [3, 1, 1, 2])
+        self.assertEqual(matrix.determinant(), 0)
+
+
+
+class MatrixLUDecompositionTests(TestCase):
+
+    @patch("points.matrices.LUDecomposition")
+    def test_can_get_lu_decomposition(self, mock_lu):
+        mock_lu.return_value = "LU"
+        matrix = Matrix([4, -3, 1], [2, -1, 2], [1, 5, 7])
+        self.assertEqual(matrix.lu(), "LU")
+        mock_lu.assert_called_with(matrix)
+
+
+    @patch("points.matrices.LUDecomposition")
+    def test_lu_decomposition_is_cached(self, mock_lu):
+        matrix = Matrix([4, -3, 1], [2, -1, 2], [1, 5, 7])
+        self.assertIs(matrix.lu(), matrix.lu())
+        self.assertEqual(mock_lu.call_count, 1)
+
+
+    @patch("points.matrices.LUDecomposition")
+    def test_lu_decomposition_cache_cleared_by_elimination(self, mock_lu):
+        mock_lu.side_effect = ["LU1", "LU2"]
+        matrix = Matrix([4, -3, 1], [2, -1, 2], [1, 5, 7])
+        self.assertEqual(matrix.lu(), "LU1")
+        matrix.gauss()
+        self.assertEqual(matrix.lu(), "LU2")
+
+
+
+class HouseholderQRTests(TestCase):
+
+    def assertQR(self, rows, q, r):
+        height, width = len(rows), len(rows[0])
+        for i in range(height):
+            for j in range(width):
+                self.assertAlmostEqual(sum(
+                 q[i][k] * r[k][j] for k in range(len(r))
+                ), rows[i][j], delta=0.000001)
+        for i in range(len(q[0])):
+            for j in range(len(q[0])):
+                self.assertAlmostEqual(
+                 sum(row[i] * row[j] for row in q), i == j, delta=0.000001
+                )
+        for i, row in enumerate(r):
+            self.assertEqual(row[:i], [0] * min(i, width))
+
+
+    def test_square_qr(self):
+        rows = [[12, -51, 4], [6, 167, -68], [-4, 24, -41]]
+        q, r = _householder_qr(rows)
+        self.assertQR(rows, q, r)
+        for val, expected in zip(r[0] + r[1] + r[2], [-14, -21, 14, 0, -175, 70, 0, 0, -35]):
+            self.assertAlmostEqual(val, expected, delta=0.000001)
+
+
+    def test_tall_qr(self):
+        rows = [[1, 2], [3, 4], [5, 6]]
+        q, r = _householder_qr(rows)
+        self.assertEqual((len(q), len(q[0]), len(r)), (3, 3, 3))
+        self.assertQR(rows, q, r)
+        q, r = _householder_qr(rows, reduced=True)
+        self.assertEqual((len(q), len(q[0]), len(r)), (3, 2, 2))
+        self.assertQR(rows, q, r)
+
+
+    def test_wide_qr(self):
+        rows = [[1, 2, 3], [4, 5, 6]]
+        q, r = _householder_qr(rows)
+        self.assertEqual((len(q), len(q[0]), len(r)), (2, 2, 2))
+        self.assertQR(rows, q, r)
+
+
+    def test_qr_of_zero_columns(self):
+        rows = [[0, 1], [0, 2], [0, 3]]
+        q, r = _householder_qr(rows)
+        self.assertQR(rows, q, r)
+
+
+    def test_rows_not_modified(self):
+        rows = [[1, 2], [3, 4]]
+        _householder_qr(rows)
+        self.assertEqual(rows, [[1, 2], [3, 4]])
+
+
+
+class ReflectionTests(TestCase):
+
+    def test_can_reflect_rows(self):
+        rows = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+        _reflect(rows, 1, [1, 1], 1)
+        self.assertEqual(rows, [[1, 2], [-5, -6], [-3, -4]])
+
+
+    def test_can_reflect_some_columns(self):
+        rows = [[1.0, 2.0], [3.0, 4.0]]
+        _reflect(rows, 0, [1, 1], 1, start=1)
+        self.assertEqual(rows, [[1, -4], [3, -2]])
+
+
+
+class MatrixQRTests(TestCase):
+
+    @patch("points.matrices._householder_qr")
+    def test_can_get_qr(self, mock_qr):
+        mock_qr.return_value = ([[0, 1], [1, 0]], [[3, 4], [0, 2]])
+        m = Matrix([0, 2], [3, 4])
+        q, r = m.qr()
+        mock_qr.assert_called_with([[0, 2], [3, 4]], False)
+        self.assertEqual(q._row_lists(), [[0, 1], [1, 0]])
+        self.assertEqual(r._row_lists(), [[3, 4], [0, 2]])
+        m.qr(reduced=True)
+        mock_qr.assert_called_with([[0, 2], [3, 4]], True)
+
+
+    @patch("points.matrices._householder_qr")
+    def test_qr_cached_until_mutation(self, mock_qr):
+        mock_qr.return_value = ([[0, 1], [1, 0]], [[3, 4], [0, 2]])
+        m = Matrix([0, 2], [3, 4])
+        m.qr()
+        q, r = m.qr()
+        self.assertEqual(mock_qr.call_count, 1)
+        q.gauss()
+        self.assertEqual(m.qr()[0]._row_lists(), [[0, 1], [1, 0]])
+        m.gauss()
+        m.qr()
+        self.assertEqual(mock_qr.call_count, 2)
+
+
+    def test_qr_product_is_matrix(self):
+        m = Matrix([2, -1, 0], [1, 3, 2], [0, 4, 1], [5, 5, 5])
+        q, r = m.qr(reduced=True)
+        self.assertEqual((q.size(), r.size()), ((4, 3), (3, 3)))
+        for val1, val2 in zip((q @ r)._flat(), m._flat()):
+            self.assertAlmostEqual(val1, val2, delta=0.000001)
+
+
+
+class MatrixSolvingTests(TestCase):
+
+    @patch("points.matrices.Matrix.lu")
+    def test_can_solve_matrix(self, mock_lu):
+        lu = Mock()
+        mock_lu.return_value = lu
+        lu.solve.return_value = "SOLUTION"
+        matrix = Matrix([4, -3, 1], [2, -1, 2], [1, 5, 7])
+        self.assertEqual(matrix.solve("B"), "SOLUTION")
+        lu.solve.assert_called_with("B")
 
 
 
@@ -516,24 +1034,77 @@ class MatrixAdjointTests(TestCase):
 
 
 
+class NegligiblePivotTests(TestCase):
+
+    def test_pivots_judged_against_row_scale(self):
+        self.assertFalse(_negligible(1e-20, 1e-20, 2))
+        self.assertTrue(_negligible(1e-16, 1, 2))
+        self.assertFalse(_negligible(1e-13, 1, 2))
+
+
+    def test_zero_scale_only_rejects_zero(self):
+        self.assertTrue(_negligible(0, 0, 3))
+        self.assertFalse(_negligible(Fraction(1, 10 ** 30), 0, 3))
+
+
+
 class MatrixInversionTests(TestCase):
 
-    @patch("points.matrices.Matrix.adjoint")
-    @patch("points.matrices.Matrix.determinant")
-    def test_can_get_matrix_inverse(self, mock_det, mock_adjoint):
-        adjoint = Mock()
-        mock_adjoint.return_value = 3
-        mock_det.return_value = 0.25
-        matrix = Matrix([4, -3, 1], [2, -1, 2], [1, 5, 7])
-        self.assertEqual(matrix.inverse(), 12)
-        mock_adjoint.assert_called_with()
-        mock_det.assert_called_with()
+    def test_can_get_matrix_inverse(self):
+        matrix = Matrix([7, 2, 1], [0, 3, -1], [-3, 4, -2])
+        self.assertEqual(
+         matrix.inverse()._row_lists(), [[-2, 8, -5], [3, -11, 7], [9, -34, 21]]
+        )
+        matrix = Matrix([4, 7], [2, 6])
+        self.assertEqual(matrix.inverse()._row_lists(), [[0.6, -0.7], [-0.2, 0.4]])
 
 
-    @patch("points.matrices.Matrix.determinant")
-    def test_no_inverse_if_zero_det(self, mock_det):
-        mock_det.return_value = 0
-        matrix = Matrix([4, -3, 1], [2, -1, 2], [1, 5, 7])
+    def test_can_get_float_matrix_inverse(self):
+        matrix = Matrix([0.5, 1.5], [2.5, 1])
+        inverse = matrix.inverse()
+        for row1, row2 in zip(inverse._row_lists(), [[-4 / 13, 6 / 13], [10 / 13, -2 / 13]]):
+            for val1, val2 in zip(row1, row2):
+                self.assertAlmostEqual(val1, val2, delta=0.000001)
+
+
+    @patch("points.matrices._gauss_jordan_inverse")
+    def test_inverse_is_cached(self, mock_invert):
+        mock_invert.return_value = ([[1, 2], [3, 4]], 5)
+        matrix = Matrix([4, 7], [2, 6])
+        self.assertEqual(matrix.inverse()._row_lists(), [[1, 2], [3, 4]])
+        self.assertEqual(matrix.inverse()._row_lists(), [[1, 2], [3, 4]])
+        self.assertIsNot(matrix.inverse(), matrix.inverse())
+        mock_invert.assert_called_once_with([[4, 7], [2, 6]])
+        matrix.gauss()
+        matrix.inverse()
+        self.assertEqual(mock_invert.call_count, 2)
+
+
+    def test_no_inverse_if_zero_det(self):
+        matrix = Matrix([4, -3, 1], [2, -1, 2], [8, -6, 2])
+        with self.assertRaises(ValueError):
+            matrix.inverse()
+        matrix = Matrix([0.1, 0.2], [0.3, 0.6])
+        with self.assertRaises(ValueError):
+            matrix.inverse()
+
+
+    def test_can_invert_badly_scaled_matrices(self):
+        matrix = Matrix([1e-8, 0, 0], [0, 1e8, 0], [0, 0, 1.0])
+        self.assertEqual(
+         matrix.inverse()._row_lists(), [[1e8, 0, 0], [0, 1e-8, 0], [0, 0, 1]]
+        )
+
+
+    def test_near_singular_error_does_not_claim_zero_determinant(self):
+        matrix = Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9.000000000000001])
+        with self.assertRaises(ValueError) as e:
+            matrix.inverse()
+        self.assertIn("floating point precision", str(e.exception))
+
+
+    def test_no_inverse_if_not_square(self):
+        matrix = Matrix([4, -3, 1], [2, -1, 2])
         with self.assertRaises(ValueError):
             matrix.inverse()
 
@@ -559,17 +1130,168 @@ class MatrixColumnSpaceTests(TestCase):
 
 
 
+class MatrixColumnSpaceBasisTests(TestCase):
+
+    def test_can_get_column_space_basis(self):
+        m = Matrix([1, 2, 3, 4], [2, 4, 7, 9], [3, 6, 10, 13])
+        basis = m.column_space_basis()
+        self.assertEqual(len(basis), 2)
+        self.assertIsInstance(basis[0], Vector)
+        self.assertEqual(basis[0].values(), (1, 2, 3))
+        self.assertEqual(basis[1].values(), (3, 7, 10))
+
+
+    @patch("points.matrices.Matrix.pivot_columns")
+    def test_column_space_basis_uses_pivot_columns(self, mock_pivots):
+        mock_pivots.return_value = (1,)
+        m = Matrix([1, 2], [3, 4])
+        self.assertEqual(
+         m.column_space_basis(exact=False, tolerance=0.1)[0].values(), (2, 4)
+        )
+        mock_pivots.assert_called_with(exact=False, tolerance=0.1)
+
+
+
+class MatrixNullSpaceBasisTests(TestCase):
+
+    def test_can_get_null_space_basis(self):
+        m = Matrix([1, 2, 3, 4], [2, 4, 7, 9], [3, 6, 10, 13])
+        basis = m.null_space_basis()
+        self.assertEqual(len(basis), 2)
+        self.assertEqual(basis[0].values(), (-2, 1, 0, 0))
+        self.assertEqual(basis[1].values(), (-1, 0, -1, 1))
+
+
+    def test_null_space_basis_of_independent_columns(self):
+        self.assertEqual(Matrix([1, 2], [3, 4], [5, 6]).null_space_basis(), ())
+
+
+    @patch("points.matrices.Matrix.rref")
+    def test_null_space_basis_uses_rref(self, mock_rref):
+        mock_rref.return_value = (Matrix([0, 1, 0.5], [0, 0, 0]), (1,), 1)
+        m = Matrix([0, 2, 1], [0, 4, 2])
+        basis = m.null_space_basis(exact=False, tolerance=0.1)
+        mock_rref.assert_called_with(exact=False, tolerance=0.1)
+        self.assertEqual([v.values() for v in basis], [(1, 0, 0), (0, -0.5, 1)])
+
+
+
+class MatrixNullSpaceTests(TestCase):
+
+    @patch("points.matrices.Matrix.null_space_basis")
+    @patch("points.matrices.VectorSpan")
+    def test_can_get_null_space(self, mock_span, mock_basis):
+        mock_basis.return_value = ("v1", "v2")
+        mock_span.return_value = "SPAN"
+        m = Matrix([1, 2, 3], [2, 4, 6])
+        self.assertEqual(m.null_space(exact=True), "SPAN")
+        mock_basis.assert_called_with(exact=True, tolerance=1e-12)
+        mock_span.assert_called_with("v1", "v2")
+
+
+    def test_null_space_is_zero_when_columns_independent(self):
+        space = Matrix([1, 2], [3, 4]).null_space()
+        self.assertEqual(space.rank(), 0)
+        self.assertIn(Vector(0, 0), space)
+        self.assertNotIn(Vector(1, 0), space)
+
+
+    def test_null_space_contains_solutions(self):
+        space = Matrix([1, 2, 3, 4], [2, 4, 7, 9], [3, 6, 10, 13]).null_space()
+        self.assertIn(Vector(-3, 1, -1, 1), space)
+        self.assertNotIn(Vector(1, 1, 1, 1), space)
+
+
+
+class MatrixPivotColumnTests(TestCase):
+
+    def test_can_get_pivot_columns(self):
+        m = Matrix([1, 2, 3, 4], [2, 4, 7, 9], [3, 6, 10, 13])
+        self.assertEqual(m.pivot_columns(), (0, 2))
+        m = Matrix([0, 0], [0, 0])
+        self.assertEqual(m.pivot_columns(), ())
+        m = Matrix([0, 1, 0], [0, 0, 1])
+        self.assertEqual(m.pivot_columns(), (1, 2))
+
+
+    @patch("points.matrices._pivot_columns")
+    def test_exactness_decided_by_values(self, mock_pivots):
+        mock_pivots.return_value = [0]
+        Matrix([1, Fraction(1, 2)], [2, 1]).pivot_columns()
+        mock_pivots.assert_called_with([[1, Fraction(1, 2)], [2, 1]], True, 1e-12)
+        Matrix([1, 0.5], [2, 1]).pivot_columns(tolerance=0.1)
+        mock_pivots.assert_called_with([[1, 0.5], [2, 1]], False, 0.1)
+        Matrix([1, 2], [2, 1]).pivot_columns(exact=False)
+        mock_pivots.assert_called_with([[1, 2], [2, 1]], False, 1e-12)
+
+
+    @patch("points.matrices._pivot_columns")
+    def test_pivot_columns_cached(self, mock_pivots):
+        mock_pivots.return_value = [0, 1]
+        m = Matrix([1, 2], [2, 1])
+        self.assertEqual(m.pivot_columns(), (0, 1))
+        self.assertEqual(m.pivot_columns(), (0, 1))
+        self.assertEqual(mock_pivots.call_count, 1)
+        m.pivot_columns(exact=False)
+        self.assertEqual(mock_pivots.call_count, 2)
+        m.gauss()
+        m.pivot_columns()
+        self.assertEqual(mock_pivots.call_count, 3)
+
+
+
+class PivotColumnFunctionTests(TestCase):
+
+    def test_exact_pivots(self):
+        self.assertEqual(_pivot_columns(
+         [[1, 0, 1], [-2, -3, 1], [3, 3, 0]], True, 0
+        ), [0, 1])
+        self.assertEqual(_pivot_columns(
+         [[0, 2, 4, 1], [0, 1, 2, 3], [0, 3, 6, 4]], True, 0
+        ), [1, 3])
+
+
+    def test_exact_pivots_with_fractions(self):
+        self.assertEqual(_pivot_columns(
+         [[Fraction(1, 3), Fraction(1, 2)], [Fraction(2, 3), 1]], True, 0
+        ), [0])
+        self.assertEqual(_pivot_columns(
+         [[Fraction(1, 3), Fraction(1, 2)], [Fraction(2, 3), Fraction(1, 3)]], True, 0
+        ), [0, 1])
+
+
+    def test_float_pivots_use_tolerance(self):
+        rows = [[0.1, 0.2], [0.3, 0.60000000001]]
+        self.assertEqual(_pivot_columns(rows, False, 1e-12), [0, 1])
+        self.assertEqual(_pivot_columns(rows, False, 1e-9), [0])
+
+
+    def test_rows_not_modified(self):
+        rows = [[1, 2], [3, 4]]
+        _pivot_columns(rows, True, 0)
+        _pivot_columns(rows, False, 1e-12)
+        self.assertEqual(rows, [[1, 2], [3, 4]])
+
+
+
 class MatrixRankTests(TestCase):
 
-    @patch("points.matrices.Matrix.column_space")
-    def test_can_get_matrix_rank(self, mock_space):
-        space = Mock()
-        space.rank.return_value = 400
-        mock_space.return_value = space
+    @patch("points.matrices.Matrix.pivot_columns")
+    def test_can_get_matrix_rank(self, mock_pivots):
+        mock_pivots.return_value = (0, 2, 5)
         m = Matrix([3, 5, 9], [2, 3, 5])
-        self.assertEqual(m.rank(), 400)
-        mock_space.assert_called_with()
-        space.rank.assert_called_with()
+        self.assertEqual(m.rank(), 3)
+        mock_pivots.assert_called_with(exact=None, tolerance=1e-12)
+        m.rank(exact=False, tolerance=0.1)
+        mock_pivots.assert_called_with(exact=False, tolerance=0.1)
+
+
+    def test_rank_of_large_matrix(self):
+        m = Matrix(*[[(i * 7 + j * 13) % 17 + (i == j) for j in range(60)]
+         for i in range(60)])
+        self.assertEqual(m.rank(), 60)
+        m = Matrix(*[[float(i + j) for j in range(60)] for i in range(60)])
+        self.assertEqual(m.rank(), 2)
 
 
 
@@ -580,30 +1302,10 @@ class MatrixFullRankTests(TestCase):
         mock_rank.return_value = 400
         m = Matrix([3, 5, 9], [2, 3, 5])
         self.assertFalse(m.is_full_rank())
-        mock_rank.assert_called_with()
+        mock_rank.assert_called_with(exact=None, tolerance=1e-12)
         mock_rank.return_value = 2
-        self.assertTrue(m.is_full_rank())
-
-
-'''
-class MatrixNullSpaceTests(TestCase):
-
-    @patch("points.matrices.Matrix.is_full_rank")
-    @patch("points.matrices.VectorSpan")
-    @patch("points.matrices.Vector")
-    def test_null_space_is_zero_when_full_rank(self, mock_vec, mock_span, mock_full):
-        mock_full.return_value = True
-        mock_vec.return_value = "VECTOR"
-        mock_span.return_value = "SPAN"
-        m = Matrix([1, 2], [3, 4])
-        space = m.null_space()
-        mock_full.assert_called_with()
-        mock_vec.assert_called_with(0, 0)
-        mock_span.assert_called_with("VECTOR")
-        self.assertEqual(space, "SPAN")
-        m = Matrix([1, 2, 12], [3, 4, 9], [1, 6, 4], [3, 5, 6], [0, 0, 1])
-        m.null_space()
-        mock_vec.assert_called_with(0, 0, 0, 0, 0)'''
+        self.assertTrue(m.is_full_rank(exact=False, tolerance=0.1))
+        mock_rank.assert_called_with(exact=False, tolerance=0.1)
 
 
 
@@ -612,15 +1314,15 @@ class MatrixGaussianEliminationTests(TestCase):
     def test_can_gaussian_eliminate_square_matrices(self):
         m = Matrix([3, 5, 9], [2, 3, 5])
         m.gauss()
-        self.assertEqual(m._rows, [[3, 5, 9], [0, -1 / 3, -1]])
+        self.assertEqual(m._row_lists(), [[3, 5, 9], [0, -1 / 3, -1]])
         m = Matrix([2, 1, -1, 8], [-3, -1, 2, -11], [-2, 1, 2, -3])
         m.gauss()
-        self.assertEqual(m._rows, [
+        self.assertEqual(m._row_lists(), [
          [-3, -1, 2, -11], [0, 5 / 3, 2 / 3, 13 / 3], [0, 0, 1 / 5, -1 / 5]
         ])
         m = Matrix([1, -1, -1, 1], [3, 2, 12, 1], [2, -1, 1, 1])
         m.gauss()
-        self.assertEqual(m._rows, [
+        self.assertEqual(m._row_lists(), [
          [3, 2, 12, 1], [0, -7 / 3, -7, 1 / 3], [0, 0, 0, 3 / 7]
         ])
 
@@ -628,7 +1330,7 @@ class MatrixGaussianEliminationTests(TestCase):
     def test_can_gaussian_eliminate_vertical_matrices(self):
         m = Matrix([3, 5, 9], [2, 3, 5], [4, 6, 8], [3, 6, 7], [1, 2, 3])
         m.gauss()
-        self.assertEqual(m._rows, [
+        self.assertEqual(m._row_lists(), [
          [4, 6, 8], [0, 3 / 2, 1], [0, 0, 8 / 3], [0, 0, 0], [0, 0, 0]
         ])
 
@@ -636,11 +1338,137 @@ class MatrixGaussianEliminationTests(TestCase):
     def test_can_gaussian_eliminate_horizontal_matrices(self):
         m = Matrix([3, 5, 9, 2, 3, 5], [4, 6, 8, 3, 6, 7])
         m.gauss()
-        self.assertEqual(m._rows, [
+        self.assertEqual(m._row_lists(), [
          [4, 6, 8, 3, 6, 7], [0, 0.5, 3, -0.25, -1.5, -0.25]
         ])
 
 
+    def test_can_skip_zero_columns(self):
+        m = Matrix([0, 1, 2], [0, 2, 2], [0, 3, 9])
+        m.gauss()
+        self.assertEqual(m._row_lists(), [[0, 3, 9], [0, 0, -4], [0, 0, 0]])
+
+
+    def test_can_gaussian_eliminate_floats(self):
+        m = Matrix([2.0, 1, -1, 8], [-3, -1, 2, -11], [-2, 1, 2, -3])
+        m.gauss()
+        for row1, row2 in zip(m._row_lists(), [
+         [-3, -1, 2, -11], [0, 5 / 3, 2 / 3, 13 / 3], [0, 0, 1 / 5, -1 / 5]
+        ]):
+            for val1, val2 in zip(row1, row2):
+                self.assertAlmostEqual(val1, val2, delta=0.000001)
+
+
+    def test_float_elimination_uses_tolerance(self):
+        m = Matrix([0.1, 0.2], [0.3, 0.6])
+        m.gauss()
+        self.assertEqual(m._row_lists()[1], [0, 0])
+        m = Matrix([1.0, 2], [2, 4.0001])
+        m.gauss()
+        self.assertNotEqual(m._row_lists()[1], [0, 0])
+        m = Matrix([1.0, 2], [2, 4.0001])
+        m.gauss(tolerance=0.001)
+        self.assertEqual(m._row_lists()[1], [0, 0])
+
+
+    @patch("points.matrices._row_echelon")
+    def test_exactness_chosen_from_values(self, mock_echelon):
+        mock_echelon.return_value = ([[1, 2], [0, 1]], [0, 1])
+        Matrix([1, 2], [3, 4]).gauss()
+        mock_echelon.assert_called_with([[1, 2], [3, 4]], True, 1e-12)
+        Matrix([1, 2], [3, Fraction(1, 2)]).gauss()
+        mock_echelon.assert_called_with([[1, 2], [3, Fraction(1, 2)]], True, 1e-12)
+        Matrix([1, 2], [3, 4.5]).gauss()
+        mock_echelon.assert_called_with([[1, 2], [3, 4.5]], False, 1e-12)
+
+
+    @patch("points.matrices._row_echelon")
+    def test_exactness_can_be_forced(self, mock_echelon):
+        mock_echelon.return_value = ([[1, 2], [0, 1]], [0, 1])
+        Matrix([1, 2], [3, 4]).gauss(exact=False, tolerance=0.1)
+        mock_echelon.assert_called_with([[1, 2], [3, 4]], False, 0.1)
+        Matrix([1, 2], [3, 4.5]).gauss(exact=True)
+        mock_echelon.assert_called_with([[1, 2], [3, 4.5]], True, 1e-12)
+
+
+
+class MatrixRrefTests(TestCase):
+
+    def test_can_get_rref(self):
+        m = Matrix([1, 2, 3, 4], [2, 4, 7, 9], [3, 6, 10, 13])
+        reduced, pivots, rank = m.rref()
+        self.assertIsInstance(reduced, Matrix)
+        self.assertEqual(reduced._row_lists(), [
+         [1, 2, 0, 1], [0, 0, 1, 1], [0, 0, 0, 0]
+        ])
+        self.assertEqual(pivots, (0, 2))
+        self.assertEqual(rank, 2)
+        self.assertTrue(reduced.is_reduced_row_echelon())
+        self.assertEqual(m._row_lists(), [[1, 2, 3, 4], [2, 4, 7, 9], [3, 6, 10, 13]])
+
+
+    def test_rref_values_are_floats(self):
+        reduced, _, _ = Matrix([2, 1], [1, 3]).rref()
+        for val in reduced._flat():
+            self.assertIsInstance(val, float)
+
+
+    @patch("points.matrices._reduced_row_echelon")
+    def test_exactness_decided_by_values(self, mock_rref):
+        mock_rref.return_value = ([[1, 0], [0, 1]], [0, 1])
+        Matrix([1, 2], [3, 4]).rref()
+        mock_rref.assert_called_with([[1, 2], [3, 4]], True, 1e-12)
+        Matrix([1, 2], [3, 4.5]).rref()
+        mock_rref.assert_called_with([[1, 2], [3, 4.5]], False, 1e-12)
+        Matrix([1, 2], [3, 4]).rref(exact=False, tolerance=0.1)
+        mock_rref.assert_called_with([[1, 2], [3, 4]], False, 0.1)
+
+
+    @patch("points.matrices._reduced_row_echelon")
+    def test_rref_cached_until_mutation(self, mock_rref):
+        mock_rref.return_value = ([[1, 0], [0, 1]], [0, 1])
+        m = Matrix([1, 2], [3, 4])
+        m.rref()
+        reduced, pivots, rank = m.rref()
+        self.assertEqual(mock_rref.call_count, 1)
+        self.assertEqual(reduced._row_lists(), [[1, 0], [0, 1]])
+        self.assertEqual(m.pivot_columns(), (0, 1))
+        m.gauss()
+        m.rref()
+        self.assertEqual(mock_rref.call_count, 2)
+
+
+    def test_rref_matrix_can_be_changed(self):
+        m = Matrix([1, 2], [3, 4])
+        m.rref()[0].gauss()
+        self.assertEqual(m.rref()[0]._row_lists(), [[1, 0], [0, 1]])
+
+
+
+class ReducedRowEchelonFunctionTests(TestCase):
+
+    def test_exact_reduction(self):
+        rows, pivots = _reduced_row_echelon([[2, 4, 1], [1, 2, 1]], True, 0)
+        self.assertEqual(rows, [[1, 2, 0], [0, 0, 1]])
+        self.assertEqual(pivots, [0, 2])
+        for val in rows[0] + rows[1]:
+            self.assertIsInstance(val, Fraction)
+
+
+    def test_float_reduction(self):
+        rows, pivots = _reduced_row_echelon(
+         [[0.0, 2.0, 4.0], [0.0, 1.0, 2.0000000000001]], False, 1e-12
+        )
+        self.assertEqual(rows, [[0, 1, 2], [0, 0, 0]])
+        self.assertEqual(pivots, [1])
+
+
+    def test_rows_not_modified(self):
+        rows = [[1, 2], [3, 4]]
+        _reduced_row_echelon(rows, True, 0)
+        self.assertEqual(rows, [[1, 2], [3, 4]])
+
+
 
 class MatrixRowEchelonFormCheckTests(TestCase):
 
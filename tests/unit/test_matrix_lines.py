@@ -0,0 +1,125 @@
+from unittest import TestCase
+from points.matrices import MatrixLine
+
+class MatrixLineTest(TestCase):
+
+    def setUp(self):
+        self.values = [1, 2, 3, 4, 5, 6]
+
+
+
+class MatrixLineCreationTests(MatrixLineTest):
+
+    def test_can_make_matrix_line(self):
+        line = MatrixLine(self.values, 1, 2, 3)
+        self.assertIs(line._values, self.values)
+        self.assertEqual(line._offset, 1)
+        self.assertEqual(line._stride, 2)
+        self.assertEqual(line._length, 3)
+
+
+
+class MatrixLineReprTests(MatrixLineTest):
+
+    def test_matrix_line_repr(self):
+        line = MatrixLine(self.values, 1, 2, 3)
+        self.assertEqual(repr(line), "(2, 4, 6)")
+
+
+
+class MatrixLineLenTests(MatrixLineTest):
+
+    def test_matrix_line_len(self):
+        self.assertEqual(len(MatrixLine(self.values, 1, 2, 3)), 3)
+        self.assertEqual(len(MatrixLine(self.values, 0, 1, 0)), 0)
+
+
+
+class MatrixLineIndexingTests(MatrixLineTest):
+
+    def test_can_get_values(self):
+        line = MatrixLine(self.values, 0, 3, 2)
+        self.assertEqual(line[0], 1)
+        self.assertEqual(line[1], 4)
+        self.assertEqual(line[-1], 4)
+
+
+    def test_index_must_be_in_range(self):
+        line = MatrixLine(self.values, 0, 3, 2)
+        with self.assertRaises(IndexError):
+            line[2]
+        with self.assertRaises(IndexError):
+            line[-3]
+
+
+    def test_can_slice_line(self):
+        line = MatrixLine(self.values, 0, 1, 6)
+        self.assertEqual(line[1:3], (2, 3))
+        self.assertEqual(line[:-1], (1, 2, 3, 4, 5))
+
+
+
+class MatrixLineIterationTests(MatrixLineTest):
+
+    def test_matrix_line_is_iterable(self):
+        self.assertEqual(list(MatrixLine(self.values, 2, 1, 3)), [3, 4, 5])
+        self.assertEqual(list(MatrixLine(self.values, 0, 1, 0)), [])
+
+
+
+class MatrixLineEqualityTests(MatrixLineTest):
+
+    def test_matrix_lines_equal_sequences(self):
+        line = MatrixLine(self.values, 1, 2, 3)
+        self.assertEqual(line, (2, 4, 6))
+        self.assertEqual((2, 4, 6), line)
+        self.assertEqual(line, MatrixLine([2, 4, 6], 0, 1, 3))
+        self.assertNotEqual(line, (2, 4))
+        self.assertNotEqual(line, "246")
+
+
+    def test_matrix_lines_do_not_equal_lists(self):
+        line = MatrixLine(self.values, 1, 2, 3)
+        self.assertFalse(line == [2, 4, 6])
+        self.assertFalse([2, 4, 6] == line)
+        self.assertNotEqual(line, [2, 4, 6])
+
+
+    def test_matrix_lines_hash_like_tuples(self):
+        line = MatrixLine(self.values, 1, 2, 3)
+        self.assertEqual(hash(line), hash((2, 4, 6)))
+
+
+
+class MatrixLineOrderingTests(MatrixLineTest):
+
+    def test_matrix_lines_order_like_tuples(self):
+        line = MatrixLine(self.values, 1, 2, 3)
+        self.assertLess(line, (2, 4, 7))
+        self.assertLessEqual(line, (2, 4, 6))
+        self.assertGreater(line, (2, 4))
+        self.assertGreaterEqual(line, (2, 4, 6))
+        self.assertGreater((3,), line)
+        self.assertLess(MatrixLine(self.values, 0, 2, 3), line)
+
+
+    def test_matrix_lines_can_be_sorted(self):
+        lines = [MatrixLine(self.values, n, 2, 2) for n in (2, 0, 1)]
+        self.assertEqual(sorted(lines), [(1, 3), (2, 4), (3, 5)])
+        self.assertEqual(max(lines), (3, 5))
+
+
+    def test_matrix_lines_cannot_be_ordered_against_lists(self):
+        with self.assertRaises(TypeError):
+            MatrixLine(self.values, 1, 2, 3) < [3]
+
+
+
+class MatrixLineSequenceTests(MatrixLineTest):
+
+    def test_matrix_line_sequence_methods(self):
+        line = MatrixLine(self.values, 1, 2, 3)
+        self.assertIn(4, line)
+        self.assertNotIn(3, line)
+        self.assertEqual(line.index(6), 2)
+        self.assertEqual(line.count(2), 1)
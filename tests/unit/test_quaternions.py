@@ -0,0 +1,296 @@
+import math
+from math import cos, sin, sqrt
+from unittest import TestCase
+from unittest.mock import Mock, patch, MagicMock
+from points.quaternions import Quaternion
+from points.matrices import Matrix
+from points.vectors import Vector, VectorArray
+from points.geometry import Transform
+
+class QuaternionTest(TestCase):
+
+    def assertValuesAlmostEqual(self, values1, values2):
+        values1, values2 = list(values1), list(values2)
+        self.assertEqual(len(values1), len(values2))
+        for val1, val2 in zip(values1, values2):
+            self.assertAlmostEqual(val1, val2, delta=0.000001)
+
+
+
+class QuaternionCreationTests(QuaternionTest):
+
+    def test_can_make_quaternion(self):
+        quaternion = Quaternion(1, 2, 3, 4)
+        self.assertEqual(quaternion._values, (1, 2, 3, 4))
+
+
+    def test_default_quaternion_is_identity(self):
+        self.assertEqual(Quaternion()._values, (1, 0, 0, 0))
+
+
+    def test_quaternion_has_no_dict(self):
+        with self.assertRaises(AttributeError):
+            Quaternion().__dict__
+
+
+
+class QuaternionReprTests(QuaternionTest):
+
+    def test_quaternion_repr(self):
+        self.assertEqual(repr(Quaternion(1, 2, 3, 4)), "<Quaternion [1, 2, 3, 4]>")
+
+
+
+class QuaternionEqualityTests(QuaternionTest):
+
+    def test_equal_quaternions(self):
+        self.assertEqual(Quaternion(1, 2, 3, 4), Quaternion(1, 2, 3, 4))
+        self.assertNotEqual(Quaternion(1, 2, 3, 4), Quaternion(1, 2, 3, 5))
+        self.assertNotEqual(Quaternion(1, 2, 3, 4), (1, 2, 3, 4))
+
+
+    def test_equal_quaternions_hash_equally(self):
+        self.assertEqual(
+         hash(Quaternion(1, 2, 3, 4)), hash(Quaternion(1, 2, 3, 4))
+        )
+
+
+
+class QuaternionIterationTests(QuaternionTest):
+
+    def test_can_iterate(self):
+        self.assertEqual(list(Quaternion(1, 2, 3, 4)), [1, 2, 3, 4])
+
+
+
+class QuaternionMultiplicationTests(QuaternionTest):
+
+    def test_basis_products(self):
+        i, j, k = Quaternion(0, 1, 0, 0), Quaternion(0, 0, 1, 0), Quaternion(0, 0, 0, 1)
+        self.assertEqual(i * j, k)
+        self.assertEqual(j * k, i)
+        self.assertEqual(k * i, j)
+        self.assertEqual(j * i, Quaternion(0, 0, 0, -1))
+        self.assertEqual(i * i, Quaternion(-1, 0, 0, 0))
+
+
+    def test_can_multiply_quaternions(self):
+        self.assertEqual(
+         Quaternion(1, 2, 3, 4) * Quaternion(5, 6, 7, 8),
+         Quaternion(-60, 12, 30, 24)
+        )
+
+
+    def test_can_multiply_by_scalar(self):
+        self.assertEqual(Quaternion(1, 2, 3, 4) * 2, Quaternion(2, 4, 6, 8))
+        self.assertEqual(2 * Quaternion(1, 2, 3, 4), Quaternion(2, 4, 6, 8))
+
+
+    def test_can_only_multiply_by_numbers(self):
+        for other in ("2", [1, 2], Vector(1, 2, 3), None):
+            with self.assertRaises(TypeError):
+                Quaternion(1, 2, 3, 4) * other
+        for other in ("2", [1, 2], None):
+            with self.assertRaises(TypeError):
+                other * Quaternion(1, 2, 3, 4)
+
+
+
+class AxisAngleCreationTests(QuaternionTest):
+
+    def test_can_make_from_axis_angle(self):
+        quaternion = Quaternion.from_axis_angle([0, 0, 2], 0.5)
+        self.assertValuesAlmostEqual(
+         quaternion._values, [cos(0.25), 0, 0, sin(0.25)]
+        )
+
+
+    def test_can_make_from_axis_angle_in_degrees(self):
+        quaternion = Quaternion.from_axis_angle(Vector(1, 0, 0), 180, degrees=True)
+        self.assertValuesAlmostEqual(quaternion._values, [0, 1, 0, 0])
+
+
+    def test_axis_must_be_valid(self):
+        with self.assertRaises(ValueError):
+            Quaternion.from_axis_angle([0, 0, 0], 0.5)
+        with self.assertRaises(ValueError):
+            Quaternion.from_axis_angle([0, 1], 0.5)
+        with self.assertRaises(ValueError):
+            Quaternion.from_axis_angle(1, 0.5)
+
+
+
+class MatrixCreationTests(QuaternionTest):
+
+    def test_can_make_from_matrix(self):
+        for axis in ([1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 2, 3], [-1, 0.5, 2]):
+            for angle in (0.1, 1.5, 3.1, 4, 6):
+                quaternion = Quaternion.from_axis_angle(axis, angle)
+                result = Quaternion.from_matrix(quaternion.matrix())
+                if result._values[0] * quaternion._values[0] < 0:
+                    result = result * -1
+                self.assertValuesAlmostEqual(result._values, quaternion._values)
+
+
+    def test_can_make_from_homogeneous_matrix(self):
+        transform = Transform().rotate(0.5, 2).translate(1, 2, 3)
+        self.assertValuesAlmostEqual(
+         Quaternion.from_matrix(transform.matrix())._values,
+         [cos(0.25), 0, 0, sin(0.25)]
+        )
+
+
+    def test_matrix_needed(self):
+        with self.assertRaises(TypeError):
+            Quaternion.from_matrix([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+
+
+    def test_matrix_must_be_right_size(self):
+        with self.assertRaises(ValueError):
+            Quaternion.from_matrix(Matrix.identity(2))
+
+
+
+class QuaternionValuesTests(QuaternionTest):
+
+    def test_can_get_values(self):
+        self.assertEqual(Quaternion(1, 2, 3, 4).values(), (1, 2, 3, 4))
+
+
+
+class QuaternionMagnitudeTests(QuaternionTest):
+
+    def test_can_get_magnitude(self):
+        self.assertEqual(Quaternion(1, 1, 1, 1).magnitude(), 2)
+
+
+
+class QuaternionNormalizationTests(QuaternionTest):
+
+    def test_can_normalize(self):
+        self.assertEqual(
+         Quaternion(1, 1, 1, 1).normalized(), Quaternion(0.5, 0.5, 0.5, 0.5)
+        )
+
+
+    def test_cannot_normalize_zero(self):
+        with self.assertRaises(ValueError):
+            Quaternion(0, 0, 0, 0).normalized()
+
+
+
+class QuaternionConjugateTests(QuaternionTest):
+
+    def test_can_get_conjugate(self):
+        self.assertEqual(Quaternion(1, 2, 3, 4).conjugate(), Quaternion(1, -2, -3, -4))
+
+
+
+class AxisAngleTests(QuaternionTest):
+
+    def test_can_get_axis_angle(self):
+        axis, angle = Quaternion.from_axis_angle([0, 3, 4], 2).axis_angle()
+        self.assertValuesAlmostEqual(axis.values(), [0, 0.6, 0.8])
+        self.assertAlmostEqual(angle, 2, delta=0.000001)
+
+
+    def test_identity_axis_angle(self):
+        axis, angle = Quaternion().axis_angle()
+        self.assertEqual(axis.values(), (1, 0, 0))
+        self.assertEqual(angle, 0)
+
+
+
+class QuaternionMatrixTests(QuaternionTest):
+
+    def test_can_get_matrix(self):
+        matrix = Quaternion.from_axis_angle([0, 0, 1], 0.5).matrix()
+        self.assertIsInstance(matrix, Matrix)
+        self.assertValuesAlmostEqual(matrix._flat(), [
+         cos(0.5), -sin(0.5), 0, sin(0.5), cos(0.5), 0, 0, 0, 1
+        ])
+
+
+    def test_non_unit_quaternions_give_rotations(self):
+        self.assertValuesAlmostEqual(
+         (Quaternion.from_axis_angle([1, 2, 3], 1) * 3).matrix()._flat(),
+         Quaternion.from_axis_angle([1, 2, 3], 1).matrix()._flat()
+        )
+
+
+    def test_zero_quaternion_has_no_matrix(self):
+        with self.assertRaises(ValueError):
+            Quaternion(0, 0, 0, 0).matrix()
+
+
+
+class QuaternionTransformTests(QuaternionTest):
+
+    def test_can_get_transform(self):
+        transform = Quaternion.from_axis_angle([1, 0, 0], 0.5).transform()
+        self.assertIsInstance(transform, Transform)
+        self.assertValuesAlmostEqual(
+         transform.matrix()._flat(), Transform().rotate(0.5, 0).matrix()._flat()
+        )
+
+
+
+class QuaternionApplicationTests(QuaternionTest):
+
+    @patch("points.quaternions.Quaternion.transform")
+    def test_application_uses_transform(self, mock_transform):
+        v1, v2 = Mock(), Mock()
+        Quaternion().apply(v1, v2)
+        mock_transform.return_value.apply.assert_called_with(v1, v2)
+
+
+    def test_can_apply_to_vectors(self):
+        vector = Vector(1, 0, 0)
+        vectors = VectorArray([0, 1, 0], [0, 0, 1])
+        Quaternion.from_axis_angle([1, 1, 1], 2 * math.pi / 3).apply(
+         vector, vectors
+        )
+        self.assertValuesAlmostEqual(vector.values(), [0, 1, 0])
+        self.assertValuesAlmostEqual(vectors._values, [0, 0, 1, 1, 0, 0])
+
+
+
+class SlerpTests(QuaternionTest):
+
+    def test_slerp_ends(self):
+        q1 = Quaternion.from_axis_angle([0, 0, 1], 0.2)
+        q2 = Quaternion.from_axis_angle([0, 1, 0], 1.2)
+        self.assertValuesAlmostEqual(q1.slerp(q2, 0)._values, q1._values)
+        self.assertValuesAlmostEqual(q1.slerp(q2, 1)._values, q2._values)
+
+
+    def test_slerp_has_constant_speed(self):
+        q1 = Quaternion.from_axis_angle([0, 0, 1], 0.2)
+        q2 = Quaternion.from_axis_angle([0, 0, 1], 1.2)
+        self.assertValuesAlmostEqual(
+         q1.slerp(q2, 0.3)._values,
+         Quaternion.from_axis_angle([0, 0, 1], 0.5)._values
+        )
+
+
+    def test_slerp_takes_shortest_path(self):
+        q1 = Quaternion.from_axis_angle([0, 0, 1], 0.2)
+        q2 = Quaternion.from_axis_angle([0, 0, 1], 1.2) * -1
+        self.assertValuesAlmostEqual(
+         q1.slerp(q2, 0.5)._values,
+         Quaternion.from_axis_angle([0, 0, 1], 0.7)._values
+        )
+
+
+    def test_slerp_of_close_quaternions(self):
+        q1 = Quaternion.from_axis_angle([0, 0, 1], 0.2)
+        q2 = Quaternion.from_axis_angle([0, 0, 1], 0.2001)
+        self.assertValuesAlmostEqual(
+         q1.slerp(q2, 0.5)._values,
+         Quaternion.from_axis_angle([0, 0, 1], 0.20005)._values
+        )
+
+
+    def test_slerp_needs_quaternion(self):
+        with self.assertRaises(TypeError):
+            Quaternion().slerp((1, 0, 0, 0), 0.5)
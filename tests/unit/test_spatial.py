@@ -0,0 +1,372 @@
+from math import sqrt
+from unittest import TestCase
+from unittest.mock import Mock, patch, MagicMock
+from points.spatial import *
+from points.spatial import _points, _spread, _squared_distance, _close
+from points.spatial import _cells, _cell, _distances
+from points.matrices import Matrix, CondensedMatrix
+from points.vectors import Vector, VectorArray
+
+class KDTreeTest(TestCase):
+
+    def setUp(self):
+        self.coordinates = [
+         (0, 0, 0), (10, 0, 0), (0, 10, 0), (0, 0, 10), (1, 1, 1), (5, 5, 5),
+         (9, 9, 9), (2, 0, 0), (0, 2, 0), (0, 0, 2), (-3, -3, -3), (7, 1, 2)
+        ]
+        self.vectors = [Vector(*c) for c in self.coordinates]
+
+
+
+class KDTreeCreationTests(KDTreeTest):
+
+    def test_can_make_kd_tree(self):
+        tree = KDTree(self.vectors)
+        self.assertEqual(sorted(tree._points), sorted(self.coordinates))
+        self.assertEqual(sorted(tree._indices), list(range(12)))
+        for position, index in enumerate(tree._indices):
+            self.assertEqual(tree._points[position], self.coordinates[index])
+        self.assertEqual(tree._dimension, 3)
+
+
+    @patch("points.spatial.KDTREE_LEAF_SIZE", 2)
+    def test_tree_is_split_at_medians(self):
+        tree = KDTree(self.vectors)
+        middle, axis = 6, tree._axes[6]
+        for point in tree._points[:middle]:
+            self.assertLessEqual(point[axis], tree._points[middle][axis])
+        for point in tree._points[middle + 1:]:
+            self.assertGreaterEqual(point[axis], tree._points[middle][axis])
+
+
+    def test_can_make_from_vector_array(self):
+        tree = KDTree(VectorArray(*self.vectors))
+        self.assertEqual(sorted(tree._points), sorted(self.coordinates))
+
+
+    def test_can_make_from_coordinates(self):
+        tree = KDTree(self.coordinates)
+        self.assertEqual(sorted(tree._points), sorted(self.coordinates))
+
+
+    def test_vectors_needed(self):
+        with self.assertRaises(ValueError):
+            KDTree([])
+
+
+    def test_vectors_must_be_same_dimension(self):
+        with self.assertRaises(ValueError):
+            KDTree([Vector(1, 2), Vector(1, 2, 3)])
+
+
+    def test_kd_tree_has_no_dict(self):
+        with self.assertRaises(AttributeError):
+            KDTree(self.vectors).__dict__
+
+
+
+class KDTreeReprTests(KDTreeTest):
+
+    def test_kd_tree_repr(self):
+        self.assertEqual(
+         repr(KDTree(self.vectors)), "<KDTree - 12 Vectors, 3 dimensions>"
+        )
+
+
+
+class KDTreeLengthTests(KDTreeTest):
+
+    def test_kd_tree_length(self):
+        self.assertEqual(len(KDTree(self.vectors)), 12)
+
+
+
+class KDTreeDimensionTests(KDTreeTest):
+
+    def test_kd_tree_dimension(self):
+        self.assertEqual(KDTree(self.vectors).dimension(), 3)
+
+
+
+class KDTreeNearestTests(KDTreeTest):
+
+    def test_can_find_nearest(self):
+        tree = KDTree(self.vectors)
+        self.assertEqual(tree.nearest(Vector(6, 6, 6)), [(5, sqrt(3))])
+        self.assertEqual(tree.nearest([0, 0, 0.1]), [(0, 0.1)])
+
+
+    @patch("points.spatial.KDTREE_LEAF_SIZE", 1)
+    def test_can_find_k_nearest(self):
+        tree = KDTree(self.vectors)
+        self.assertEqual(tree.nearest((0, 0, 0), k=5), [
+         (0, 0), (4, sqrt(3)), (7, 2), (8, 2), (9, 2)
+        ])
+
+
+    def test_k_can_be_more_than_vectors(self):
+        self.assertEqual(len(KDTree(self.vectors).nearest((0, 0, 0), k=20)), 12)
+
+
+    def test_k_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            KDTree(self.vectors).nearest((0, 0, 0), k=0)
+
+
+    def test_point_must_be_right_dimension(self):
+        with self.assertRaises(ValueError):
+            KDTree(self.vectors).nearest(Vector(1, 2))
+
+
+
+class KDTreeWithinTests(KDTreeTest):
+
+    @patch("points.spatial.KDTREE_LEAF_SIZE", 1)
+    def test_can_find_vectors_within_radius(self):
+        tree = KDTree(self.vectors)
+        self.assertEqual(tree.within(Vector(0, 0, 0), 2), [
+         (0, 0), (4, sqrt(3)), (7, 2), (8, 2), (9, 2)
+        ])
+        self.assertEqual(tree.within((9, 9, 9.5), 1), [(6, 0.5)])
+
+
+    def test_can_find_nothing(self):
+        self.assertEqual(KDTree(self.vectors).within((20, 20, 20), 5), [])
+        self.assertEqual(KDTree(self.vectors).within((0, 0, 0), -1), [])
+
+
+    def test_point_must_be_right_dimension(self):
+        with self.assertRaises(ValueError):
+            KDTree(self.vectors).within([1, 2], 3)
+
+
+
+class PairFindingTests(TestCase):
+
+    def setUp(self):
+        self.vectors = [
+         Vector(0, 0, 0), Vector(1, 0, 0), Vector(5, 5, 5), Vector(0, 0, 1.5),
+         Vector(5, 5, 6), Vector(-0.5, 0, 0), Vector(20, 0, 0)
+        ]
+
+
+    def test_can_find_pairs(self):
+        self.assertEqual(find_pairs_within(self.vectors, 1.5), [
+         (0, 1, 1), (0, 3, 1.5), (0, 5, 0.5), (1, 5, 1.5), (2, 4, 1)
+        ])
+
+
+    def test_can_find_pairs_in_vector_array(self):
+        self.assertEqual(
+         find_pairs_within(VectorArray(*self.vectors), 1.5),
+         find_pairs_within(self.vectors, 1.5)
+        )
+
+
+    def test_can_find_pairs_in_other_dimensions(self):
+        self.assertEqual(find_pairs_within([(0, 0), (0, 1), (3, 0)], 2), [
+         (0, 1, 1)
+        ])
+        self.assertEqual(find_pairs_within([(0,), (-1.5,), (1,)], 1.5), [
+         (0, 1, 1.5), (0, 2, 1)
+        ])
+
+
+    def test_can_find_no_pairs(self):
+        self.assertEqual(find_pairs_within(self.vectors, 0.1), [])
+        self.assertEqual(find_pairs_within([], 1), [])
+
+
+    def test_cutoff_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            find_pairs_within(self.vectors, 0)
+
+
+    def test_vectors_must_be_same_dimension(self):
+        with self.assertRaises(ValueError):
+            find_pairs_within([Vector(1, 2), Vector(1, 2, 3)], 1)
+
+
+
+class ContactFindingTests(TestCase):
+
+    def setUp(self):
+        self.vectors1 = [Vector(0, 0, 0), Vector(5, 5, 5), Vector(-3, 0, 0)]
+        self.vectors2 = [
+         Vector(1, 0, 0), Vector(5, 5, 6.5), Vector(0, 0, -1), Vector(9, 9, 9)
+        ]
+
+
+    def test_can_find_contacts(self):
+        self.assertEqual(find_contacts(self.vectors1, self.vectors2, 1.5), [
+         (0, 0, 1), (0, 2, 1), (1, 1, 1.5)
+        ])
+
+
+    def test_contacts_are_one_way(self):
+        self.assertEqual(find_contacts(self.vectors2, self.vectors1, 1.5), [
+         (0, 0, 1), (1, 1, 1.5), (2, 0, 1)
+        ])
+
+
+    def test_can_find_contacts_between_vector_arrays(self):
+        self.assertEqual(find_contacts(
+         VectorArray(*self.vectors1), VectorArray(*self.vectors2), 1.5
+        ), find_contacts(self.vectors1, self.vectors2, 1.5))
+
+
+    def test_can_find_no_contacts(self):
+        self.assertEqual(find_contacts(self.vectors1, self.vectors2, 0.5), [])
+        self.assertEqual(find_contacts([], self.vectors2, 0.5), [])
+
+
+    def test_cutoff_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            find_contacts(self.vectors1, self.vectors2, -1)
+
+
+    def test_sets_must_be_same_dimension(self):
+        with self.assertRaises(ValueError):
+            find_contacts([Vector(1, 2)], [Vector(1, 2, 3)], 1)
+
+
+
+class DistanceMatrixTests(TestCase):
+
+    def setUp(self):
+        self.vectors = [Vector(0, 0, 0), Vector(3, 4, 0), Vector(0, 0, 2)]
+
+
+    def test_can_get_distance_matrix(self):
+        matrix = distance_matrix(self.vectors)
+        self.assertIsInstance(matrix, CondensedMatrix)
+        self.assertEqual(matrix.size(), (3, 3))
+        self.assertEqual(matrix.values(), (5, 2, sqrt(29)))
+        self.assertEqual(matrix[2, 1], sqrt(29))
+
+
+    def test_can_get_distance_matrix_of_vector_array(self):
+        self.assertEqual(
+         distance_matrix(VectorArray(*self.vectors)).values(),
+         distance_matrix(self.vectors).values()
+        )
+
+
+    def test_can_get_distance_matrix_in_other_dimensions(self):
+        self.assertEqual(
+         distance_matrix([(0, 0), (3, 4), (0, 1)]).values(), (5, 1, sqrt(18))
+        )
+
+
+    def test_can_get_small_distance_matrices(self):
+        self.assertEqual(distance_matrix([Vector(1, 2)]).size(), (1, 1))
+        self.assertEqual(distance_matrix([]).size(), (0, 0))
+
+
+    def test_vectors_must_be_same_dimension(self):
+        with self.assertRaises(ValueError):
+            distance_matrix([Vector(1, 2), Vector(1, 2, 3)])
+
+
+
+class CdistTests(TestCase):
+
+    def test_can_get_distances_between_sets(self):
+        matrix = cdist(
+         [Vector(0, 0, 0), Vector(3, 4, 0)],
+         VectorArray([0, 0, 2], [3, 4, 0], [0, 0, 0])
+        )
+        self.assertIsInstance(matrix, Matrix)
+        self.assertEqual(matrix.rows(), ((2, 5, 0), (sqrt(29), 0, 5)))
+
+
+    def test_can_get_distances_in_other_dimensions(self):
+        self.assertEqual(cdist([(0, 0)], [(3, 4), (0, 1)]).rows(), ((5, 1),))
+
+
+    def test_sets_must_not_be_empty(self):
+        with self.assertRaises(ValueError):
+            cdist([], [Vector(1, 2, 3)])
+
+
+    def test_sets_must_be_same_dimension(self):
+        with self.assertRaises(ValueError):
+            cdist([Vector(1, 2)], [Vector(1, 2, 3)])
+
+
+
+class DistancesTests(TestCase):
+
+    def test_can_get_3d_distances(self):
+        self.assertEqual(_distances((0, 0, 0), [(3, 4, 0), (0, 0, 2)]), [5, 2])
+
+
+    def test_can_get_distances_in_other_dimensions(self):
+        self.assertEqual(_distances((0, 0), [(3, 4), (0, 2)]), [5, 2])
+
+
+
+class CloseTests(TestCase):
+
+    def test_can_find_close_3d_points(self):
+        points = [(0, 0, 0), (1, 0, 0), (0, 3, 0), (0, 0, 2)]
+        self.assertEqual(list(_close((0, 0, 1), [0, 1, 2, 3], points, 2)), [
+         (0, 1), (1, 2), (3, 1)
+        ])
+
+
+    def test_can_find_close_points_in_other_dimensions(self):
+        points = [(0, 0), (1, 0), (0, 3)]
+        self.assertEqual(list(_close((0, 1), [1, 2], points, 4)), [
+         (1, 2), (2, 4)
+        ])
+
+
+
+class CellTests(TestCase):
+
+    def test_can_get_cell(self):
+        self.assertEqual(_cell((0.5, 1.5, -0.5), 1), (0, 1, -1))
+        self.assertEqual(_cell((4, 5.9), 2), (2, 2))
+
+
+    def test_can_sort_points_into_cells(self):
+        self.assertEqual(_cells([(0.5, 0.5), (1.5, 0), (0.1, 0.9)], 1), {
+         (0, 0): [0, 2], (1, 0): [1]
+        })
+
+
+
+class PointsTests(TestCase):
+
+    def test_can_get_points_from_vectors(self):
+        self.assertEqual(_points([Vector(1, 2), Vector(3, 4)]), [(1, 2), (3, 4)])
+
+
+    def test_can_get_points_from_vector_array(self):
+        self.assertEqual(
+         _points(VectorArray([1, 2], [3, 4])), [(1.0, 2.0), (3.0, 4.0)]
+        )
+
+
+    def test_can_get_points_from_coordinates(self):
+        self.assertEqual(_points([[1, 2], (3, 4)]), [(1, 2), (3, 4)])
+
+
+    def test_points_must_be_same_dimension(self):
+        with self.assertRaises(ValueError):
+            _points([[1, 2], (3, 4, 5)])
+
+
+
+class SpreadTests(TestCase):
+
+    def test_can_get_spread(self):
+        self.assertEqual(_spread([3, -1, 4, 1]), 5)
+
+
+
+class SquaredDistanceTests(TestCase):
+
+    def test_can_get_squared_distance(self):
+        self.assertEqual(_squared_distance((1, 2, 3), (2, 4, 6)), 14)
@@ -0,0 +1,280 @@
+import copy
+import pickle
+from array import array
+from unittest import TestCase
+from unittest.mock import Mock, patch, MagicMock
+from points.vectors import Vector, VectorArray
+
+class VectorArrayTest(TestCase):
+
+    def setUp(self):
+        self.v1, self.v2 = Vector(1, 2, 3), Vector(4, 5, 6)
+
+
+
+class VectorArrayCreationTests(VectorArrayTest):
+
+    def test_can_make_vector_array(self):
+        vectors = VectorArray(self.v1, self.v2)
+        self.assertEqual(vectors._values, array("d", [1, 2, 3, 4, 5, 6]))
+        self.assertEqual(vectors._dimension, 3)
+
+
+    def test_can_make_vector_array_from_sequences(self):
+        vectors = VectorArray([1, 2], (3, 4))
+        self.assertEqual(vectors._values, array("d", [1, 2, 3, 4]))
+        self.assertEqual(vectors._dimension, 2)
+
+
+    def test_can_make_empty_vector_array(self):
+        vectors = VectorArray(dimension=3)
+        self.assertEqual(vectors._values, array("d"))
+        self.assertEqual(vectors._dimension, 3)
+
+
+    def test_empty_vector_array_needs_dimension(self):
+        with self.assertRaises(ValueError):
+            VectorArray()
+
+
+    def test_vectors_must_be_same_dimension(self):
+        with self.assertRaises(ValueError):
+            VectorArray(self.v1, self.v2, Vector(1, 2))
+        with self.assertRaises(ValueError):
+            VectorArray(self.v1, dimension=2)
+
+
+
+class VectorArrayReprTests(VectorArrayTest):
+
+    def test_vector_array_repr(self):
+        vectors = VectorArray(self.v1, self.v2)
+        self.assertEqual(
+         repr(vectors), "<VectorArray - 2 Vectors, 3 dimensions>"
+        )
+
+
+
+class VectorArrayLenTests(VectorArrayTest):
+
+    def test_vector_array_len(self):
+        self.assertEqual(len(VectorArray(self.v1, self.v2)), 2)
+        self.assertEqual(len(VectorArray(dimension=2)), 0)
+
+
+
+class VectorArrayIndexingTests(VectorArrayTest):
+
+    def test_can_get_vector_views(self):
+        vectors = VectorArray(self.v1, self.v2)
+        self.assertIsInstance(vectors[0], Vector)
+        self.assertEqual(vectors[0].values(), (1, 2, 3))
+        self.assertEqual(vectors[1].values(), (4, 5, 6))
+        self.assertEqual(vectors[-1].values(), (4, 5, 6))
+
+
+    def test_vector_views_share_storage(self):
+        vectors = VectorArray(self.v1, self.v2)
+        vector = vectors[1]
+        vector[0] = 10
+        self.assertEqual(vectors._values, array("d", [1, 2, 3, 10, 5, 6]))
+
+
+    def test_index_must_be_in_range(self):
+        vectors = VectorArray(self.v1, self.v2)
+        with self.assertRaises(IndexError):
+            vectors[2]
+        with self.assertRaises(IndexError):
+            vectors[-3]
+
+
+    def test_can_set_vectors(self):
+        vectors = VectorArray(self.v1, self.v2)
+        vectors[0] = Vector(7, 8, 9)
+        self.assertEqual(vectors._values, array("d", [7, 8, 9, 4, 5, 6]))
+        with self.assertRaises(ValueError):
+            vectors[0] = Vector(7, 8)
+
+
+    def test_can_slice_vector_array(self):
+        vectors = VectorArray(self.v1, self.v2, Vector(7, 8, 9))
+        sliced = vectors[0:2]
+        self.assertIsInstance(sliced, VectorArray)
+        self.assertEqual(sliced._values, array("d", [1, 2, 3, 4, 5, 6]))
+        self.assertEqual(sliced._dimension, 3)
+        self.assertEqual(vectors[::-2].values(), ((7, 8, 9), (1, 2, 3)))
+        self.assertEqual(len(vectors[2:1]), 0)
+
+
+    def test_slices_are_copies(self):
+        vectors = VectorArray(self.v1, self.v2)
+        sliced = vectors[:1]
+        sliced[0] = Vector(7, 8, 9)
+        self.assertEqual(vectors._values, array("d", [1, 2, 3, 4, 5, 6]))
+
+
+    def test_cannot_assign_to_slices(self):
+        vectors = VectorArray(self.v1, self.v2)
+        with self.assertRaises(TypeError):
+            vectors[0:1] = VectorArray(self.v2)
+
+
+
+class VectorViewTests(VectorArrayTest):
+
+    def test_vector_views_cannot_change_length(self):
+        vector = VectorArray(self.v1, self.v2)[0]
+        with self.assertRaises(TypeError):
+            vector.append(4)
+        with self.assertRaises(TypeError):
+            vector.insert(0, 4)
+        with self.assertRaises(TypeError):
+            vector.remove(1)
+        with self.assertRaises(TypeError):
+            vector.pop()
+        self.assertEqual(vector.values(), (1, 2, 3))
+
+
+    def test_vector_views_can_be_pickled(self):
+        vector = VectorArray(self.v1, self.v2)[1]
+        unpickled = pickle.loads(pickle.dumps(vector))
+        self.assertEqual(unpickled._values, array("d", [4, 5, 6]))
+
+
+    def test_vector_view_copies_are_independent(self):
+        vectors = VectorArray(self.v1, self.v2)
+        for copied in (copy.copy(vectors[1]), copy.deepcopy(vectors[1])):
+            self.assertEqual(copied._values, array("d", [4, 5, 6]))
+            copied[0] = 10
+            copied.append(7)
+            self.assertEqual(vectors._values, array("d", [1, 2, 3, 4, 5, 6]))
+
+
+
+class VectorArrayIterationTests(VectorArrayTest):
+
+    def test_vector_array_is_iterable(self):
+        vectors = list(VectorArray(self.v1, self.v2))
+        self.assertEqual(len(vectors), 2)
+        self.assertEqual(vectors[0].values(), (1, 2, 3))
+        self.assertEqual(vectors[1].values(), (4, 5, 6))
+
+
+
+class VectorArrayArithmeticTests(VectorArrayTest):
+
+    def test_can_add_vector_arrays(self):
+        vectors = VectorArray(self.v1, self.v2)
+        new = vectors + VectorArray([10, 20, 30], [40, 50, 60])
+        self.assertEqual(new._values, array("d", [11, 22, 33, 44, 55, 66]))
+        self.assertEqual(new._dimension, 3)
+
+
+    def test_can_add_vector_to_vector_array(self):
+        vectors = VectorArray(self.v1, self.v2)
+        new = vectors + Vector(10, 20, 30)
+        self.assertEqual(new._values, array("d", [11, 22, 33, 14, 25, 36]))
+
+
+    def test_can_subtract_vector_arrays(self):
+        vectors = VectorArray(self.v1, self.v2)
+        new = vectors - VectorArray([1, 1, 1], [2, 2, 2])
+        self.assertEqual(new._values, array("d", [0, 1, 2, 2, 3, 4]))
+        new = vectors - Vector(1, 2, 3)
+        self.assertEqual(new._values, array("d", [0, 0, 0, 3, 3, 3]))
+
+
+    def test_arithmetic_needs_vectors(self):
+        vectors = VectorArray(self.v1, self.v2)
+        with self.assertRaises(TypeError):
+            vectors + [1, 2, 3]
+        with self.assertRaises(TypeError):
+            vectors - 4
+
+
+    def test_arithmetic_needs_same_shape(self):
+        vectors = VectorArray(self.v1, self.v2)
+        with self.assertRaises(ValueError):
+            vectors + VectorArray(self.v1)
+        with self.assertRaises(ValueError):
+            vectors - Vector(1, 2)
+
+
+    def test_can_multiply_by_scalar(self):
+        vectors = VectorArray(self.v1, self.v2)
+        new = vectors * 2
+        self.assertEqual(new._values, array("d", [2, 4, 6, 8, 10, 12]))
+        new = 2 * vectors
+        self.assertEqual(new._values, array("d", [2, 4, 6, 8, 10, 12]))
+        with self.assertRaises(TypeError):
+            vectors * self.v1
+
+
+
+class VectorArrayDimensionTests(VectorArrayTest):
+
+    def test_can_get_dimension(self):
+        self.assertEqual(VectorArray(self.v1, self.v2).dimension(), 3)
+
+
+
+class VectorArrayValuesTests(VectorArrayTest):
+
+    def test_can_get_values(self):
+        self.assertEqual(
+         VectorArray(self.v1, self.v2).values(), ((1, 2, 3), (4, 5, 6))
+        )
+
+
+
+class VectorArrayMagnitudesTests(VectorArrayTest):
+
+    def test_can_get_magnitudes(self):
+        vectors = VectorArray([3, 4], [6, 8], [0, 0])
+        self.assertEqual(vectors.magnitudes(), [5, 10, 0])
+
+
+
+class VectorArrayDotProductTests(VectorArrayTest):
+
+    def test_can_get_dot_products_with_vector(self):
+        vectors = VectorArray(self.v1, self.v2)
+        self.assertEqual(vectors.dot(Vector(1, 0, 2)), [7, 16])
+
+
+    def test_can_get_dot_products_with_vector_array(self):
+        vectors = VectorArray(self.v1, self.v2)
+        self.assertEqual(vectors.dot(vectors), [14, 77])
+
+
+    def test_dot_product_needs_vectors(self):
+        with self.assertRaises(TypeError):
+            VectorArray(self.v1, self.v2).dot([1, 2, 3])
+
+
+    def test_dot_product_needs_same_shape(self):
+        vectors = VectorArray(self.v1, self.v2)
+        with self.assertRaises(ValueError):
+            vectors.dot(Vector(1, 2))
+        with self.assertRaises(ValueError):
+            vectors.dot(VectorArray(self.v1))
+
+
+
+class VectorArrayDistancesTests(VectorArrayTest):
+
+    def test_can_get_distances(self):
+        vectors = VectorArray([3, 4], [1, 1], [4, 5])
+        self.assertEqual(vectors.distances_to(Vector(1, 1)), [
+         13 ** 0.5, 0, 5
+        ])
+
+
+    def test_distances_need_vector(self):
+        with self.assertRaises(TypeError):
+            VectorArray(self.v1, self.v2).distances_to([1, 2, 3])
+
+
+    def test_distances_need_same_dimension(self):
+        with self.assertRaises(ValueError):
+            VectorArray(self.v1, self.v2).distances_to(Vector(1, 2))
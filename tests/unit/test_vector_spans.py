@@ -1,16 +1,18 @@
 from unittest import TestCase
 from unittest.mock import Mock, patch, MagicMock
-from points.vectors import Vector, VectorSpan
+from fractions import Fraction
+from points.vectors import Vector, VectorSpan, VectorArray
 
 class VectorSpanTest(TestCase):
 
     def setUp(self):
         self.v1, self.v2, self.v3, self.v4 = [Mock(Vector) for _ in range(4)]
-        for v in self.v1, self.v2, self.v3, self.v4:
+        for v, values in zip((self.v1, self.v2, self.v3, self.v4), (
+         (2, 5, -9), (1, 0, 3), (0, 4, 1), (3, 9, -5)
+        )):
             v.__len__, v.__len__.return_value = MagicMock(), 3
-            v.values.return_value = (2, 5, -9)
-            v.__iter__, v.__iter__.return_value = MagicMock(), iter([2, 5, -9])
-            v.linearly_independent_of.return_value = True
+            v.values.return_value = values
+            v.__iter__, v.__iter__.return_value = MagicMock(), iter(values)
 
 
 class VectorSpanCreationTests(VectorSpanTest):
@@ -22,17 +24,12 @@ class VectorSpanCreationTests(VectorSpanTest):
 
 
     def test_can_make_vector_spans_from_multiple_vectors(self):
-        span = VectorSpan(self.v1, self.v2, self.v3, self.v4)
-        self.assertEqual(span._vectors, {self.v1, self.v2, self.v3, self.v4})
+        span = VectorSpan(self.v1, self.v2, self.v3)
+        self.assertEqual(span._vectors, {self.v1, self.v2, self.v3})
         self.assertEqual(span._dimension, 3)
-        self.v2.linearly_independent_of.assert_called_with(self.v1)
-        self.assertEqual(
-         set(self.v3.linearly_independent_of.call_args[0]), {self.v1, self.v2}
-        )
-        self.assertEqual(
-         set(self.v4.linearly_independent_of.call_args[0]),
-         {self.v1, self.v2, self.v3}
-        )
+        self.assertEqual(len(span._basis), 3)
+        for v in self.v1, self.v2, self.v3:
+            self.assertFalse(v.linearly_independent_of.called)
 
 
     def test_vectors_in_space_must_be_same_dimension(self):
@@ -42,18 +39,42 @@ class VectorSpanCreationTests(VectorSpanTest):
 
 
     def test_only_independent_vectors_kept(self):
-        self.v4.linearly_independent_of.return_value = False
         span = VectorSpan(self.v1, self.v2, self.v3, self.v4)
         self.assertEqual(span._vectors, {self.v1, self.v2, self.v3})
-        self.assertEqual(span._dimension, 3)
-        self.v2.linearly_independent_of.assert_called_with(self.v1)
-        self.assertEqual(
-         set(self.v3.linearly_independent_of.call_args[0]), {self.v1, self.v2}
-        )
-        self.assertEqual(
-         set(self.v4.linearly_independent_of.call_args[0]),
-         {self.v1, self.v2, self.v3}
-        )
+        self.assertEqual(len(span._basis), 3)
+        self.v2.values.return_value = (4, 10, -18)
+        span = VectorSpan(self.v1, self.v2, self.v3)
+        self.assertEqual(span._vectors, {self.v1, self.v3})
+        self.assertEqual(len(span._basis), 2)
+
+
+    def test_zero_vectors_add_nothing_to_basis(self):
+        self.v1.values.return_value = (0, 0, 0)
+        span = VectorSpan(self.v1, self.v2)
+        self.assertEqual(span._vectors, {self.v1, self.v2})
+        self.assertEqual(len(span._basis), 1)
+
+
+    def test_exact_basis_in_reduced_echelon_form(self):
+        span = VectorSpan(self.v1, self.v2)
+        self.assertTrue(span._exact)
+        (pivot1, row1), (pivot2, row2) = span._basis
+        self.assertEqual((pivot1, pivot2), (2, 0))
+        self.assertEqual(row1, [0, Fraction(-1, 3), 1])
+        self.assertEqual(row2, [1, 1, 0])
+        for val in row1 + row2:
+            self.assertIsInstance(val, Fraction)
+
+
+    def test_float_basis_uses_tolerance(self):
+        self.v1.values.return_value = (0.1, 0.2, 0.3)
+        self.v2.values.return_value = (0.3, 0.6, 0.9000000000000001)
+        span = VectorSpan(self.v1, self.v2)
+        self.assertFalse(span._exact)
+        self.assertEqual(span._vectors, {self.v1})
+        self.v2.values.return_value = (0.3, 0.6, 0.9001)
+        span = VectorSpan(self.v1, self.v2)
+        self.assertEqual(span._vectors, {self.v1, self.v2})
 
 
 
@@ -83,15 +104,17 @@ class VectorSpanContainerTests(VectorSpanTest):
         span = VectorSpan(self.v1, self.v2, self.v3)
         self.v4.values.return_value = [0, 0, 0]
         self.assertIn(self.v4, span)
+        self.v1.values.return_value = (0, 0, 0)
+        self.assertIn(self.v4, VectorSpan(self.v1))
 
 
     def test_vector_in_1v_span(self):
         span = VectorSpan(self.v1)
+        self.v2.values.return_value = (2, 5, -9)
         self.assertIn(self.v2, span)
-        self.v1.__iter__.return_value = iter([2, 5, -9])
-        self.v2.__iter__.return_value = iter([1, 2.5, -4.5])
+        self.v2.values.return_value = (1, 2.5, -4.5)
         self.assertIn(self.v2, span)
-        self.v2.__iter__.return_value = iter([1, 2.5, -4.6])
+        self.v2.values.return_value = (1, 2.5, -4.6)
         self.assertNotIn(self.v2, span)
 
 
@@ -106,37 +129,162 @@ class VectorSpanContainerTests(VectorSpanTest):
         self.v2.values.return_value = (1, 0, -4.5)
         self.assertNotIn(self.v2, span)
         self.v1.values.return_value = (2, 0, -9)
+        self.assertIn(self.v2, VectorSpan(self.v1))
+
+
+    def test_vector_in_2v_span(self):
+        span = VectorSpan(self.v1, self.v2)
+        self.v3.values.return_value = (5, 5, 0)
+        self.assertIn(self.v3, span)
+        self.v3.values.return_value = (Fraction(1, 2), Fraction(5, 4), Fraction(-9, 4))
+        self.assertIn(self.v3, span)
+        self.v3.values.return_value = (5.1, 5.1, 0)
+        self.assertIn(self.v3, span)
+
+
+    def test_vector_not_in_2v_span(self):
+        span = VectorSpan(self.v1, self.v2)
+        self.assertNotIn(self.v3, span)
+        self.v3.values.return_value = (5, 5, 1)
+        self.assertNotIn(self.v3, span)
+        self.v3.values.return_value = (5.1, 5.1, 0.00001)
+        self.assertNotIn(self.v3, span)
+
+
+    def test_float_membership_uses_tolerance(self):
+        self.v1.values.return_value = (0.1, 0.2, 0.3)
+        span = VectorSpan(self.v1)
+        self.v2.values.return_value = (0.3, 0.6, 0.9000000000000001)
         self.assertIn(self.v2, span)
+        self.v2.values.return_value = (0.3, 0.6, 0.90001)
+        self.assertNotIn(self.v2, span)
 
 
-    @patch("points.matrices.Matrix")
-    def test_vector_in_2v_span(self, mock_matrix):
-        mock_augment = Mock()
-        mock_matrix.return_value = mock_augment
-        mock_augment.rows.return_value = ((4, 6, 8), (0, 2, 4), (0, 0, 0))
+    @patch("points.vectors.VectorSpan._factorization")
+    def test_factorization_reused(self, mock_factorization):
+        mock_factorization.return_value = ([2, 0], [(1, (Fraction(-1, 3), 1))])
         span = VectorSpan(self.v1, self.v2)
+        self.v3.values.return_value = (5, 5, 0)
         self.assertIn(self.v3, span)
+        self.v3.values.return_value = (5, 6, 0)
+        self.assertNotIn(self.v3, span)
+        self.assertEqual(mock_factorization.call_count, 2)
+
+
+
+class OrthonormalBasisTests(VectorSpanTest):
+
+    def test_can_get_orthonormal_basis(self):
+        span = VectorSpan(self.v1, self.v2)
+        basis = span.orthonormal_basis()
+        self.assertEqual(len(basis), 2)
+        for vector in basis:
+            self.assertIsInstance(vector, Vector)
+            self.assertAlmostEqual(vector.magnitude(), 1, delta=0.000001)
+            self.assertIn(vector, span)
+        self.assertAlmostEqual(basis[0].dot(basis[1]), 0, delta=0.000001)
+
+
+    def test_orthonormal_basis_of_zero_span(self):
+        self.v1.values.return_value = (0, 0, 0)
+        self.assertEqual(VectorSpan(self.v1).orthonormal_basis(), ())
+
+
+    @patch("points.matrices._householder_qr")
+    def test_orthonormal_basis_cached(self, mock_qr):
+        mock_qr.return_value = ([[1, 0], [0, 1], [0, 0]], [[1, 0], [0, 1]])
+        span = VectorSpan(self.v1, self.v2)
+        self.assertEqual(span.orthonormal_basis()[1].values(), (0, 1, 0))
+        span.orthonormal_basis()
+        self.assertEqual(mock_qr.call_count, 1)
+        columns = mock_qr.call_args[0][0]
+        self.assertEqual(columns, list(zip(*[row for _, row in span._basis])))
+        self.assertEqual(mock_qr.call_args[1], {"reduced": True})
+
+
+
+class ProjectionTests(VectorSpanTest):
+
+    def test_can_project_onto_line(self):
+        self.v1.values.return_value = (1, 1, 0)
+        span = VectorSpan(self.v1)
+        self.v2.values.return_value = (3, 1, 7)
+        projection = span.project(self.v2)
+        self.assertIsInstance(projection, Vector)
+        for val1, val2 in zip(projection.values(), (2, 2, 0)):
+            self.assertAlmostEqual(val1, val2, delta=0.000001)
+
+
+    def test_can_project_onto_plane(self):
+        span = VectorSpan(self.v1, self.v2)
+        self.v3.values.return_value = (5, 5, 0)
+        for val1, val2 in zip(span.project(self.v3).values(), (5, 5, 0)):
+            self.assertAlmostEqual(val1, val2, delta=0.000001)
+        normal = (15, -15, -5)
+        self.v3.values.return_value = normal
+        for val in span.project(self.v3).values():
+            self.assertAlmostEqual(val, 0, delta=0.000001)
+
+
+    def test_projection_onto_zero_span(self):
+        self.v1.values.return_value = (0, 0, 0)
+        self.assertEqual(VectorSpan(self.v1).project(self.v2).values(), (0, 0, 0))
+
+
+    def test_projected_vector_must_be_right_dimension(self):
+        span = VectorSpan(self.v1)
+        self.v2.__len__.return_value = 2
+        with self.assertRaises(ValueError):
+            span.project(self.v2)
+
+
+
+class VectorSpanFactorizationTests(VectorSpanTest):
+
+    def test_factorization_has_pivots_and_other_columns(self):
+        span = VectorSpan(self.v1, self.v2)
         self.assertEqual(
-         set(mock_matrix.call_args[0]), {self.v1, self.v2, self.v3}
+         span._factorization(), ([2, 0], [(1, (Fraction(-1, 3), 1))])
         )
-        self.assertEqual(mock_matrix.call_args[0][-1], self.v3)
-        self.assertEqual(mock_matrix.call_args[1], {"columns": True})
-        mock_augment.gauss.assert_called_with()
 
 
-    @patch("points.matrices.Matrix")
-    def test_vector_not_in_2v_span(self, mock_matrix):
-        mock_augment = Mock()
-        mock_matrix.return_value = mock_augment
-        mock_augment.rows.return_value = ((4, 6, 8), (0, 2, 4), (0, 0, 9))
+    def test_factorization_cached(self):
         span = VectorSpan(self.v1, self.v2)
-        self.assertNotIn(self.v3, span)
+        self.assertIs(span._factorization(), span._factorization())
+
+
+    def test_factorization_of_full_span(self):
+        span = VectorSpan(self.v1, self.v2, self.v3)
+        self.assertEqual(span._factorization()[1], [])
+
+
+
+class ContainsManyTests(VectorSpanTest):
+
+    def test_can_check_many_vectors(self):
+        span = VectorSpan(self.v1, self.v2)
+        self.v4.values.return_value = (5, 5, 0)
         self.assertEqual(
-         set(mock_matrix.call_args[0]), {self.v1, self.v2, self.v3}
+         span.contains_many([self.v1, self.v2, self.v3, self.v4]),
+         [True, True, False, True]
         )
-        self.assertEqual(mock_matrix.call_args[0][-1], self.v3)
-        self.assertEqual(mock_matrix.call_args[1], {"columns": True})
-        mock_augment.gauss.assert_called_with()
+
+
+    def test_can_check_vector_array(self):
+        span = VectorSpan(self.v1, self.v2)
+        array = VectorArray([5, 5, 0], [0, 4, 1], [0, 0, 0])
+        self.assertEqual(span.contains_many(array), [True, False, True])
+
+
+    def test_vector_array_of_wrong_dimension(self):
+        span = VectorSpan(self.v1, self.v2)
+        array = VectorArray([5, 5], [0, 0])
+        self.assertEqual(span.contains_many(array), [False, False])
+
+
+    def test_no_vectors(self):
+        span = VectorSpan(self.v1)
+        self.assertEqual(span.contains_many([]), [])
 
 
 
@@ -153,5 +301,11 @@ class VectorSpanRankTests(VectorSpanTest):
     def test_can_get_span_rank(self):
         span = VectorSpan(self.v1)
         self.assertEqual(span.rank(), 1)
-        span._vectors = range(10)
+        span._basis = range(10)
         self.assertEqual(span.rank(), 10)
+
+
+    def test_zero_vectors_do_not_add_to_rank(self):
+        span = VectorSpan(Vector(0, 0, 0), Vector(1, 2, 3), Vector(2, 4, 6))
+        self.assertEqual(span.rank(), 1)
+        self.assertEqual(VectorSpan(Vector(0, 0)).rank(), 0)
@@ -1,4 +1,6 @@
 import math
+import pickle
+from array import array
 from unittest import TestCase
 from unittest.mock import Mock, patch, MagicMock
 from points.vectors import Vector
@@ -22,6 +24,19 @@ class VectorCreationTests(TestCase):
         self.assertEqual(vector._values, [2])
 
 
+    def test_can_make_compact_vector(self):
+        vector = Vector(2, 5, 1, compact=True)
+        self.assertEqual(vector._values, array("d", [2, 5, 1]))
+        vector = Vector([2, 5, 1], compact=True)
+        self.assertEqual(vector._values, array("d", [2, 5, 1]))
+
+
+    def test_vectors_have_no_dict(self):
+        vector = Vector(2, 5, 1)
+        with self.assertRaises(AttributeError):
+            vector.__dict__
+
+
 
 class VectorReprTests(TestCase):
 
@@ -30,6 +45,11 @@ class VectorReprTests(TestCase):
         self.assertEqual(repr(vector), "<Vector [2, 5, 1]>")
 
 
+    def test_compact_vector_repr(self):
+        vector = Vector(2, 5, 1, compact=True)
+        self.assertEqual(repr(vector), "<Vector [2.0, 5.0, 1.0]>")
+
+
 
 class VectorStrTests(TestCase):
 
@@ -138,6 +158,12 @@ class VectorAdditionTests(TestCase):
         self.assertEqual(new._values, [12, 25, 31])
 
 
+    def test_can_add_compact_vectors(self):
+        vector = Vector(2, 5, 1, compact=True)
+        new = vector + self.vector2
+        self.assertEqual(new._values, array("d", [12, 25, 31]))
+
+
 
 class VectorSubtractionTests(TestCase):
 
@@ -214,6 +240,14 @@ class VectorValuesTests(TestCase):
 
 
 
+class VectorCompactnessTests(TestCase):
+
+    def test_can_check_compactness(self):
+        self.assertFalse(Vector(2, 5, 1).is_compact())
+        self.assertTrue(Vector(2, 5, 1, compact=True).is_compact())
+
+
+
 class VectorMagnitudeTests(TestCase):
 
     def test_can_get_vector_magnitude(self):
@@ -222,6 +256,16 @@ class VectorMagnitudeTests(TestCase):
 
 
 
+class VectorPicklingTests(TestCase):
+
+    def test_can_pickle_vectors(self):
+        for vector in (Vector(2, 5, 1), Vector(2, 5, 1, compact=True)):
+            unpickled = pickle.loads(pickle.dumps(vector))
+            self.assertEqual(unpickled._values, vector._values)
+            self.assertIs(type(unpickled._values), type(vector._values))
+
+
+
 class VectorValueAppendingTests(TestCase):
 
     def test_can_add_value(self):